@@ -2,11 +2,11 @@ import cv2
 import os
 import argparse
 import src.config as config
-from src.video_processor import VideoProcessor
+from src.frame_source import FrameSource
 from src.vehicle_detector import VehicleDetector
 from src.paddle_reader import PaddleLicenseReader
 from src.yolo_plate_detector import YoloPlateDetector
-from src.core_logic import process_plate_detection, VehicleTracker
+from src.core_logic import process_plate_detections, VehicleTracker
 
 def get_vehicle_color(class_id):
     """Returns the BGR color tuple for a given vehicle class ID."""
@@ -25,7 +25,8 @@ def main():
     print(f"Using video source: {source}")
 
     try:
-        processor = VideoProcessor(source)
+        # Skipped frames are grabbed but never decoded
+        processor = FrameSource(source, skip_rate=config.FRAME_SKIP_RATE)
         detector = VehicleDetector() 
         reader = PaddleLicenseReader() 
         plate_detector = YoloPlateDetector() 
@@ -36,20 +37,14 @@ def main():
     print("Loading models... Press 'q' to exit.")
     
     tracker = VehicleTracker()
-    frame_count = 0
     
     while True:
-        ret, frame = processor.get_frame()
+        # Global Frame Skipping is handled by the frame source
+        ret, frame_count, frame = processor.read()
         if not ret:
             print("End of video or error reading frame.")
             break
         
-        frame_count += 1
-        
-        # Global Frame Skipping
-        if frame_count % config.FRAME_SKIP_RATE != 0:
-            continue
-        
         # Vehicle Detection
         detections = detector.detect_vehicles(frame.copy())
         
@@ -58,6 +53,7 @@ def main():
             annotated_frame = frame.copy()
         
         if detections:
+            tracked = []
             for (x1, y1, x2, y2, conf, class_id, track_id) in detections:
                 # 1. Visualization
                 if not args.headless:
@@ -70,19 +66,21 @@ def main():
                 # 2. Processing (if tracked)
                 if track_id != -1:
                     tracker.update(track_id, frame_count)
-                    
-                    # Plate Detection & OCR
-                    # Pass annotated_frame (which is None if headless) to allow drawing if needed (handled in core_logic)
-                    plate_text, plate_conf, plate_area = process_plate_detection(
-                        frame, (x1, y1, x2, y2), plate_detector, reader, annotated_frame
-                    )
-                    
-                    if plate_text:
-                        tracker.add_read(track_id, plate_text, plate_conf, plate_area)
-                        # Live Feedback
-                        if not args.headless:
-                            cv2.putText(annotated_frame, f"Read: {plate_text} ({plate_conf:.2f})", (x1, y2 + 20), 
-                                      cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+                    tracked.append((x1, y1, x2, y2, track_id))
+
+            # Plate Detection & OCR (plate detection batched across all tracked vehicles)
+            # Pass annotated_frame (which is None if headless) to allow drawing if needed (handled in core_logic)
+            plate_reads = process_plate_detections(
+                frame, [t[:4] for t in tracked], plate_detector, reader, annotated_frame
+            )
+
+            for (x1, y1, x2, y2, track_id), (plate_text, plate_conf, plate_area) in zip(tracked, plate_reads):
+                if plate_text:
+                    tracker.add_read(track_id, plate_text, plate_conf, plate_area)
+                    # Live Feedback
+                    if not args.headless:
+                        cv2.putText(annotated_frame, f"Read: {plate_text} ({plate_conf:.2f})", (x1, y2 + 20), 
+                                  cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
 
         # Check for vehicles leaving frame
         tracker.check_exiting_vehicles(frame_count)
@@ -50,22 +50,11 @@ def validate_and_clean_plate(text):
             return True, formatted
         return True, text # Return as-is if no validation enforced
 
-def process_plate_detection(frame, vehicle_box, plate_detector, reader, annotated_frame):
+def _crop_plate(car_crop, plate_box):
     """
-    Detects plate on the vehicle crop, pads it, and performs OCR.
-    Returns valid text or None.
+    Apply 10% padding to a plate box and crop it from the vehicle crop.
+    Returns (plate_crop, padded_box) where padded_box is (x, y, w, h) relative to the car crop.
     """
-    x1, y1, x2, y2 = vehicle_box
-    car_crop = frame[y1:y2, x1:x2]
-    
-    if car_crop.size == 0:
-        return None, 0.0, 0
-
-    # Detect Plate
-    plate_box = plate_detector.detect_plate(car_crop)
-    if not plate_box:
-        return None, 0.0, 0
-    
     px, py, pw, ph = plate_box
     
     # Apply 10% Padding
@@ -78,19 +67,14 @@ def process_plate_detection(frame, vehicle_box, plate_detector, reader, annotate
     pad_pw = min(car_crop.shape[1] - pad_px, pw + 2 * pad_w)
     pad_ph = min(car_crop.shape[0] - pad_py, ph + 2 * pad_h)
 
-    # Visualization (Magenta Box for Plate)
-    if annotated_frame is not None:
-        cv2.rectangle(annotated_frame, (x1+pad_px, y1+pad_py), (x1+pad_px+pad_pw, y1+pad_py+pad_ph), (255, 0, 255), 2)
-    
-    # Crop Plate
     plate_crop = car_crop[pad_py:pad_py+pad_ph, pad_px:pad_px+pad_pw]
-    
-    if plate_crop.size == 0:
-        return None, 0.0, 0
+    return plate_crop, (pad_px, pad_py, pad_pw, pad_ph)
 
-    # OCR
-    results = reader.read_text(plate_crop, det=False, enable_logic=config.ENABLE_OCR_LOGIC_LAYER)
-    
+def _validate_ocr_results(results, area):
+    """
+    Validate raw OCR results for a single plate crop.
+    Returns (text, conf, area) or (None, 0.0, 0).
+    """
     if not results:
         return None, 0.0, 0
         
@@ -106,11 +90,114 @@ def process_plate_detection(frame, vehicle_box, plate_detector, reader, annotate
     if valid_texts:
         final_text = " ".join(valid_texts)
         avg_conf = sum(valid_confs) / len(valid_confs)
-        area = pw * ph 
         return final_text, avg_conf, area
         
     return None, 0.0, 0
 
+def process_plate_detection(frame, vehicle_box, plate_detector, reader, annotated_frame):
+    """
+    Detects plate on the vehicle crop, pads it, and performs OCR.
+    Returns valid text or None.
+    """
+    x1, y1, x2, y2 = vehicle_box
+    car_crop = frame[y1:y2, x1:x2]
+    
+    if car_crop.size == 0:
+        return None, 0.0, 0
+
+    # Detect Plate
+    plate_box = plate_detector.detect_plate(car_crop)
+    if not plate_box:
+        return None, 0.0, 0
+    
+    plate_crop, (pad_px, pad_py, pad_pw, pad_ph) = _crop_plate(car_crop, plate_box)
+
+    # Visualization (Magenta Box for Plate)
+    if annotated_frame is not None:
+        cv2.rectangle(annotated_frame, (x1+pad_px, y1+pad_py), (x1+pad_px+pad_pw, y1+pad_py+pad_ph), (255, 0, 255), 2)
+    
+    if plate_crop.size == 0:
+        return None, 0.0, 0
+
+    # OCR
+    results = reader.read_text(plate_crop, det=False, enable_logic=config.ENABLE_OCR_LOGIC_LAYER)
+    
+    _, _, pw, ph = plate_box
+    return _validate_ocr_results(results, pw * ph)
+
+def detect_plate_crops(frame, vehicle_boxes, plate_detector, annotated_frame):
+    """
+    Runs plate detection once over all vehicle crops (a single YOLO forward pass)
+    and returns the padded plate crops.
+    Returns (indices, plate_crops, areas) where indices point into vehicle_boxes.
+    """
+    plate_indices = []
+    plate_crops = []
+    plate_areas = []
+
+    # Collect non-empty vehicle crops
+    crops = []
+    crop_indices = []
+    for i, (x1, y1, x2, y2) in enumerate(vehicle_boxes):
+        car_crop = frame[y1:y2, x1:x2]
+        if car_crop.size > 0:
+            crops.append(car_crop)
+            crop_indices.append(i)
+
+    if not crops:
+        return plate_indices, plate_crops, plate_areas
+
+    # Detect Plates (one batch for the whole frame)
+    plate_boxes = plate_detector.detect_plates(crops)
+
+    for i, car_crop, plate_box in zip(crop_indices, crops, plate_boxes):
+        if not plate_box:
+            continue
+
+        x1, y1, _, _ = vehicle_boxes[i]
+        plate_crop, (pad_px, pad_py, pad_pw, pad_ph) = _crop_plate(car_crop, plate_box)
+
+        # Visualization (Magenta Box for Plate)
+        if annotated_frame is not None:
+            cv2.rectangle(annotated_frame, (x1+pad_px, y1+pad_py), (x1+pad_px+pad_pw, y1+pad_py+pad_ph), (255, 0, 255), 2)
+
+        if plate_crop.size == 0:
+            continue
+
+        _, _, pw, ph = plate_box
+        plate_indices.append(i)
+        plate_crops.append(plate_crop)
+        plate_areas.append(pw * ph)
+
+    return plate_indices, plate_crops, plate_areas
+
+def read_plate_crops(plate_crops, plate_areas, reader):
+    """
+    Recognizes all plate crops in a single batched OCR call and validates them.
+    Returns a list of (text, conf, area) tuples aligned with plate_crops.
+    """
+    if not plate_crops:
+        return []
+
+    batch_results = reader.read_text_batch(plate_crops, enable_logic=config.ENABLE_OCR_LOGIC_LAYER)
+    return [_validate_ocr_results(results, area) for results, area in zip(batch_results, plate_areas)]
+
+def process_plate_detections(frame, vehicle_boxes, plate_detector, reader, annotated_frame):
+    """
+    Batched version of process_plate_detection for every vehicle in a frame.
+    Plate detection runs once over all vehicle crops (a single YOLO forward pass),
+    then all padded plate crops are recognized in a single batched OCR call.
+    Returns a list of (text, conf, area) tuples aligned with vehicle_boxes.
+    """
+    outputs = [(None, 0.0, 0)] * len(vehicle_boxes)
+
+    plate_indices, plate_crops, plate_areas = detect_plate_crops(frame, vehicle_boxes, plate_detector, annotated_frame)
+
+    for i, plate_read in zip(plate_indices, read_plate_crops(plate_crops, plate_areas, reader)):
+        outputs[i] = plate_read
+
+    return outputs
+
 class VehicleTracker:
     def __init__(self):
         # {track_id: {'reads': [], 'last_seen': 0, 'finalized': False}}
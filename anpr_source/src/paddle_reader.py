@@ -14,14 +14,15 @@ DICT_NUM_TO_CHAR = {
 }
 
 class PaddleLicenseReader:
-    def __init__(self, lang='en'):
+    def __init__(self, lang='en', rec_batch_num=16):
         """
         Initialize the PaddleLicenseReader.
         :param lang: Language code (default 'en').
+        :param rec_batch_num: Max plate crops recognized per Paddle batch (see read_text_batch).
         """
         print("Loading PaddleOCR model...")
         # use_angle_cls=True enables orientation classification (useful for rotated plates)
-        self.ocr = PaddleOCR(use_angle_cls=True, lang=lang)
+        self.ocr = PaddleOCR(use_angle_cls=True, lang=lang, rec_batch_num=rec_batch_num)
 
     def format_license(self, text):
         """
@@ -70,8 +71,6 @@ class PaddleLicenseReader:
             # Rec only mode
             result = self.ocr.ocr(image, det=False, cls=True)
         
-        detections = []
-        
         raw_detections = []
         
         if det:
@@ -98,7 +97,44 @@ class PaddleLicenseReader:
                          confidence = item[1]
                          raw_detections.append((text, confidence, None))
 
-        # Post-process detections
+        return self._filter_detections(raw_detections, enable_logic)
+
+    def read_text_batch(self, images, enable_logic=False, use_cls=False):
+        """
+        Recognize text in a batch of plate crops (recognition only, no text detection).
+        All crops go to Paddle's recognizer in one call; it resizes them to a common height
+        and pads them to the widest crop in the batch, so the per-call overhead is paid once
+        per frame instead of once per plate.
+        :param images: List of plate crops.
+        :param enable_logic: Whether to apply UK format logic/correction.
+        :param use_cls: Whether to run the angle classifier first. Off by default since plate
+                        crops come from an axis-aligned plate detector.
+        :return: List (one entry per crop) of lists of tuples [(text, confidence, None), ...]
+        """
+        if not images:
+            return []
+
+        images = list(images)
+        if use_cls and getattr(self.ocr, 'text_classifier', None) is not None:
+            images, _, _ = self.ocr.text_classifier(images)
+
+        # Rec only mode, batched. Result is [('text', conf), ...] in input order.
+        rec_res, _ = self.ocr.text_recognizer(images)
+
+        return [
+            self._filter_detections([(text, confidence, None)], enable_logic)
+            for text, confidence in rec_res
+        ]
+
+    def _filter_detections(self, raw_detections, enable_logic):
+        """
+        Drop low-confidence detections and optionally apply UK format correction.
+        :param raw_detections: List of tuples [(text, confidence, box), ...]
+        :param enable_logic: Whether to apply UK format logic/correction.
+        :return: Filtered list of tuples [(text, confidence, box), ...]
+        """
+        detections = []
+
         for text, confidence, box in raw_detections:
             if confidence > 0.5:
                 if enable_logic:
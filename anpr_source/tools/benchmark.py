@@ -9,11 +9,11 @@ if project_root not in sys.path:
     sys.path.append(project_root)
 
 import src.config as config
-from src.video_processor import VideoProcessor
+from src.frame_source import FrameSource
 from src.vehicle_detector import VehicleDetector
 from src.paddle_reader import PaddleLicenseReader
 from src.yolo_plate_detector import YoloPlateDetector
-from src.core_logic import process_plate_detection, VehicleTracker
+from src.core_logic import process_plate_detections, VehicleTracker
 
 def run_benchmark(run_name, res_weight, conf_weight, pos_vote, char_correct, logic_layer, strict_regex, detector, reader, plate_detector):
     # Inject Config
@@ -32,13 +32,12 @@ def run_benchmark(run_name, res_weight, conf_weight, pos_vote, char_correct, log
     # Setup Video
     source = config.VIDEO_PATH if os.path.exists(config.VIDEO_PATH) else 0
     try:
-        processor = VideoProcessor(source)
+        processor = FrameSource(source, skip_rate=config.FRAME_SKIP_RATE)
     except ValueError:
         print("Error opening video.")
         return
 
     tracker = VehicleTracker()
-    frame_count = 0
     processed_frames = 0
     
     # Metrics
@@ -50,11 +49,10 @@ def run_benchmark(run_name, res_weight, conf_weight, pos_vote, char_correct, log
     start_time = time.time()
 
     while True:
-        ret, frame = processor.get_frame()
+        # Skipped frames are grabbed but never decoded
+        ret, frame_count, frame = processor.read()
         if not ret: break
         
-        frame_count += 1
-        if frame_count % config.FRAME_SKIP_RATE != 0: continue
         processed_frames += 1
 
         if processed_frames % 10 == 0:
@@ -69,26 +67,27 @@ def run_benchmark(run_name, res_weight, conf_weight, pos_vote, char_correct, log
         annotated_frame = None # Disable visualization for pure benchmarking speed
         
         if detections:
-            for (x1, y1, x2, y2, conf, class_id, track_id) in detections:
-                if track_id != -1:
-                    tracker.update(track_id, frame_count)
-                    
-                    # We need to measure time for process_plate_detection, so we wrap it
-                    pt0 = time.time()
-                    # Note: process_plate_detection internals use time? No, we removed timing from core_logic to keep it clean.
-                    # We can't measure exact breakdown easily without modifying core_logic or wrapping calls inside it.
-                    # For now, let's measure total plate processing time.
-                    
-                    plate_text, plate_conf, plate_area = process_plate_detection(
-                        frame, (x1, y1, x2, y2), plate_detector, reader, annotated_frame
-                    )
-                    pt1 = time.time()
-                    
-                    if plate_text:
-                        diff = (pt1 - pt0) * 1000
-                        total_plate_det_time += diff # This now includes OCR and Logic
-                        plate_checks += 1
-                        tracker.add_read(track_id, plate_text, plate_conf, plate_area)
+            tracked = [d for d in detections if d[6] != -1]
+            for d in tracked:
+                tracker.update(d[6], frame_count)
+
+            # Plate detection is batched per frame, so we time the whole batch
+            # (detection + OCR + logic) and attribute it to the plates read.
+            pt0 = time.time()
+            plate_reads = process_plate_detections(
+                frame, [d[:4] for d in tracked], plate_detector, reader, annotated_frame
+            )
+            pt1 = time.time()
+
+            reads_this_frame = 0
+            for d, (plate_text, plate_conf, plate_area) in zip(tracked, plate_reads):
+                if plate_text:
+                    reads_this_frame += 1
+                    tracker.add_read(d[6], plate_text, plate_conf, plate_area)
+
+            if reads_this_frame:
+                total_plate_det_time += (pt1 - pt0) * 1000
+                plate_checks += reads_this_frame
 
         # Check existing
         # We manually call check_exiting to capture output? 
@@ -0,0 +1,41 @@
+"""add sightings (location_id, timestamp) index
+
+Revision ID: 4c1e8a2f9b3d
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1e8a2f9b3d'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so ingestion is not blocked while indexing a large sightings table.
+    # The app's create_all() already creates it on fresh databases.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sightings_location_id_timestamp',
+            'sightings',
+            ['location_id', 'timestamp'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_sightings_location_id_timestamp',
+            table_name='sightings',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
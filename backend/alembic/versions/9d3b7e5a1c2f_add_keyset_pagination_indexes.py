@@ -0,0 +1,42 @@
+"""add keyset pagination indexes
+
+Revision ID: 9d3b7e5a1c2f
+Revises: 4c1e8a2f9b3d
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3b7e5a1c2f'
+down_revision: Union[str, None] = '4c1e8a2f9b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sightings_timestamp_id',
+            'sightings',
+            ['timestamp', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_hotlists_created_at_id',
+            'hotlists',
+            ['created_at', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_hotlists_created_at_id', table_name='hotlists', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_sightings_timestamp_id', table_name='sightings', postgresql_concurrently=True, if_exists=True)
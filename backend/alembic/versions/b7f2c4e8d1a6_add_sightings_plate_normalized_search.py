@@ -0,0 +1,93 @@
+"""add sightings.plate_normalized with trigram search index
+
+Revision ID: b7f2c4e8d1a6
+Revises: 9d3b7e5a1c2f
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7f2c4e8d1a6'
+down_revision: Union[str, None] = '9d3b7e5a1c2f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS sightings_plate_search USING fts5("
+    "plate_normalized, content='sightings', content_rowid='rowid', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS sightings_plate_search_insert AFTER INSERT ON sightings BEGIN "
+    "INSERT INTO sightings_plate_search(rowid, plate_normalized) VALUES (new.rowid, new.plate_normalized); END",
+    "CREATE TRIGGER IF NOT EXISTS sightings_plate_search_delete AFTER DELETE ON sightings BEGIN "
+    "INSERT INTO sightings_plate_search(sightings_plate_search, rowid, plate_normalized) "
+    "VALUES ('delete', old.rowid, old.plate_normalized); END",
+    "CREATE TRIGGER IF NOT EXISTS sightings_plate_search_update AFTER UPDATE OF plate_normalized ON sightings BEGIN "
+    "INSERT INTO sightings_plate_search(sightings_plate_search, rowid, plate_normalized) "
+    "VALUES ('delete', old.rowid, old.plate_normalized); "
+    "INSERT INTO sightings_plate_search(rowid, plate_normalized) VALUES (new.rowid, new.plate_normalized); END",
+    "INSERT INTO sightings_plate_search(sightings_plate_search) VALUES ('rebuild')",
+]
+
+
+def _has_column() -> bool:
+    if op.get_context().as_sql:
+        return False
+    columns = sa.inspect(op.get_bind()).get_columns('sightings')
+    return any(column['name'] == 'plate_normalized' for column in columns)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    # The app's create_all() already adds the column on fresh databases
+    if not _has_column():
+        op.add_column('sightings', sa.Column('plate_normalized', sa.String(20), nullable=True))
+
+    # Same rule as app.core.plates.normalize_plate: upper case, no whitespace or dashes
+    if dialect == 'postgresql':
+        op.execute(
+            "UPDATE sightings SET plate_normalized = upper(regexp_replace(plate_number, '[[:space:]-]+', '', 'g')) "
+            "WHERE plate_normalized IS NULL"
+        )
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        with op.get_context().autocommit_block():
+            op.create_index(
+                'ix_sightings_plate_normalized_trgm',
+                'sightings',
+                ['plate_normalized'],
+                postgresql_using='gin',
+                postgresql_ops={'plate_normalized': 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    else:
+        op.execute(
+            "UPDATE sightings SET plate_normalized = upper(replace(replace(replace(plate_number, ' ', ''), '-', ''), char(9), '')) "
+            "WHERE plate_normalized IS NULL"
+        )
+        if dialect == 'sqlite':
+            for statement in SQLITE_SEARCH_DDL:
+                op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                'ix_sightings_plate_normalized_trgm',
+                table_name='sightings',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    elif dialect == 'sqlite':
+        for trigger in ('insert', 'delete', 'update'):
+            op.execute(f"DROP TRIGGER IF EXISTS sightings_plate_search_{trigger}")
+        op.execute("DROP TABLE IF EXISTS sightings_plate_search")
+    with op.batch_alter_table('sightings') as batch_op:
+        batch_op.drop_column('plate_normalized')
@@ -0,0 +1,90 @@
+"""add hotlists.plate_normalized with unique index
+
+Revision ID: c3f8a2d6e9b4
+Revises: e5a9c1d7f3b2
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.plates import normalize_plate
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a2d6e9b4'
+down_revision: Union[str, None] = 'e5a9c1d7f3b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+hotlists = sa.table(
+    'hotlists',
+    sa.column('id'),
+    sa.column('plate_number', sa.String),
+    sa.column('plate_normalized', sa.String),
+    sa.column('created_at', sa.DateTime),
+)
+
+
+def _has_column() -> bool:
+    if op.get_context().as_sql:
+        return False
+    columns = sa.inspect(op.get_bind()).get_columns('hotlists')
+    return any(column['name'] == 'plate_normalized' for column in columns)
+
+
+def upgrade() -> None:
+    # The app's create_all() already adds the column on fresh databases
+    if not _has_column():
+        op.add_column('hotlists', sa.Column('plate_normalized', sa.String(), nullable=True))
+
+    # The hotlist is small: backfill with the app's own normalize_plate. Entries that
+    # normalize to the same plate were one cache entry already; keep the oldest and
+    # drop the rest so the unique index can be built.
+    if not op.get_context().as_sql:
+        bind = op.get_bind()
+        rows = bind.execute(
+            sa.select(hotlists.c.id, hotlists.c.plate_number)
+            .where(hotlists.c.plate_normalized.is_(None))
+            .order_by(hotlists.c.created_at, hotlists.c.id)
+        ).all()
+        taken = set(bind.execute(
+            sa.select(hotlists.c.plate_normalized).where(hotlists.c.plate_normalized.is_not(None))
+        ).scalars())
+        duplicates = []
+        for hotlist_id, plate_number in rows:
+            key = normalize_plate(plate_number)
+            if key in taken:
+                duplicates.append(hotlist_id)
+                continue
+            taken.add(key)
+            bind.execute(hotlists.update().where(hotlists.c.id == hotlist_id).values(plate_normalized=key))
+        if duplicates:
+            bind.execute(hotlists.delete().where(hotlists.c.id.in_(duplicates)))
+            # No change log entry covers the removals: edge devices fall back to a full sync
+            bind.execute(sa.text("UPDATE data_versions SET version = version + 1 WHERE key = 'hotlists'"))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_hotlists_plate_normalized',
+            'hotlists',
+            ['plate_normalized'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_hotlists_plate_normalized',
+            table_name='hotlists',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    with op.batch_alter_table('hotlists') as batch_op:
+        batch_op.drop_column('plate_normalized')
@@ -0,0 +1,42 @@
+"""add devices api_key_id unique index
+
+Revision ID: e5a9c1d7f3b2
+Revises: b7f2c4e8d1a6
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c1d7f3b2'
+down_revision: Union[str, None] = 'b7f2c4e8d1a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Every authentication cache miss looks the device up by api_key_id.
+    # The app's create_all() already creates it on fresh databases.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_devices_api_key_id',
+            'devices',
+            ['api_key_id'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_devices_api_key_id',
+            table_name='devices',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -1,9 +1,45 @@
-from typing import Generator
-from app.db.session import SessionLocal
+import hmac
+from typing import AsyncGenerator, Optional
+from fastapi import Depends, Header, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import AsyncSessionLocal
+from app.core.config import settings
+from app.core.device_key_cache import AuthenticatedDevice, device_key_cache
 
-def get_db() -> Generator:
-    try:
-        db = SessionLocal()
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+async def validate_api_key(
+    x_api_key: str = Header(...),
+    db: AsyncSession = Depends(get_db),
+) -> Optional[AuthenticatedDevice]:
+    """
+    Authenticate an edge device by its API key against the devices table.
+    With USE_MOCK_AUTH (local development) the key is compared with MOCK_API_KEY instead.
+    :return: The device, or None under mock auth.
+    """
+    if settings.USE_MOCK_AUTH:
+        if x_api_key != settings.MOCK_API_KEY:
+            raise HTTPException(status_code=401, detail="Invalid API Key")
+        return None
+    device = await device_key_cache.authenticate(db, x_api_key)
+    if device is None:
+        raise HTTPException(status_code=401, detail="Invalid API Key")
+    return device
+
+def validate_admin_key(x_admin_key: str = Header(...)) -> None:
+    """
+    Admin credential for device management, separate from device keys.
+    """
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=403, detail="Device management is disabled (ADMIN_API_KEY is not set)")
+    if not hmac.compare_digest(x_admin_key.encode(), settings.ADMIN_API_KEY.encode()):
+        raise HTTPException(status_code=401, detail="Invalid Admin Key")
+
+def check_device_location(device: Optional[AuthenticatedDevice], location_id: str) -> None:
+    """
+    A device may only report sightings for its own location (no check under mock auth).
+    """
+    if device is not None and location_id != device.location_id:
+        raise HTTPException(status_code=403, detail="Sighting location does not match the device")
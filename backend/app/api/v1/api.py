@@ -1,8 +1,10 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import sightings, hotlists, analytics
+from app.api.v1.endpoints import sightings, hotlists, analytics, stream, devices
 
 api_router = APIRouter()
 api_router.include_router(sightings.router, prefix="/sightings", tags=["sightings"])
 api_router.include_router(hotlists.router, prefix="/hotlists", tags=["hotlists"])
+api_router.include_router(devices.router, prefix="/devices", tags=["devices"])
 api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+api_router.include_router(stream.router, prefix="/stream", tags=["stream"])
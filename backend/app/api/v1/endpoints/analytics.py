@@ -1,109 +1,143 @@
 from typing import Any, List, Optional
-from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy import Select, and_, exists, func, select
 
 from app import models, schemas
 from app.api import deps
+from app.core.serialization import JSON, SIGHTING_COLUMNS, encode_json, sighting_columns
 
 router = APIRouter()
 
-@router.get("/convoy")
-def get_convoy_analysis(
-    db: Session = Depends(deps.get_db),
+def _convoy_join(leader, follower, plate_number: str, window: timedelta, dialect: str):
+    """
+    Join condition: `follower` seen at the leader's location within the window, excluding the target plate.
+    Served by the (location_id, timestamp) index. SQLite has no interval arithmetic on stored
+    datetimes, so it compares Julian day numbers instead (the location_id prefix of the index still applies).
+    """
+    if dialect == "sqlite":
+        days = window.total_seconds() / 86400
+        follower_day, leader_day = func.julianday(follower.timestamp), func.julianday(leader.timestamp)
+        in_window = and_(follower_day >= leader_day - days, follower_day <= leader_day + days)
+    else:
+        in_window = and_(follower.timestamp >= leader.timestamp - window, follower.timestamp <= leader.timestamp + window)
+    return and_(
+        follower.location_id == leader.location_id,
+        in_window,
+        follower.plate_number != plate_number,
+    )
+
+@router.get("/convoy", response_model=List[schemas.ConvoyGroup])
+async def get_convoy_analysis(
+    db: AsyncSession = Depends(deps.get_db),
     plate_number: str = Query(..., description="Target plate number to analyze"),
-    time_window_seconds: int = Query(5, description="Time window in seconds to consider as a convoy"),
+    time_window_seconds: int = Query(5, ge=0, le=3600, description="Time window in seconds to consider as a convoy"),
+    skip: int = Query(0, ge=0, description="Convoy groups to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum convoy groups to return"),
 ) -> Any:
     """
     Analyze sightings to find potential convoys for a specific plate.
-    Returns a list of 'convoy groups' where the target plate was seen with other vehicles.
+    Returns a list of 'convoy groups' where the target plate was seen with other vehicles,
+    most recent first. Runs as a single query regardless of how often the plate was seen.
+    Rows are selected as plain columns and encoded directly, without ORM objects or per-row
+    pydantic models.
     """
-    # 1. Find all sightings of the target plate
-    target_sightings = db.query(models.Sighting).filter(
-        models.Sighting.plate_number == plate_number
-    ).order_by(models.Sighting.timestamp.desc()).all()
+    window = timedelta(seconds=time_window_seconds)
+    dialect = db.get_bind().dialect.name
+    leader = aliased(models.Sighting)
+    follower = aliased(models.Sighting)
+
+    # 1. One page of target sightings that have at least one follower
+    page = (
+        select(leader.id)
+        .filter(leader.plate_number == plate_number)
+        .filter(exists().where(_convoy_join(leader, follower, plate_number, window, dialect)))
+        .order_by(leader.timestamp.desc(), leader.id)
+        .offset(skip)
+        .limit(limit)
+        .subquery()
+    )
+
+    # 2. Joined with their followers in the same statement
+    page_leader = aliased(models.Sighting)
+    page_follower = aliased(models.Sighting)
+    rows = (await db.execute(
+        select(*sighting_columns(page_leader), *sighting_columns(page_follower))
+        .join(page, page.c.id == page_leader.id)
+        .join(page_follower, _convoy_join(page_leader, page_follower, plate_number, window, dialect))
+        .order_by(page_leader.timestamp.desc(), page_leader.id, page_follower.timestamp)
+    )).all()
 
+    width = len(SIGHTING_COLUMNS)
+    id_index = SIGHTING_COLUMNS.index("id")
     results = []
+    for row in rows:
+        if not results or results[-1]["leader_sighting"]["id"] != row[id_index]:
+            results.append({"leader_sighting": dict(zip(SIGHTING_COLUMNS, row[:width])), "followers": []})
+        results[-1]["followers"].append(dict(zip(SIGHTING_COLUMNS, row[width:])))
 
-    for sighting in target_sightings:
-        # 2. For each sighting, find other vehicles at the same location within the time window
-        window = timedelta(seconds=time_window_seconds)
-        start_time = sighting.timestamp - window
-        end_time = sighting.timestamp + window
+    return Response(content=encode_json(results), media_type=JSON)
 
-        followers = db.query(models.Sighting).filter(
-            models.Sighting.location_id == sighting.location_id,
-            models.Sighting.timestamp >= start_time,
-            models.Sighting.timestamp <= end_time,
-            models.Sighting.plate_number != plate_number # Exclude self
-        ).all()
+def od_matrix_query(start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> Select:
+    """
+    (origin, destination, trips) rows from the OD counters; shared with tools/benchmark_od_matrix.py.
+    """
+    counts = models.OdHourlyCount
+    total = func.sum(counts.trip_count)
+    query = select(counts.origin_location_id, counts.destination_location_id, total)
 
-        if followers:
-            results.append({
-                "leader_sighting": sighting,
-                "followers": followers
-            })
+    if start_date:
+        query = query.filter(counts.hour >= start_date)
+    if end_date:
+        query = query.filter(counts.hour <= end_date)
 
-    return results
+    return query.group_by(counts.origin_location_id, counts.destination_location_id).having(total > 0)
 
 @router.get("/od-matrix")
-def get_od_matrix(
-    db: Session = Depends(deps.get_db),
-    start_date: Optional[str] = Query(None, description="Start date (ISO 8601)"),
-    end_date: Optional[str] = Query(None, description="End date (ISO 8601)"),
+async def get_od_matrix(
+    db: AsyncSession = Depends(deps.get_db),
+    start_date: Optional[datetime] = Query(None, description="Start date (ISO 8601)"),
+    end_date: Optional[datetime] = Query(None, description="End date (ISO 8601)"),
 ) -> Any:
     """
     Calculate Origin-Destination Matrix.
+    Counts trips (see app.db.trips) by the hour they started, so the range has hour resolution.
+    Reads the pre-aggregated OD counters; cost does not depend on the number of sightings.
     Returns a list of {origin, destination, count} objects.
     """
-    # 1. Fetch all sightings within range (or last 24h if not specified)
-    query = db.query(models.Sighting).order_by(models.Sighting.plate_number, models.Sighting.timestamp)
-    
-    if start_date:
-        query = query.filter(models.Sighting.timestamp >= start_date)
-    if end_date:
-        query = query.filter(models.Sighting.timestamp <= end_date)
-        
-    sightings = query.all()
-    
-    # 2. Process in Python to find trips
-    trips = {} # (origin, destination) -> count
-    
-    if not sightings:
-        return []
-
-    current_plate = None
-    first_sighting = None
-    last_sighting = None
+    rows = (await db.execute(od_matrix_query(start_date, end_date))).all()
+    return [{"origin": origin, "destination": dest, "count": count} for origin, dest, count in rows]
 
-    for sighting in sightings:
-        if sighting.plate_number != current_plate:
-            # New plate, finalize previous trip if valid
-            if current_plate and first_sighting and last_sighting and first_sighting != last_sighting:
-                origin = first_sighting.location_id
-                dest = last_sighting.location_id
-                if origin != dest:
-                    trips[(origin, dest)] = trips.get((origin, dest), 0) + 1
-            
-            # Reset for new plate
-            current_plate = sighting.plate_number
-            first_sighting = sighting
-            last_sighting = sighting
-        else:
-            # Same plate, update last sighting
-            last_sighting = sighting
+@router.get("/od-flows")
+async def get_od_flows(
+    db: AsyncSession = Depends(deps.get_db),
+    start_date: Optional[datetime] = Query(None, description="Start date (ISO 8601)"),
+    end_date: Optional[datetime] = Query(None, description="End date (ISO 8601)"),
+    origin: Optional[str] = Query(None, description="Origin location"),
+    destination: Optional[str] = Query(None, description="Destination location"),
+) -> Any:
+    """
+    Hourly trip counts between locations.
+    Returns a list of {origin, destination, hour, count} objects, oldest hour first.
+    """
+    counts = models.OdHourlyCount
+    query = select(counts).filter(counts.trip_count > 0)
 
-    # Finalize last plate
-    if current_plate and first_sighting and last_sighting and first_sighting != last_sighting:
-        origin = first_sighting.location_id
-        dest = last_sighting.location_id
-        if origin != dest:
-            trips[(origin, dest)] = trips.get((origin, dest), 0) + 1
+    if start_date:
+        query = query.filter(counts.hour >= start_date)
+    if end_date:
+        query = query.filter(counts.hour <= end_date)
+    if origin:
+        query = query.filter(counts.origin_location_id == origin)
+    if destination:
+        query = query.filter(counts.destination_location_id == destination)
 
-    # 3. Format results
-    results = []
-    for (origin, dest), count in trips.items():
-        results.append({"origin": origin, "destination": dest, "count": count})
-        
-    return results
+    rows = (await db.scalars(
+        query.order_by(counts.hour, counts.origin_location_id, counts.destination_location_id)
+    )).all()
+    return [
+        {"origin": row.origin_location_id, "destination": row.destination_location_id, "hour": row.hour, "count": row.trip_count}
+        for row in rows
+    ]
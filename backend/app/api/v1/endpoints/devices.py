@@ -0,0 +1,82 @@
+from typing import List, Any
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from uuid import UUID
+
+from app import schemas, models
+from app.api import deps
+from app.core.device_key_cache import device_key_cache, DEVICE_VERSION_KEY
+from app.core.security import generate_api_key, hash_api_key
+from app.db.data_version import bump_version
+
+router = APIRouter(dependencies=[Depends(deps.validate_admin_key)])
+
+@router.get("/", response_model=List[schemas.Device])
+async def read_devices(
+    db: AsyncSession = Depends(deps.get_db),
+) -> Any:
+    """
+    Retrieve registered devices.
+    """
+    return (await db.scalars(select(models.Device).order_by(models.Device.location_id))).all()
+
+@router.post("/", response_model=schemas.DeviceWithKey, status_code=201)
+async def create_device(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    device_in: schemas.DeviceCreate,
+) -> Any:
+    """
+    Register an edge device and issue its API key.
+    The key is only returned here; the server stores a hash of it.
+    Registering the location of a revoked device re-keys that device (e.g. after a leaked key).
+    """
+    device = (await db.scalars(
+        select(models.Device).filter(models.Device.location_id == device_in.locationId)
+    )).first()
+    if device and device.is_active:
+        raise HTTPException(status_code=400, detail="A device is already registered for this location")
+
+    api_key_id, api_key = generate_api_key()
+    api_key_hash = await run_in_threadpool(hash_api_key, api_key.partition(".")[2])
+    if device:
+        old_api_key_id = device.api_key_id
+        device.api_key_id = api_key_id
+        device.api_key_hash = api_key_hash
+        device.is_active = device_in.isActive
+        # Other workers drop their cached verifications when they see the new version
+        await db.run_sync(bump_version, DEVICE_VERSION_KEY)
+        await db.commit()
+        device_key_cache.invalidate(old_api_key_id)
+    else:
+        device = models.Device(
+            location_id=device_in.locationId,
+            is_active=device_in.isActive,
+            api_key_id=api_key_id,
+            api_key_hash=api_key_hash,
+        )
+        db.add(device)
+        await db.commit()
+    await db.refresh(device)
+    return {**schemas.Device.model_validate(device).model_dump(), "api_key": api_key}
+
+@router.delete("/{id}", response_model=schemas.Device)
+async def revoke_device(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    id: UUID,
+) -> Any:
+    """
+    Revoke a device's API key. The device row is kept (deactivated) for its history.
+    """
+    device = (await db.scalars(select(models.Device).filter(models.Device.id == id))).first()
+    if not device:
+        raise HTTPException(status_code=404, detail="Device not found")
+    device.is_active = False
+    # Other workers drop their cached verifications when they see the new version
+    await db.run_sync(bump_version, DEVICE_VERSION_KEY)
+    await db.commit()
+    device_key_cache.invalidate(device.api_key_id)
+    return device
@@ -1,61 +1,130 @@
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import List, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app import schemas, models
 from app.api import deps
+from app.core.device_key_cache import AuthenticatedDevice
+from app.core.hotlist_cache import hotlist_cache, HOTLIST_VERSION_KEY
+from app.core.pagination import paginate
+from app.core.plates import normalize_plate
+from app.core.response_cache import response_cache
+from app.core.serialization import dump_model
+from app.db.data_version import bump_version, get_version
 
 router = APIRouter()
 
+_hotlists_adapter = TypeAdapter(List[schemas.Hotlist])
+
 @router.get("/", response_model=List[schemas.Hotlist])
-def read_hotlists(
-    db: Session = Depends(deps.get_db),
+async def read_hotlists(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page (takes precedence over skip)"),
+) -> Any:
+    """
+    Retrieve hotlists, newest first.
+    """
+    async def compute(response: Response) -> bytes:
+        return dump_model(_hotlists_adapter, await paginate(
+            db, select(models.Hotlist), response, models.Hotlist.created_at, models.Hotlist.id, skip, limit, cursor
+        ))
+
+    return await response_cache.respond(
+        request, db, HOTLIST_VERSION_KEY, {"skip": 0 if cursor else skip, "limit": limit, "cursor": cursor}, compute
+    )
+
+@router.get("/changes", response_model=schemas.HotlistChanges)
+async def read_hotlist_changes(
+    db: AsyncSession = Depends(deps.get_db),
+    since: int = Query(0, ge=0),
+    device: Optional[AuthenticatedDevice] = Depends(deps.validate_api_key)
 ) -> Any:
     """
-    Retrieve hotlists.
+    Hotlist changes after version `since`, for edge device delta sync.
+    Returns a full snapshot when the client has no copy yet (since=0) or its version
+    cannot be brought up to date from the change log.
     """
-    hotlists = db.query(models.Hotlist).offset(skip).limit(limit).all()
-    return hotlists
+    version = await db.run_sync(get_version, HOTLIST_VERSION_KEY)
+    if since == version:
+        return {"version": version, "full": False, "changes": []}
+
+    if 0 < since < version:
+        changes = (await db.scalars(
+            select(models.HotlistChange)
+            .filter(models.HotlistChange.version > since)
+            .order_by(models.HotlistChange.version)
+        )).all()
+        if changes and changes[0].version == since + 1:
+            return {"version": changes[-1].version, "full": False, "changes": changes}
+
+    rows = (await db.execute(select(models.Hotlist.plate_number, models.Hotlist.category))).all()
+    return {
+        "version": version,
+        "full": True,
+        "changes": [{"plate_number": plate, "category": category} for plate, category in rows],
+    }
 
 @router.post("/", response_model=schemas.Hotlist, status_code=201)
-def create_hotlist(
+async def create_hotlist(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     hotlist_in: schemas.HotlistCreate,
 ) -> Any:
     """
     Create new hotlist entry.
     """
-    # Check for duplicates
-    existing = db.query(models.Hotlist).filter(models.Hotlist.plate_number == hotlist_in.plate_number).first()
+    # Check for duplicates ("AB12 CDE" and "AB12-CDE" are the same plate)
+    plate_normalized = normalize_plate(hotlist_in.plate_number)
+    existing = (await db.scalars(
+        select(models.Hotlist).filter(models.Hotlist.plate_normalized == plate_normalized)
+    )).first()
     if existing:
         raise HTTPException(status_code=400, detail="Plate already exists in hotlist")
 
     hotlist = models.Hotlist(
         plate_number=hotlist_in.plate_number,
+        plate_normalized=plate_normalized,
         description=hotlist_in.description,
         category=hotlist_in.category
     )
     db.add(hotlist)
-    db.commit()
-    db.refresh(hotlist)
+    try:
+        # The unique index catches a concurrent insert of the same plate
+        await db.flush()
+        version = await db.run_sync(bump_version, HOTLIST_VERSION_KEY)
+        db.add(models.HotlistChange(version=version, plate_number=hotlist.plate_number, category=hotlist.category))
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Plate already exists in hotlist")
+    await db.refresh(hotlist)
+    hotlist_cache.apply(version, hotlist.plate_number, hotlist.category)
+    response_cache.invalidate(HOTLIST_VERSION_KEY)
     return hotlist
 
 @router.delete("/{id}", response_model=schemas.Hotlist)
-def delete_hotlist(
+async def delete_hotlist(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     id: UUID,
 ) -> Any:
     """
     Delete a hotlist entry.
     """
-    hotlist = db.query(models.Hotlist).filter(models.Hotlist.id == id).first()
+    hotlist = (await db.scalars(select(models.Hotlist).filter(models.Hotlist.id == id))).first()
     if not hotlist:
         raise HTTPException(status_code=404, detail="Hotlist not found")
-    db.delete(hotlist)
-    db.commit()
+    await db.delete(hotlist)
+    version = await db.run_sync(bump_version, HOTLIST_VERSION_KEY)
+    db.add(models.HotlistChange(version=version, plate_number=hotlist.plate_number, deleted=True))
+    await db.commit()
+    hotlist_cache.apply(version, hotlist.plate_number, removed=True)
+    response_cache.invalidate(HOTLIST_VERSION_KEY)
     return hotlist
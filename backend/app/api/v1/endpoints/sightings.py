@@ -1,68 +1,107 @@
+import uuid
 from datetime import datetime
-from typing import List, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, Header
-from sqlalchemy.orm import Session
+from typing import List, Any, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import schemas, models
 from app.api import deps
 from app.core.config import settings
+from app.core.device_key_cache import AuthenticatedDevice
+from app.core.hotlist_cache import hotlist_cache
+from app.core.pagination import paginate
+from app.core.plates import normalize_plate
+from app.core.response_cache import response_cache, SIGHTINGS_VERSION_KEY
+from app.core.serialization import dump_model, encode_rows, negotiate, sighting_columns
+from app.core.sighting_stream import sighting_broker
+from app.db.counters import utc_hour
+from app.db.plate_search import plate_search_filter
+from app.db.sighting_counts import count_sightings
+from app.db.trips import record_sightings
 
 router = APIRouter()
 
-def validate_api_key(x_api_key: str = Header(...)):
-    """
-    Mock API Key validation for local development.
-    In production, this would check against the database or AWS API Gateway.
-    """
-    if settings.USE_MOCK_AUTH:
-        if x_api_key != settings.MOCK_API_KEY:
-            raise HTTPException(status_code=401, detail="Invalid API Key")
-    return x_api_key
+_stats_adapter = TypeAdapter(schemas.SightingStats)
 
-from sqlalchemy import func
+from sqlalchemy import func, insert, literal, select
 
 @router.get("/stats", response_model=schemas.SightingStats)
-def get_stats(
-    db: Session = Depends(deps.get_db),
+async def get_stats(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_db),
+    since: Optional[datetime] = Query(None, description="Only count sightings from the hour containing this time on"),
+    bucket: Optional[Literal["hour", "day"]] = Query(None, description="Also return totals per hour or day (UTC)"),
 ) -> Any:
     """
     Get sighting statistics.
+    Served from the hourly counters maintained at ingestion, never from the sightings table.
     """
-    total = db.query(models.Sighting).count()
-    alerts = db.query(models.Sighting).filter(models.Sighting.is_hot == True).count()
-    
-    # Group by category
-    rows = db.query(models.Sighting.hotlist_category, func.count(models.Sighting.id)).filter(models.Sighting.is_hot == True).group_by(models.Sighting.hotlist_category).all()
-    
-    category_counts = {row[0]: row[1] for row in rows if row[0]}
-    
+    async def compute(response: Response) -> bytes:
+        return dump_model(_stats_adapter, await _compute_stats(db, since, bucket))
+
+    return await response_cache.respond(
+        request, db, SIGHTINGS_VERSION_KEY, {"path": "stats", "since": since and utc_hour(since), "bucket": bucket},
+        compute,
+    )
+
+async def _compute_stats(db: AsyncSession, since: Optional[datetime], bucket: Optional[str]) -> dict:
+    counts = models.SightingHourlyCount
+    query = select(counts.hour, counts.is_hot, counts.hotlist_category, counts.sighting_count)
+    if since:
+        query = query.filter(counts.hour >= utc_hour(since))
+    if not bucket:
+        # Collapse the hours in SQL: one row per (is_hot, category)
+        query = query.with_only_columns(
+            literal(None), counts.is_hot, counts.hotlist_category, func.sum(counts.sighting_count)
+        ).group_by(counts.is_hot, counts.hotlist_category)
+
+    total = 0
+    alerts = 0
+    category_counts = {}
+    buckets = {}
+    for hour, is_hot, category, count in (await db.execute(query)).all():
+        total += count
+        if is_hot:
+            alerts += count
+            if category:
+                category_counts[category] = category_counts.get(category, 0) + count
+        if bucket:
+            start = hour if bucket == "hour" else hour.replace(hour=0)
+            totals = buckets.setdefault(start, [0, 0])
+            totals[0] += count
+            totals[1] += count if is_hot else 0
+
     return {
         "total_sightings": total,
         "total_alerts": alerts,
-        "alerts_by_category": category_counts
+        "alerts_by_category": category_counts,
+        "buckets": [
+            {"start": start, "total_sightings": bucket_total, "total_alerts": bucket_alerts}
+            for start, (bucket_total, bucket_alerts) in sorted(buckets.items())
+        ] if bucket else None,
     }
 
 @router.post("/", response_model=schemas.Sighting, status_code=201)
-def create_sighting(
+async def create_sighting(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     sighting_in: schemas.SightingCreate,
-    api_key: str = Depends(validate_api_key)
+    device: Optional[AuthenticatedDevice] = Depends(deps.validate_api_key)
 ) -> Any:
     """
     Create new sighting.
     """
-    # Check if plate is in hotlist
-    is_hot = False
-    hotlist_category = None
-    hotlist_entry = db.query(models.Hotlist).filter(models.Hotlist.plate_number == sighting_in.plateNumber).first()
-    if hotlist_entry:
-        is_hot = True
-        hotlist_category = hotlist_entry.category
-        print(f"ALERT: Hotlist match for {sighting_in.plateNumber} ({hotlist_entry.category})")
+    deps.check_device_location(device, sighting_in.locationId)
+
+    # Check if plate is in hotlist (in-memory, no database round-trip)
+    is_hot, hotlist_category = await db.run_sync(hotlist_cache.match, sighting_in.plateNumber)
+    if is_hot:
+        print(f"ALERT: Hotlist match for {sighting_in.plateNumber} ({hotlist_category})")
 
     sighting = models.Sighting(
         plate_number=sighting_in.plateNumber,
+        plate_normalized=normalize_plate(sighting_in.plateNumber),
         timestamp=sighting_in.timestamp,
         location_id=sighting_in.locationId,
         is_hot=is_hot,
@@ -73,15 +112,76 @@ def create_sighting(
         direction=sighting_in.direction
     )
     db.add(sighting)
-    db.commit()
-    db.refresh(sighting)
+    await db.run_sync(record_sightings, [(sighting.plate_number, sighting.timestamp, sighting.location_id)])
+    await db.run_sync(count_sightings, [(sighting.timestamp, is_hot, hotlist_category)])
+    await db.commit()
+    await db.refresh(sighting)
+    sighting_broker.publish([sighting])
     return sighting
 
+@router.post("/batch", response_model=schemas.SightingBatchResult, status_code=201)
+async def create_sightings_batch(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    sightings_in: List[schemas.SightingCreate],
+    device: Optional[AuthenticatedDevice] = Depends(deps.validate_api_key)
+) -> Any:
+    """
+    Create many sightings in a single transaction.
+    Hotlist matching uses the in-memory hotlist cache.
+    """
+    if len(sightings_in) > settings.SIGHTING_BATCH_MAX_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {settings.SIGHTING_BATCH_MAX_SIZE} sightings")
+    for sighting_in in sightings_in:
+        deps.check_device_location(device, sighting_in.locationId)
+
+    # Check plates against the hotlist (in-memory, at most one database round-trip per batch)
+    matches = await db.run_sync(hotlist_cache.match_many, [sighting_in.plateNumber for sighting_in in sightings_in])
+
+    rows = []
+    items = []
+    for index, (sighting_in, (is_hot, hotlist_category)) in enumerate(zip(sightings_in, matches)):
+        if is_hot:
+            print(f"ALERT: Hotlist match for {sighting_in.plateNumber} ({hotlist_category})")
+
+        sighting_id = uuid.uuid4()
+        rows.append({
+            "id": sighting_id,
+            "plate_number": sighting_in.plateNumber,
+            "plate_normalized": normalize_plate(sighting_in.plateNumber),
+            "timestamp": sighting_in.timestamp,
+            "location_id": sighting_in.locationId,
+            "is_hot": is_hot,
+            "hotlist_category": hotlist_category,
+            "vehicle_make": sighting_in.vehicleMake,
+            "vehicle_model": sighting_in.vehicleModel,
+            "vehicle_color": sighting_in.vehicleColor,
+            "direction": sighting_in.direction,
+        })
+        items.append({"index": index, "id": sighting_id, "is_hot": is_hot, "hotlist_category": hotlist_category})
+
+    # Bulk insert (executemany) in one transaction
+    if rows:
+        # created_at is set by the database; read it back for the live stream
+        created = (await db.scalars(
+            insert(models.Sighting).returning(models.Sighting.created_at, sort_by_parameter_order=True), rows
+        )).all()
+        for row, created_at in zip(rows, created):
+            row["created_at"] = created_at
+        await db.run_sync(record_sightings, [(row["plate_number"], row["timestamp"], row["location_id"]) for row in rows])
+        await db.run_sync(count_sightings, [(row["timestamp"], row["is_hot"], row["hotlist_category"]) for row in rows])
+    await db.commit()
+    sighting_broker.publish(rows)
+
+    return {"created": len(rows), "items": items}
+
 @router.get("/", response_model=List[schemas.Sighting])
-def read_sightings(
-    db: Session = Depends(deps.get_db),
+async def read_sightings(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page (takes precedence over skip)"),
     plateNumber: Optional[str] = None,
     locationId: Optional[str] = None,
     startDate: Optional[datetime] = None,
@@ -89,12 +189,35 @@ def read_sightings(
     hotlistCategory: Optional[str] = None,
 ) -> Any:
     """
-    Retrieve sightings.
+    Retrieve sightings, newest first.
+
+    The Accept header selects the format: application/json (default, list of objects),
+    application/vnd.platewatch.columnar+json (one array per field) or
+    application/vnd.apache.arrow.stream (Arrow IPC, if pyarrow is installed).
     """
-    query = db.query(models.Sighting)
+    params = {
+        "path": "list", "skip": 0 if cursor else skip, "limit": limit, "cursor": cursor,
+        "plateNumber": normalize_plate(plateNumber) if plateNumber else None, "locationId": locationId,
+        "startDate": startDate, "endDate": endDate, "hotlistCategory": hotlistCategory,
+    }
+    media_type = negotiate(request)
+
+    async def compute(response: Response) -> bytes:
+        response.headers["Vary"] = "Accept"
+        rows = await _query_sightings(db, response, skip, limit, cursor, plateNumber, locationId,
+                                      startDate, endDate, hotlistCategory)
+        return encode_rows(rows, media_type)
+
+    return await response_cache.respond(request, db, SIGHTINGS_VERSION_KEY, params, compute, media_type)
+
+async def _query_sightings(db: AsyncSession, response: Response, skip: int, limit: int, cursor: Optional[str],
+                           plateNumber: Optional[str], locationId: Optional[str], startDate: Optional[datetime],
+                           endDate: Optional[datetime], hotlistCategory: Optional[str]) -> list:
+    # Plain column tuples: no ORM identity map or pydantic models per row
+    query = select(*sighting_columns())
     
     if plateNumber:
-        query = query.filter(models.Sighting.plate_number.ilike(f"%{plateNumber}%"))
+        query = query.filter(plate_search_filter(db, plateNumber))
     
     if locationId:
         query = query.filter(models.Sighting.location_id == locationId)
@@ -111,5 +234,4 @@ def read_sightings(
         elif hotlistCategory != "All":
              query = query.filter(models.Sighting.hotlist_category == hotlistCategory)
         
-    sightings = query.order_by(models.Sighting.timestamp.desc()).offset(skip).limit(limit).all()
-    return sightings
+    return await paginate(db, query, response, models.Sighting.timestamp, models.Sighting.id, skip, limit, cursor, rows=True)
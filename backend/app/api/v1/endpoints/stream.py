@@ -0,0 +1,42 @@
+import asyncio
+from typing import Any, Optional
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.sighting_stream import sighting_broker
+
+router = APIRouter()
+
+@router.get("/sightings")
+async def stream_sightings(
+    request: Request,
+    hotOnly: bool = Query(False, description="Only hotlist matches"),
+    locationId: Optional[str] = None,
+) -> Any:
+    """
+    Live feed of newly ingested sightings as Server-Sent Events.
+
+    Each `sighting` event carries the sighting as returned by GET /sightings/.
+    A `reset` event means events were dropped (client too slow): refetch, then keep listening.
+    """
+    subscription = sighting_broker.subscribe(hot_only=hotOnly, location_id=locationId)
+
+    async def events():
+        try:
+            # Browsers reconnect after this many milliseconds if the connection drops
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    yield await asyncio.wait_for(subscription.queue.get(), timeout=settings.STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+        finally:
+            sighting_broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # No caching, and no response buffering by reverse proxies (nginx)
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import List, Optional, Union
 from pydantic import AnyHttpUrl, validator
 from pydantic_settings import BaseSettings
 
@@ -22,10 +22,46 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # Async connection pool per API process. Requests no longer hold a thread while waiting
+    # on the database, so the pool (not the threadpool) bounds concurrent queries: size it so
+    # that processes x (DB_POOL_SIZE + DB_MAX_OVERFLOW) stays below the server's max_connections.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
     
     # Auth (Local Dev)
     USE_MOCK_AUTH: bool = False
     MOCK_API_KEY: str = "dev-api-key-123"
+    # Verified device API keys are cached so the key hash is not computed per request;
+    # revocations reach other workers within DEVICE_KEY_CACHE_REFRESH_SECONDS
+    DEVICE_KEY_CACHE_TTL_SECONDS: float = 300.0
+    DEVICE_KEY_CACHE_MAX_ENTRIES: int = 10000
+    DEVICE_KEY_CACHE_REFRESH_SECONDS: float = 2.0
+    # Failed verifications per key id and window before further attempts for that id are
+    # rejected without hashing (a wrong secret would otherwise cost a full key hash each time)
+    DEVICE_KEY_MAX_FAILURES: int = 5
+    DEVICE_KEY_FAILURE_WINDOW_SECONDS: float = 60.0
+    # Admin credential (x-admin-key header) for device registration and revocation;
+    # device management is disabled while it is unset
+    ADMIN_API_KEY: Optional[str] = None
+
+    # Ingestion
+    SIGHTING_BATCH_MAX_SIZE: int = 1000
+    # How often each worker checks whether another worker changed the hotlist
+    HOTLIST_CACHE_REFRESH_SECONDS: float = 2.0
+    # Sightings of a plate further apart than this start a new trip
+    TRIP_GAP_SECONDS: int = 1800
+
+    # Live stream: keep-alive comment interval (proxies drop idle connections) and
+    # how many undelivered events a slow client may have before it is told to refetch
+    STREAM_HEARTBEAT_SECONDS: float = 15.0
+    STREAM_QUEUE_SIZE: int = 1000
+
+    # Read endpoint response cache: how long an entry is served before checking the
+    # data version again, and how many distinct queries are kept per dataset
+    RESPONSE_CACHE_TTL_SECONDS: float = 2.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
 
     class Config:
         case_sensitive = True
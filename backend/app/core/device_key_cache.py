@@ -0,0 +1,151 @@
+import hmac
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app import models
+from app.core.config import settings
+from app.core.security import split_api_key, verify_api_key
+from app.db.data_version import get_version
+
+DEVICE_VERSION_KEY = "devices"
+
+class AuthenticatedDevice:
+    """
+    The device a request's API key belongs to.
+    """
+    __slots__ = ("id", "location_id", "api_key_id")
+
+    def __init__(self, id: UUID, location_id: str, api_key_id: str):
+        self.id = id
+        self.location_id = location_id
+        self.api_key_id = api_key_id
+
+class _Entry:
+    __slots__ = ("device", "key_digest", "expires_at")
+
+    def __init__(self, device: AuthenticatedDevice, key_digest: bytes, expires_at: float):
+        self.device = device
+        self.key_digest = key_digest
+        self.expires_at = expires_at
+
+class _Failures:
+    __slots__ = ("count", "window_start")
+
+    def __init__(self, window_start: float):
+        self.count = 0
+        self.window_start = window_start
+
+class DeviceKeyCache:
+    """
+    Verified device API keys (api_key_id -> device), so the slow key hash is only computed
+    on a miss. An entry matches only the exact key that was verified (compared by SHA-256).
+
+    Entries expire after `ttl` seconds and there are at most `max_entries`. Revocations
+    bump the shared "devices" data version; every worker compares it at most once every
+    `refresh_interval` seconds and drops all entries when it changed, and revocations in
+    this process drop the entry immediately.
+
+    Failures are throttled per key id: after `max_failures` failed verifications (unknown id
+    or wrong secret) within `failure_window` seconds, further cache misses for that id are
+    rejected without a database lookup or key hash until the window ends. Keys already in
+    the cache keep working.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, refresh_interval: float, max_failures: int, failure_window: float):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.refresh_interval = refresh_interval
+        self.max_failures = max_failures
+        self.failure_window = failure_window
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._failures: "OrderedDict[str, _Failures]" = OrderedDict()
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def invalidate(self, api_key_id: str) -> None:
+        with self._lock:
+            self._entries.pop(api_key_id, None)
+
+    def _throttled(self, api_key_id: str, now: float) -> bool:
+        with self._lock:
+            failures = self._failures.get(api_key_id)
+            if failures is None:
+                return False
+            if now - failures.window_start >= self.failure_window:
+                del self._failures[api_key_id]
+                return False
+            return failures.count >= self.max_failures
+
+    def _record_failure(self, api_key_id: str, now: float) -> None:
+        with self._lock:
+            failures = self._failures.get(api_key_id)
+            if failures is None or now - failures.window_start >= self.failure_window:
+                failures = self._failures[api_key_id] = _Failures(now)
+            failures.count += 1
+            self._failures.move_to_end(api_key_id)
+            while len(self._failures) > self.max_entries:
+                self._failures.popitem(last=False)
+
+    async def _ensure_fresh(self, db: AsyncSession) -> None:
+        if self._version is not None and time.monotonic() - self._checked_at < self.refresh_interval:
+            return
+        version = await db.run_sync(get_version, DEVICE_VERSION_KEY)
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            self._checked_at = time.monotonic()
+
+    async def authenticate(self, db: AsyncSession, api_key: str) -> Optional[AuthenticatedDevice]:
+        """
+        :return: The active device the key belongs to, or None if the key is not valid.
+        """
+        parts = split_api_key(api_key)
+        if parts is None:
+            return None
+        api_key_id, secret = parts
+        key_digest = hashlib.sha256(api_key.encode()).digest()
+
+        await self._ensure_fresh(db)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(api_key_id)
+            if entry and entry.expires_at > now and hmac.compare_digest(entry.key_digest, key_digest):
+                self._entries.move_to_end(api_key_id)
+                return entry.device
+
+        if self._throttled(api_key_id, now):
+            return None
+        device = (await db.scalars(
+            select(models.Device).filter(models.Device.api_key_id == api_key_id, models.Device.is_active == True)
+        )).first()
+        # Off the event loop: the hash is deliberately slow
+        if device is None or not await run_in_threadpool(verify_api_key, secret, device.api_key_hash):
+            self._record_failure(api_key_id, now)
+            return None
+
+        authenticated = AuthenticatedDevice(device.id, device.location_id, device.api_key_id)
+        with self._lock:
+            self._failures.pop(api_key_id, None)
+            self._entries[api_key_id] = _Entry(authenticated, key_digest, now + self.ttl)
+            self._entries.move_to_end(api_key_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return authenticated
+
+device_key_cache = DeviceKeyCache(
+    ttl=settings.DEVICE_KEY_CACHE_TTL_SECONDS,
+    max_entries=settings.DEVICE_KEY_CACHE_MAX_ENTRIES,
+    refresh_interval=settings.DEVICE_KEY_CACHE_REFRESH_SECONDS,
+    max_failures=settings.DEVICE_KEY_MAX_FAILURES,
+    failure_window=settings.DEVICE_KEY_FAILURE_WINDOW_SECONDS,
+)
@@ -0,0 +1,90 @@
+import time
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.config import settings
+from app.core.plates import normalize_plate
+from app.db.data_version import get_version
+
+HOTLIST_VERSION_KEY = "hotlists"
+
+class HotlistCache:
+    """
+    Process-wide hotlist lookup (normalized plate -> category).
+
+    Writes in this process are applied immediately. Writes from other workers are
+    picked up by comparing the shared "hotlists" data version at most once every
+    `refresh_interval` seconds, so lookups normally never touch the database.
+    """
+
+    def __init__(self, refresh_interval: float):
+        self.refresh_interval = refresh_interval
+        self._entries: Dict[str, Optional[str]] = {}
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def load(self, db: Session) -> None:
+        """
+        (Re)load the full hotlist from the database.
+        """
+        version = get_version(db, HOTLIST_VERSION_KEY)
+        rows = db.query(models.Hotlist.plate_number, models.Hotlist.category).all()
+        entries = {normalize_plate(plate): category for plate, category in rows}
+        with self._lock:
+            self._entries = entries
+            self._version = version
+            self._checked_at = time.monotonic()
+
+    def _ensure_fresh(self, db: Session) -> None:
+        if self._version is not None and time.monotonic() - self._checked_at < self.refresh_interval:
+            return
+        if self._version is None or get_version(db, HOTLIST_VERSION_KEY) != self._version:
+            self.load(db)
+        else:
+            self._checked_at = time.monotonic()
+
+    def match(self, db: Session, plate_number: str) -> Tuple[bool, Optional[str]]:
+        """
+        :return: (is_hot, hotlist_category) for a plate.
+        """
+        self._ensure_fresh(db)
+        key = normalize_plate(plate_number)
+        entries = self._entries
+        if key in entries:
+            return True, entries[key]
+        return False, None
+
+    def match_many(self, db: Session, plate_numbers: List[str]) -> List[Tuple[bool, Optional[str]]]:
+        """
+        match() for a whole batch, with a single freshness check.
+        """
+        self._ensure_fresh(db)
+        entries = self._entries
+        results = []
+        for plate_number in plate_numbers:
+            key = normalize_plate(plate_number)
+            results.append((True, entries[key]) if key in entries else (False, None))
+        return results
+
+    def apply(self, version: int, plate_number: str, category: Optional[str] = None, removed: bool = False) -> None:
+        """
+        Apply a committed local write. If another worker wrote in between (version gap),
+        the delta is not enough and the cache reloads on the next lookup instead.
+        """
+        with self._lock:
+            if self._version is None or version != self._version + 1:
+                self._version = None
+                return
+            entries = dict(self._entries)
+            if removed:
+                entries.pop(normalize_plate(plate_number), None)
+            else:
+                entries[normalize_plate(plate_number)] = category
+            self._entries = entries
+            self._version = version
+
+hotlist_cache = HotlistCache(refresh_interval=settings.HOTLIST_CACHE_REFRESH_SECONDS)
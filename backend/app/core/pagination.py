@@ -0,0 +1,51 @@
+import json
+import base64
+from datetime import datetime
+from typing import Any, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, Response
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(timestamp: datetime, id: UUID) -> str:
+    """
+    Opaque keyset cursor for the position after (timestamp, id).
+    """
+    raw = json.dumps([timestamp.isoformat(), str(id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, id = json.loads(raw)
+        return datetime.fromisoformat(timestamp), UUID(id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def paginate(db: AsyncSession, statement: Select, response: Response, timestamp_column: Any, id_column: Any,
+                   skip: int, limit: int, cursor: str = None, rows: bool = False) -> list:
+    """
+    Newest-first page of the entities selected by `statement` (or its row tuples, with `rows`,
+    for column selects that include both columns), ordered by (timestamp, id).
+    With a cursor, seeks directly to the page (keyset pagination, constant cost per page, served
+    by a (timestamp, id) index); otherwise falls back to OFFSET `skip`.
+    Sets the next page's cursor in the X-Next-Cursor header when the page is full.
+    """
+    statement = statement.order_by(timestamp_column.desc(), id_column.desc())
+    if cursor:
+        statement = statement.filter(tuple_(timestamp_column, id_column) < tuple_(*decode_cursor(cursor)))
+    else:
+        statement = statement.offset(skip)
+
+    result = await db.execute(statement.limit(limit))
+    items = result.all() if rows else result.scalars().all()
+    if len(items) == limit:
+        last = items[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            getattr(last, timestamp_column.key), getattr(last, id_column.key)
+        )
+    return items
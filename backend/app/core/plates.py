@@ -0,0 +1,10 @@
+import re
+
+_SEPARATORS = re.compile(r"[\s\-]+")
+
+def normalize_plate(plate: str) -> str:
+    """
+    Canonical form of a plate number used for matching: upper case, no spaces or dashes.
+    "ab12 cde" / "AB12-CDE" -> "AB12CDE"
+    """
+    return _SEPARATORS.sub("", plate).upper()
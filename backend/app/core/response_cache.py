@@ -0,0 +1,120 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.data_version import get_version
+
+SIGHTINGS_VERSION_KEY = "sightings"
+
+# Datasets written continuously by ingestion. Bumping a shared version row per write would
+# serialize every ingest transaction on that row and keep the cache permanently invalid,
+# so their version is the current `ttl`-long time bucket instead (no database lookup).
+TIME_BUCKETED_DATASETS = (SIGHTINGS_VERSION_KEY,)
+
+class _Entry:
+    __slots__ = ("version", "body", "etag", "headers", "checked_at")
+
+    def __init__(self, version: int, body: bytes, etag: str, headers: Dict[str, str], checked_at: float):
+        self.version = version
+        self.body = body
+        self.etag = etag
+        self.headers = headers
+        self.checked_at = checked_at
+
+class ResponseCache:
+    """
+    Serialized responses of read endpoints, per dataset ("sightings", "hotlists") and
+    normalized query parameters, with an ETag for conditional GETs.
+
+    An entry is served as-is for `ttl` seconds; after that it is revalidated against the
+    dataset's data version (one primary-key lookup) and recomputed only if the data changed.
+    Writes in this process drop the dataset's entries immediately, so only writes made by
+    other workers can take up to `ttl` seconds to show.
+
+    Time-bucketed datasets are instead recomputed once per `ttl`-long bucket: their writes
+    (local or not) take up to `ttl` seconds to show. Unchanged bodies keep their ETag.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, time_bucketed: Iterable[str] = ()):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.time_bucketed = frozenset(time_bucketed)
+        self._entries: Dict[str, "OrderedDict[Hashable, _Entry]"] = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self, dataset: str) -> None:
+        with self._lock:
+            self._entries.pop(dataset, None)
+
+    async def _version(self, db: AsyncSession, dataset: str) -> int:
+        if dataset in self.time_bucketed:
+            return int(time.time() // self.ttl)
+        return await db.run_sync(get_version, dataset)
+
+    def _get(self, dataset: str, key: Hashable) -> Optional[_Entry]:
+        with self._lock:
+            entries = self._entries.get(dataset)
+            entry = entries.get(key) if entries else None
+            if entry:
+                entries.move_to_end(key)
+            return entry
+
+    def _put(self, dataset: str, key: Hashable, entry: _Entry) -> None:
+        with self._lock:
+            entries = self._entries.setdefault(dataset, OrderedDict())
+            entries[key] = entry
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    async def respond(
+        self,
+        request: Request,
+        db: AsyncSession,
+        dataset: str,
+        params: Dict[str, Any],
+        compute: Callable[[Response], Awaitable[bytes]],
+        media_type: str = "application/json",
+    ) -> Response:
+        """
+        Cached response for a read endpoint.
+        :param params: The endpoint's parsed (normalized) query parameters; with the media type, the cache key.
+        :param compute: Produces the encoded body on a miss; may set headers on the Response it is given.
+        :return: 304 if the client's If-None-Match is current, else the body with its ETag.
+        """
+        key = (media_type, *sorted(params.items()))
+        now = time.monotonic()
+        entry = self._get(dataset, key)
+
+        if entry and now - entry.checked_at >= self.ttl:
+            if await self._version(db, dataset) == entry.version:
+                entry.checked_at = now
+            else:
+                entry = None
+
+        if entry is None:
+            version = await self._version(db, dataset)
+            scratch = Response()
+            body = await compute(scratch)
+            headers = {name: value for name, value in scratch.headers.items() if name != "content-length"}
+            etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            entry = _Entry(version, body, etag, headers, now)
+            self._put(dataset, key, entry)
+
+        # Clients revalidate every time; unchanged data costs a 304 without a body
+        headers = {**entry.headers, "ETag": entry.etag, "Cache-Control": "no-cache"}
+        if entry.etag in (tag.strip() for tag in request.headers.get("if-none-match", "").split(",")):
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type=media_type, headers=headers)
+
+response_cache = ResponseCache(
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    time_bucketed=TIME_BUCKETED_DATASETS,
+)
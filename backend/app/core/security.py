@@ -0,0 +1,53 @@
+import hmac
+import base64
+import hashlib
+import secrets
+from typing import Optional, Tuple
+
+# Device API keys are "<api_key_id>.<secret>": the id locates the device row, only the
+# secret's scrypt hash is stored. scrypt parameters are part of the stored hash.
+_SCRYPT_N = 2 ** 14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _unb64(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+def generate_api_key() -> Tuple[str, str]:
+    """
+    New device API key.
+    :return: (api_key_id, full key to hand to the device once).
+    """
+    api_key_id = secrets.token_hex(8)
+    return api_key_id, f"{api_key_id}.{secrets.token_urlsafe(32)}"
+
+def split_api_key(api_key: str) -> Optional[Tuple[str, str]]:
+    """
+    (api_key_id, secret) of a presented key, or None if it is not in the device key format.
+    """
+    api_key_id, _, secret = api_key.partition(".")
+    if not api_key_id or not secret:
+        return None
+    return api_key_id, secret
+
+def hash_api_key(secret: str) -> str:
+    salt = secrets.token_bytes(16)
+    digest = hashlib.scrypt(secret.encode(), salt=salt, n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P)
+    return f"scrypt${_SCRYPT_N}${_SCRYPT_R}${_SCRYPT_P}${_b64(salt)}${_b64(digest)}"
+
+def verify_api_key(secret: str, stored_hash: str) -> bool:
+    """
+    Check a secret against a stored hash. Deliberately slow (tens of milliseconds).
+    """
+    try:
+        scheme, n, r, p, salt, digest = stored_hash.split("$")
+        if scheme != "scrypt":
+            return False
+        expected = _unb64(digest)
+        actual = hashlib.scrypt(secret.encode(), salt=_unb64(salt), n=int(n), r=int(r), p=int(p), dklen=len(expected))
+    except ValueError:
+        return False
+    return hmac.compare_digest(actual, expected)
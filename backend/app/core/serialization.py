@@ -0,0 +1,100 @@
+import io
+import uuid
+from typing import Any, List, Sequence
+
+import orjson
+from fastapi import Request
+from pydantic import TypeAdapter
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
+from app import models
+
+# Response formats of the sighting list endpoints, chosen by the Accept header
+JSON = "application/json"
+# {"plate_number": [...], "timestamp": [...], ...}: one array per column, keys not repeated per row
+COLUMNAR_JSON = "application/vnd.platewatch.columnar+json"
+# Arrow IPC stream (only if pyarrow is installed)
+ARROW = "application/vnd.apache.arrow.stream"
+
+# Columns of schemas.Sighting in its serialization order; JSON keys are the column names (the aliases)
+SIGHTING_COLUMNS = [
+    "plate_number", "timestamp", "location_id", "vehicle_make", "vehicle_model", "vehicle_color",
+    "direction", "id", "created_at", "is_hot", "hotlist_category",
+]
+
+# Same output as pydantic: UUIDs as strings, UTC datetimes with a "Z" suffix
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+def _default(value: Any) -> Any:
+    # asyncpg returns its own uuid.UUID subclass, which orjson only handles as the exact type
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def sighting_columns(entity: Any = models.Sighting) -> List[Any]:
+    """
+    Columns to select instead of the ORM entity (optionally an alias of it), so rows come back
+    as plain tuples.
+    """
+    return [getattr(entity, name) for name in SIGHTING_COLUMNS]
+
+def negotiate(request: Request, offered: Sequence[str] = (JSON, COLUMNAR_JSON, ARROW)) -> str:
+    """
+    Preferred media type among `offered` according to the Accept header; JSON if none matches.
+    """
+    if pyarrow is None:
+        offered = [media_type for media_type in offered if media_type != ARROW]
+    candidates = []
+    for position, part in enumerate(request.headers.get("accept", "").split(",")):
+        media_type, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type in offered and quality > 0:
+            candidates.append((-quality, position, media_type))
+    return min(candidates)[2] if candidates else JSON
+
+def rows_to_objects(rows: Sequence[Sequence[Any]], keys: Sequence[str] = SIGHTING_COLUMNS) -> List[dict]:
+    return [dict(zip(keys, row)) for row in rows]
+
+def encode_rows(rows: Sequence[Sequence[Any]], media_type: str, keys: Sequence[str] = SIGHTING_COLUMNS) -> bytes:
+    """
+    Encode selected rows (tuples in `keys` order) without building pydantic models.
+    """
+    if media_type == COLUMNAR_JSON:
+        columns = list(zip(*rows)) if rows else [()] * len(keys)
+        return orjson.dumps({key: list(values) for key, values in zip(keys, columns)}, default=_default, option=_ORJSON_OPTIONS)
+    if media_type == ARROW:
+        columns = list(zip(*rows)) if rows else [()] * len(keys)
+        table = pyarrow.table({
+            # Arrow has no UUID type in the default set; send them as strings like the JSON formats
+            key: [str(value) for value in values] if key == "id" else list(values)
+            for key, values in zip(keys, columns)
+        })
+        sink = io.BytesIO()
+        with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue()
+    return encode_json(rows_to_objects(rows, keys))
+
+def encode_json(content: Any) -> bytes:
+    """
+    JSON for plain data (dicts, lists, datetimes, UUIDs) as pydantic would render it.
+    """
+    return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+def dump_model(adapter: TypeAdapter, content: Any) -> bytes:
+    """
+    JSON via the endpoint's pydantic schema (ORM objects or dicts), for responses that are not on the fast path.
+    """
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True), by_alias=True)
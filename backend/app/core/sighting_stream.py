@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from typing import Any, Iterable, List, Optional, Set
+
+from app import schemas
+from app.core.config import settings
+
+# Sent instead of the missed events when a subscriber falls too far behind
+RESET_EVENT = "event: reset\ndata: {}\n\n"
+
+class SightingSubscription:
+    """
+    One live stream client: its filters and the queue of formatted events waiting to be sent.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue_size: int, hot_only: bool, location_id: Optional[str]):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.hot_only = hot_only
+        self.location_id = location_id
+
+    def wants(self, sighting: schemas.Sighting) -> bool:
+        if self.hot_only and not sighting.isHot:
+            return False
+        return self.location_id is None or sighting.locationId == self.location_id
+
+    def deliver(self, event: str) -> None:
+        # Runs on the event loop. A full queue means the client stopped reading:
+        # drop its backlog and tell it to refetch instead of buffering without bound.
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESET_EVENT)
+
+class SightingBroker:
+    """
+    Fans newly committed sightings out to the live stream clients of this process.
+
+    Ingestion endpoints publish from their worker threads; events are handed to each
+    subscriber's event loop, so publishing never blocks on a slow client. Only sightings
+    ingested by this process are seen; with several workers, clients also refetch
+    periodically to pick up the rest.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscriptions: Set[SightingSubscription] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, hot_only: bool = False, location_id: Optional[str] = None) -> SightingSubscription:
+        """
+        Must be called from the event loop that will read the subscription's queue.
+        """
+        subscription = SightingSubscription(asyncio.get_running_loop(), self.queue_size, hot_only, location_id)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: SightingSubscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, sightings: Iterable[Any]) -> None:
+        """
+        Send committed sightings (ORM objects or dicts of column values) to matching subscribers.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        if not subscriptions:
+            return
+
+        # Serialize once, however many clients receive the event
+        events: List[tuple] = []
+        for sighting in sightings:
+            sighting = schemas.Sighting.model_validate(sighting)
+            events.append((sighting, f"event: sighting\ndata: {sighting.model_dump_json(by_alias=True)}\n\n"))
+
+        for subscription in subscriptions:
+            for sighting, event in events:
+                if subscription.wants(sighting):
+                    try:
+                        subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+                    except RuntimeError:
+                        # Event loop already closed (shutdown); the subscription goes with it
+                        self.unsubscribe(subscription)
+                        break
+
+sighting_broker = SightingBroker(queue_size=settings.STREAM_QUEUE_SIZE)
@@ -0,0 +1,37 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+_INSERT = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+def utc_hour(ts: datetime) -> datetime:
+    """
+    Start of the UTC hour containing `ts` (naive timestamps, e.g. read back from SQLite, are UTC).
+    """
+    ts = ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+def increment_counters(db: Session, model: Any, rows: List[Dict[str, Any]], column: str) -> None:
+    """
+    Add each row's `column` value to the counter with the same primary key, creating
+    missing counters, in one upsert (INSERT .. ON CONFLICT DO UPDATE) inside the caller's
+    transaction. Safe under concurrent writers; rows must have distinct keys.
+    Rows are upserted in primary key order, so concurrent batches lock counters in the
+    same order and cannot deadlock each other.
+    """
+    if not rows:
+        return
+    table = model.__table__
+    key_columns = [c.name for c in table.primary_key]
+    rows = sorted(rows, key=lambda row: tuple(row[name] for name in key_columns))
+    stmt = _INSERT[db.get_bind().dialect.name](table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=key_columns,
+        set_={column: table.c[column] + stmt.excluded[column]},
+    )
+    db.execute(stmt, rows)
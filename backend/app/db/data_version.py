@@ -0,0 +1,23 @@
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.data_version import DataVersion
+
+def get_version(db: Session, key: str) -> int:
+    """
+    Current version of a dataset (0 if it was never written).
+    """
+    version = db.query(DataVersion.version).filter(DataVersion.key == key).scalar()
+    return version or 0
+
+def bump_version(db: Session, key: str) -> int:
+    """
+    Increment a dataset's version inside the caller's transaction and return the new value.
+    """
+    result = db.execute(
+        update(DataVersion).where(DataVersion.key == key).values(version=DataVersion.version + 1)
+    )
+    if not result.rowcount:
+        db.add(DataVersion(key=key, version=1))
+        db.flush()
+    return get_version(db, key)
@@ -0,0 +1,22 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.plates import normalize_plate
+from app.models.sighting import Sighting
+
+# FTS5 trigram queries need at least one full trigram
+_MIN_TRIGRAM_LENGTH = 3
+
+def plate_search_filter(db: Session, plate_query: str):
+    """
+    Filter clause for sightings whose plate contains `plate_query`, ignoring case, spaces and dashes.
+    Index-backed: pg_trgm GIN index on PostgreSQL, FTS5 trigram table on SQLite.
+    """
+    needle = normalize_plate(plate_query)
+    if db.get_bind().dialect.name == "sqlite" and len(needle) >= _MIN_TRIGRAM_LENGTH:
+        return text(
+            "sightings.rowid IN (SELECT rowid FROM sightings_plate_search WHERE sightings_plate_search MATCH :needle)"
+        ).bindparams(needle='"' + needle.replace('"', '""') + '"')
+
+    escaped = needle.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return Sighting.plate_normalized.like(f"%{escaped}%", escape="\\")
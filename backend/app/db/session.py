@@ -1,6 +1,34 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+# Async drivers used by the API for each database; DATABASE_URL stays a plain (sync) URL
+_ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+database_url = make_url(settings.DATABASE_URL)
+
+# Sync engine: startup (create_all, cache warm-up) and the maintenance tools
+engine = create_engine(database_url, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _pool_options() -> dict:
+    # SQLite has no server connections to bound; keep SQLAlchemy's default pool for it
+    if database_url.get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+
+# Async engine: request handling
+async_engine = create_async_engine(
+    database_url.set(drivername=f"{database_url.get_backend_name()}+{_ASYNC_DRIVERS[database_url.get_backend_name()]}"),
+    pool_pre_ping=True,
+    **_pool_options(),
+)
+# Objects stay usable after commit (no implicit lazy reloads, which async sessions cannot do)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
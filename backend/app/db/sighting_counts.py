@@ -0,0 +1,40 @@
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.db.counters import increment_counters, utc_hour
+from app.models.sighting import Sighting
+from app.models.sighting_count import SightingHourlyCount
+
+def count_sightings(db: Session, sightings: Iterable[Tuple[datetime, bool, Optional[str]]]) -> None:
+    """
+    Add newly ingested sightings to the hourly counters, inside the caller's transaction.
+    :param sightings: (timestamp, is_hot, hotlist_category) tuples.
+    """
+    counts = Counter((utc_hour(ts), bool(is_hot), category or "") for ts, is_hot, category in sightings)
+    increment_counters(db, SightingHourlyCount, [
+        {"hour": hour, "is_hot": is_hot, "hotlist_category": category, "sighting_count": count}
+        for (hour, is_hot, category), count in counts.items()
+    ], "sighting_count")
+
+def rebuild_sighting_counts(db: Session, chunk_size: int = 10000) -> int:
+    """
+    Recompute the hourly counters from all sightings (backfill). Streams the sightings table;
+    the caller commits.
+    :return: Number of sightings counted.
+    """
+    db.query(SightingHourlyCount).delete()
+
+    counted = 0
+    chunk = []
+    rows = db.query(Sighting.timestamp, Sighting.is_hot, Sighting.hotlist_category).yield_per(chunk_size)
+    for row in rows:
+        chunk.append(tuple(row))
+        if len(chunk) >= chunk_size:
+            count_sightings(db, chunk)
+            counted += len(chunk)
+            chunk = []
+    count_sightings(db, chunk)
+    return counted + len(chunk)
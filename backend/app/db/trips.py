@@ -0,0 +1,138 @@
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.counters import increment_counters, utc_hour
+from app.models.sighting import Sighting
+from app.models.trip import Trip, OdHourlyCount
+
+OdKey = Tuple[str, str, datetime]
+
+# Transaction-scoped lock per plate, taken in plate order so concurrent batches cannot deadlock.
+# Row locks cannot do this: a plate's first sighting has no trip row to lock yet.
+_LOCK_PLATES = text(
+    "SELECT pg_advisory_xact_lock(hashtextextended(plate, 0)) "
+    "FROM (SELECT DISTINCT plate FROM unnest(CAST(:plates AS text[])) AS plate ORDER BY plate) AS plates"
+)
+
+def _utc(ts: datetime) -> datetime:
+    # Naive timestamps (e.g. read back from SQLite) are UTC
+    if ts.tzinfo is None:
+        return ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc)
+
+def _od_key(trip: Trip) -> Optional[OdKey]:
+    """
+    OD counter bucket a trip contributes to, or None if it does not count (yet).
+    """
+    if trip.sighting_count < 2 or trip.origin_location_id == trip.destination_location_id:
+        return None
+    return trip.origin_location_id, trip.destination_location_id, utc_hour(trip.started_at)
+
+def record_sightings(db: Session, sightings: Iterable[Tuple[str, datetime, str]]) -> None:
+    """
+    Extend or open the trips of newly ingested sightings and update the OD counters,
+    inside the caller's transaction.
+    :param sightings: (plate_number, timestamp, location_id) tuples.
+
+    A sighting joins the plate's trip it falls within TRIP_GAP_SECONDS of (late arrivals
+    can move a trip's origin earlier); otherwise it starts a new trip.
+    """
+    gap = timedelta(seconds=settings.TRIP_GAP_SECONDS)
+    items = sorted(((plate, _utc(ts), location) for plate, ts, location in sightings), key=lambda item: item[1])
+    if not items:
+        return
+
+    # Serialize ingestion per plate until commit, so two first sightings of a plate arriving
+    # at once cannot both open a trip. SQLite already serializes writers.
+    plates = sorted({plate for plate, _, _ in items})
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(_LOCK_PLATES, {"plates": plates})
+
+    # Trips these sightings could extend
+    candidates = (
+        db.query(Trip)
+        .filter(Trip.plate_number.in_(plates), Trip.ended_at >= items[0][1] - gap)
+        .order_by(Trip.started_at)
+        .all()
+    )
+    trips_by_plate: Dict[str, List[Trip]] = defaultdict(list)
+    for trip in candidates:
+        trips_by_plate[trip.plate_number].append(trip)
+
+    deltas: Dict[OdKey, int] = defaultdict(int)
+    for plate, ts, location in items:
+        trips = trips_by_plate[plate]
+        trip = next(
+            (t for t in reversed(trips) if _utc(t.started_at) - gap <= ts <= _utc(t.ended_at) + gap),
+            None,
+        )
+        if trip is None:
+            trip = Trip(
+                plate_number=plate,
+                origin_location_id=location,
+                destination_location_id=location,
+                started_at=ts,
+                ended_at=ts,
+                sighting_count=1,
+            )
+            db.add(trip)
+            trips.append(trip)
+            continue
+
+        old_key = _od_key(trip)
+        if ts < _utc(trip.started_at):
+            trip.origin_location_id = location
+            trip.started_at = ts
+        if ts >= _utc(trip.ended_at):
+            trip.destination_location_id = location
+            trip.ended_at = ts
+        trip.sighting_count += 1
+
+        new_key = _od_key(trip)
+        if new_key != old_key:
+            if old_key:
+                deltas[old_key] -= 1
+            if new_key:
+                deltas[new_key] += 1
+
+    increment_counters(db, OdHourlyCount, [
+        {"origin_location_id": origin, "destination_location_id": destination, "hour": hour, "trip_count": delta}
+        for (origin, destination, hour), delta in deltas.items()
+        if delta
+    ], "trip_count")
+
+def rebuild_trips(db: Session, chunk_size: int = 10000) -> int:
+    """
+    Recompute trips and OD counters from all sightings (backfill, or after changing
+    TRIP_GAP_SECONDS). Streams the sightings table; the caller commits.
+    :return: Number of sightings replayed.
+    """
+    db.query(OdHourlyCount).delete()
+    db.query(Trip).delete()
+
+    replayed = 0
+    chunk = []
+    rows = (
+        db.query(Sighting.plate_number, Sighting.timestamp, Sighting.location_id)
+        .order_by(Sighting.timestamp)
+        .yield_per(chunk_size)
+    )
+    for row in rows:
+        chunk.append(tuple(row))
+        if len(chunk) >= chunk_size:
+            record_sightings(db, chunk)
+            replayed += len(chunk)
+            chunk = []
+            # Trips are re-read per chunk; don't accumulate them in the identity map
+            db.flush()
+            db.expunge_all()
+    if chunk:
+        record_sightings(db, chunk)
+        replayed += len(chunk)
+        db.flush()
+    return replayed
@@ -2,7 +2,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
-from app.db.session import engine
+from app.db.session import engine, SessionLocal, async_engine
+from app.core.hotlist_cache import hotlist_cache
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.models.base import Base
 from app import models
 
@@ -27,8 +29,23 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Cursor pagination header must be readable by the web app
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+@app.on_event("startup")
+def warm_caches():
+    # Load the hotlist once so the first sightings don't pay for it
+    db = SessionLocal()
+    try:
+        hotlist_cache.load(db)
+    finally:
+        db.close()
+
+@app.on_event("shutdown")
+async def close_connections():
+    await async_engine.dispose()
+
 @app.get("/")
 def root():
     return {"message": "Welcome to Plate-Watch API"}
@@ -1,3 +1,6 @@
 from app.models.sighting import Sighting
 from app.models.device import Device
-from app.models.hotlist import Hotlist
+from app.models.hotlist import Hotlist, HotlistChange
+from app.models.data_version import DataVersion
+from app.models.trip import Trip, OdHourlyCount
+from app.models.sighting_count import SightingHourlyCount
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, Integer
+
+from app.models.base import Base
+
+class DataVersion(Base):
+    """
+    Monotonic version counter per dataset (e.g. "hotlists"), bumped in the same
+    transaction as every write so that per-process caches can detect changes.
+    """
+    __tablename__ = "data_versions"
+
+    key = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
@@ -1,14 +1,35 @@
 import uuid
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Integer, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 from .base import Base
 
 class Hotlist(Base):
     __tablename__ = "hotlists"
+    __table_args__ = (
+        # Newest-first keyset pagination
+        Index("ix_hotlists_created_at_id", "created_at", "id"),
+        # One entry per plate as ingestion and the edge match it
+        Index("ix_hotlists_plate_normalized", "plate_normalized", unique=True),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     plate_number = Column(String, index=True, nullable=False)
+    # normalize_plate(plate_number): "AB12 CDE" and "AB12-CDE" are the same entry
+    plate_normalized = Column(String, nullable=True)
     description = Column(String, nullable=True)
     category = Column(String, default="info")
     created_at = Column(DateTime, default=datetime.utcnow)
+
+class HotlistChange(Base):
+    """
+    Change log of the hotlist, keyed by the "hotlists" data version of each write.
+    Lets edge devices sync incrementally.
+    """
+    __tablename__ = "hotlist_changes"
+
+    version = Column(Integer, primary_key=True)
+    plate_number = Column(String, nullable=False)
+    category = Column(String, nullable=True)
+    deleted = Column(Boolean, default=False, nullable=False)
+    changed_at = Column(DateTime, default=datetime.utcnow)
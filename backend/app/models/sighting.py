@@ -1,12 +1,28 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, func, Boolean
+from sqlalchemy import Column, String, DateTime, func, Boolean, Index, DDL, event
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.models.base import Base
 
 class Sighting(Base):
+    __table_args__ = (
+        # Sightings at a location in a time range (convoy analysis)
+        Index("ix_sightings_location_id_timestamp", "location_id", "timestamp"),
+        # Newest-first keyset pagination
+        Index("ix_sightings_timestamp_id", "timestamp", "id"),
+        # Partial plate search (trigram GIN, PostgreSQL only; SQLite uses the FTS5 table below)
+        Index(
+            "ix_sightings_plate_normalized_trgm",
+            "plate_normalized",
+            postgresql_using="gin",
+            postgresql_ops={"plate_normalized": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     plate_number = Column(String(20), nullable=False, index=True)
+    # normalize_plate(plate_number): what partial plate searches match against
+    plate_normalized = Column(String(20), nullable=True)
     timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
     location_id = Column(String(100), nullable=False, index=True)
     is_hot = Column(Boolean, default=False)
@@ -16,3 +32,31 @@ class Sighting(Base):
     vehicle_color = Column(String, nullable=True)
     direction = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+# Trigram support for the partial plate search index
+event.listen(
+    Sighting.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+# SQLite fallback: an FTS5 trigram index over plate_normalized, kept in sync by triggers
+for statement in (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS sightings_plate_search USING fts5("
+    "plate_normalized, content='sightings', content_rowid='rowid', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS sightings_plate_search_insert AFTER INSERT ON sightings BEGIN "
+    "INSERT INTO sightings_plate_search(rowid, plate_normalized) VALUES (new.rowid, new.plate_normalized); END",
+    "CREATE TRIGGER IF NOT EXISTS sightings_plate_search_delete AFTER DELETE ON sightings BEGIN "
+    "INSERT INTO sightings_plate_search(sightings_plate_search, rowid, plate_normalized) "
+    "VALUES ('delete', old.rowid, old.plate_normalized); END",
+    "CREATE TRIGGER IF NOT EXISTS sightings_plate_search_update AFTER UPDATE OF plate_normalized ON sightings BEGIN "
+    "INSERT INTO sightings_plate_search(sightings_plate_search, rowid, plate_normalized) "
+    "VALUES ('delete', old.rowid, old.plate_normalized); "
+    "INSERT INTO sightings_plate_search(rowid, plate_normalized) VALUES (new.rowid, new.plate_normalized); END",
+):
+    event.listen(Sighting.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(
+    Sighting.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS sightings_plate_search").execute_if(dialect="sqlite"),
+)
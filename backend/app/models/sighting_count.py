@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, DateTime, Integer, Boolean
+
+from app.models.base import Base
+
+class SightingHourlyCount(Base):
+    """
+    Number of sightings per hour, hot flag and hotlist category ("" when none).
+    Maintained at ingestion time (see app.db.sighting_counts) so stats never scan sightings.
+    """
+    __tablename__ = "sighting_hourly_counts"
+
+    hour = Column(DateTime(timezone=True), primary_key=True)
+    is_hot = Column(Boolean, primary_key=True)
+    hotlist_category = Column(String, primary_key=True, default="")
+    sighting_count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,35 @@
+import uuid
+from sqlalchemy import Column, String, DateTime, Integer, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+
+class Trip(Base):
+    """
+    A plate's journey: consecutive sightings no more than TRIP_GAP_SECONDS apart.
+    Maintained at ingestion time (see app.db.trips).
+    """
+    __table_args__ = (
+        # Open trips of a plate
+        Index("ix_trips_plate_number_ended_at", "plate_number", "ended_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    plate_number = Column(String(20), nullable=False)
+    origin_location_id = Column(String(100), nullable=False)
+    destination_location_id = Column(String(100), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    ended_at = Column(DateTime(timezone=True), nullable=False)
+    sighting_count = Column(Integer, nullable=False, default=1)
+
+class OdHourlyCount(Base):
+    """
+    Number of trips per (origin, destination, hour the trip started).
+    Only trips with at least two sightings and distinct endpoints are counted.
+    """
+    __tablename__ = "od_hourly_counts"
+
+    origin_location_id = Column(String(100), primary_key=True)
+    destination_location_id = Column(String(100), primary_key=True)
+    hour = Column(DateTime(timezone=True), primary_key=True)
+    trip_count = Column(Integer, nullable=False, default=0)
@@ -1,3 +1,4 @@
-from .sighting import Sighting, SightingCreate, SightingBase, SightingStats
-from .device import Device, DeviceCreate, DeviceBase
-from .hotlist import Hotlist, HotlistCreate, HotlistBase
+from .sighting import Sighting, SightingCreate, SightingBase, SightingStats, SightingStatsBucket, SightingBatchItem, SightingBatchResult
+from .device import Device, DeviceCreate, DeviceBase, DeviceWithKey
+from .hotlist import Hotlist, HotlistCreate, HotlistBase, HotlistChangeEntry, HotlistChanges
+from .analytics import ConvoyGroup
@@ -0,0 +1,8 @@
+from typing import List
+from pydantic import BaseModel
+
+from .sighting import Sighting
+
+class ConvoyGroup(BaseModel):
+    leader_sighting: Sighting
+    followers: List[Sighting]
@@ -25,3 +25,7 @@ class Device(DeviceBase):
     class Config:
         from_attributes = True
         populate_by_name = True
+
+# Registration result: the only time the full API key is returned
+class DeviceWithKey(Device):
+    apiKey: str = Field(..., alias="api_key")
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 from pydantic import BaseModel
@@ -17,3 +17,14 @@ class Hotlist(HotlistBase):
 
     class Config:
         from_attributes = True
+
+class HotlistChangeEntry(BaseModel):
+    plate_number: str
+    category: Optional[str] = None
+    deleted: bool = False
+
+class HotlistChanges(BaseModel):
+    version: int
+    # True when `changes` is a full snapshot that replaces the client's copy
+    full: bool
+    changes: List[HotlistChangeEntry]
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from pydantic import BaseModel, Field
 
@@ -31,8 +31,29 @@ class Sighting(SightingBase):
         from_attributes = True
         populate_by_name = True
 
+# Per-item result of a batch insert
+class SightingBatchItem(BaseModel):
+    index: int
+    id: UUID
+    isHot: bool = Field(False, alias="is_hot")
+    hotlistCategory: Optional[str] = Field(None, alias="hotlist_category")
+
+    class Config:
+        populate_by_name = True
+
+class SightingBatchResult(BaseModel):
+    created: int
+    items: List[SightingBatchItem]
+
+class SightingStatsBucket(BaseModel):
+    start: datetime
+    total_sightings: int
+    total_alerts: int
+
 class SightingStats(BaseModel):
     total_sightings: int
     total_alerts: int
     alerts_by_category: dict[str, int]
+    # Per hour/day breakdown, only when requested
+    buckets: Optional[List[SightingStatsBucket]] = None
 
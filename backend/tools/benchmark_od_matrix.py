@@ -0,0 +1,145 @@
+import os
+import sys
+import time
+import uuid
+import random
+import argparse
+import tracemalloc
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert, func
+from sqlalchemy.orm import sessionmaker
+
+# Ensure we can import the app package regardless of where this script is run
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# The app settings require a DATABASE_URL; the benchmark uses its own engine
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app import models
+from app.core.config import settings
+from app.models.base import Base
+from app.db.trips import rebuild_trips
+from app.api.v1.endpoints.analytics import od_matrix_query
+
+START = datetime(2025, 1, 1)
+
+def populate(engine, rows, plates, locations, days, chunk_size=50000):
+    """
+    Fill the sightings table with `rows` random sightings over `days` days.
+    """
+    random.seed(42)
+    plate_numbers = [f"BM{i:07d}" for i in range(plates)]
+    location_ids = [f"LOC-{i:03d}" for i in range(locations)]
+    span = days * 86400
+
+    with engine.begin() as conn:
+        for offset in range(0, rows, chunk_size):
+            conn.execute(insert(models.Sighting), [
+                {
+                    "id": uuid.uuid4(),
+                    "plate_number": random.choice(plate_numbers),
+                    "timestamp": START + timedelta(seconds=random.randrange(span)),
+                    "location_id": random.choice(location_ids),
+                }
+                for _ in range(min(chunk_size, rows - offset))
+            ])
+            print(f"\r  inserted {min(offset + chunk_size, rows):,}/{rows:,}", end="", flush=True)
+    print()
+
+def scan_od_matrix(db):
+    """
+    Single query over the sightings table: first/last location per plate via window functions.
+    """
+    plate_trip = {"partition_by": models.Sighting.plate_number, "order_by": (models.Sighting.timestamp, models.Sighting.id)}
+    trips = db.query(
+        func.first_value(models.Sighting.location_id).over(**plate_trip, rows=(None, None)).label("origin"),
+        func.last_value(models.Sighting.location_id).over(**plate_trip, rows=(None, None)).label("destination"),
+        func.row_number().over(**plate_trip).label("position"),
+        func.count().over(partition_by=models.Sighting.plate_number).label("sightings"),
+    ).subquery()
+    rows = (
+        db.query(trips.c.origin, trips.c.destination, func.count())
+        .filter(trips.c.position == 1, trips.c.sightings > 1, trips.c.origin != trips.c.destination)
+        .group_by(trips.c.origin, trips.c.destination)
+        .all()
+    )
+    return [{"origin": o, "destination": d, "count": c} for o, d, c in rows]
+
+def legacy_od_matrix(db, start_date=None, end_date=None):
+    """
+    Original implementation: load every sighting as an ORM object and walk them in Python.
+    (Ordered by id within equal timestamps, like the SQL version, so results are comparable.)
+    """
+    query = db.query(models.Sighting).order_by(models.Sighting.plate_number, models.Sighting.timestamp, models.Sighting.id)
+    if start_date:
+        query = query.filter(models.Sighting.timestamp >= start_date)
+    if end_date:
+        query = query.filter(models.Sighting.timestamp <= end_date)
+
+    trips = {}
+    current_plate = first = last = None
+    for sighting in query.all() + [None]:
+        if sighting is None or sighting.plate_number != current_plate:
+            if current_plate and first is not last and first.location_id != last.location_id:
+                key = (first.location_id, last.location_id)
+                trips[key] = trips.get(key, 0) + 1
+            if sighting is None:
+                break
+            current_plate, first, last = sighting.plate_number, sighting, sighting
+        else:
+            last = sighting
+    return [{"origin": o, "destination": d, "count": c} for (o, d), c in trips.items()]
+
+def measure(name, fn):
+    tracemalloc.start()
+    start = time.time()
+    result = fn()
+    elapsed = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {name:<30} {elapsed:8.2f}s   peak Python memory {peak / 1e6:9.1f} MB")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the OD matrix query on a synthetic sightings table")
+    parser.add_argument("--database-url", default="sqlite:///./od_bench.db",
+                        help="Scratch database (its sightings table is filled with synthetic data)")
+    parser.add_argument("--rows", type=int, default=1000000, help="Synthetic sightings (e.g. 10000000)")
+    parser.add_argument("--plates", type=int, default=200000)
+    parser.add_argument("--locations", type=int, default=50)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--skip-populate", action="store_true", help="Reuse data from a previous run")
+    parser.add_argument("--skip-legacy", action="store_true", help="Don't run the original implementation")
+    args = parser.parse_args()
+
+    # One trip per plate over the whole range, so all implementations compute the same matrix
+    settings.TRIP_GAP_SECONDS = args.days * 86400
+
+    tables = [models.Sighting.__table__, models.Trip.__table__, models.OdHourlyCount.__table__]
+    engine = create_engine(args.database_url)
+    db = sessionmaker(bind=engine)()
+    if not args.skip_populate:
+        Base.metadata.drop_all(engine, tables=tables)
+        Base.metadata.create_all(engine, tables=tables)
+        print(f"Populating {args.rows:,} sightings ({args.plates:,} plates, {args.locations} locations, {args.days} days)")
+        populate(engine, args.rows, args.plates, args.locations, args.days)
+        measure("Trip maintenance (backfill)", lambda: rebuild_trips(db))
+        db.commit()
+
+    result = measure("Pre-aggregated OD counters", lambda: [
+        {"origin": o, "destination": d, "count": c} for o, d, c in db.execute(od_matrix_query()).all()
+    ])
+    key = lambda r: (r["origin"], r["destination"])
+    scan = measure("SQL window functions (scan)", lambda: scan_od_matrix(db))
+    print(f"  results match: {sorted(result, key=key) == sorted(scan, key=key)}")
+    if not args.skip_legacy:
+        legacy = measure("ORM load + Python walk", lambda: legacy_od_matrix(db))
+        db.expunge_all()
+        print(f"  results match: {sorted(result, key=key) == sorted(legacy, key=key)}")
+    db.close()
+
+if __name__ == "__main__":
+    main()
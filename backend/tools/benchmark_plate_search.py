@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+import uuid
+import random
+import string
+import argparse
+import statistics
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+# Ensure we can import the app package regardless of where this script is run
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# The app settings require a DATABASE_URL; the benchmark uses its own engine
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app import models
+from app.core.plates import normalize_plate
+from app.db.plate_search import plate_search_filter
+
+START = datetime(2025, 1, 1)
+
+def random_plate():
+    # UK-style "AB12 CDE"
+    letters = string.ascii_uppercase
+    return (
+        "".join(random.choices(letters, k=2)) + f"{random.randrange(100):02d} "
+        + "".join(random.choices(letters, k=3))
+    )
+
+def populate(engine, rows, chunk_size=50000):
+    random.seed(42)
+    plates = [random_plate() for _ in range(max(1, rows // 5))]
+    table = models.Sighting.__table__
+    table.drop(engine, checkfirst=True)
+    table.create(engine)
+
+    for offset in range(0, rows, chunk_size):
+        batch = []
+        for _ in range(min(chunk_size, rows - offset)):
+            plate = random.choice(plates)
+            batch.append({
+                "id": uuid.uuid4(),
+                "plate_number": plate,
+                "plate_normalized": normalize_plate(plate),
+                "timestamp": START + timedelta(seconds=random.randrange(30 * 86400)),
+                "location_id": f"LOC-{random.randrange(50):03d}",
+            })
+        with engine.begin() as conn:
+            conn.execute(insert(models.Sighting), batch)
+        print(f"\r  inserted {min(offset + chunk_size, rows):,}/{rows:,}", end="", flush=True)
+    print()
+    return plates
+
+def measure(name, db, make_filter, needles, limit):
+    latencies = []
+    for needle in needles:
+        start = time.perf_counter()
+        (
+            db.query(models.Sighting)
+            .filter(make_filter(needle))
+            .order_by(models.Sighting.timestamp.desc())
+            .limit(limit)
+            .all()
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        db.expunge_all()
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"  {name:<38} median {statistics.median(latencies):8.2f} ms   p95 {p95:8.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark partial plate search on a synthetic sightings table")
+    parser.add_argument("--database-url", default="sqlite:///./plate_search_bench.db",
+                        help="Scratch database (its sightings table is replaced with synthetic data)")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=100, help="Page size, as in /sightings/")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    print(f"Populating {args.rows:,} sightings")
+    plates = populate(engine, args.rows)
+
+    # Partial searches as typed into the search box: 4 characters from inside a plate
+    random.seed(7)
+    needles = []
+    for _ in range(args.queries):
+        plate = normalize_plate(random.choice(plates))
+        start = random.randrange(len(plate) - 3)
+        needles.append(plate[start:start + 4])
+
+    db = sessionmaker(bind=engine)()
+    print(f"{args.queries} partial plate searches, e.g. {needles[:3]}:")
+    measure("ILIKE '%...%' on plate_number (before)", db,
+            lambda needle: models.Sighting.plate_number.ilike(f"%{needle}%"), needles, args.limit)
+    measure("Trigram index on plate_normalized", db,
+            lambda needle: plate_search_filter(db, needle), needles, args.limit)
+    db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+from datetime import timedelta
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker, aliased
+
+# Ensure we can import the app package regardless of where this script is run
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# The app settings require a DATABASE_URL; the benchmark uses its own engine
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app import models, schemas
+from app.api.v1.endpoints.analytics import _convoy_join
+from app.core.serialization import (
+    ARROW, COLUMNAR_JSON, JSON, SIGHTING_COLUMNS, encode_json, encode_rows, pyarrow, sighting_columns,
+)
+
+def fastapi_response_model(adapter, content):
+    """
+    What FastAPI does with a response_model: validate, dump to Python, then json.dumps (JSONResponse).
+    """
+    data = adapter.dump_python(adapter.validate_python(content, from_attributes=True), mode="json", by_alias=True)
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+def measure(name, fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    print(f"    {name:<44} median {statistics.median(timings):8.2f} ms   {len(body) / 1024:8.1f} KiB")
+    return body
+
+def bench_page(db, limit, repeat):
+    adapter = TypeAdapter(List[schemas.Sighting])
+    order = (models.Sighting.timestamp.desc(), models.Sighting.id.desc())
+
+    def orm():
+        db.expunge_all()
+        return db.scalars(select(models.Sighting).order_by(*order).limit(limit)).all()
+
+    def rows():
+        return db.execute(select(*sighting_columns()).order_by(*order).limit(limit)).all()
+
+    print(f"  /sightings/ page of {limit}")
+    before = measure("ORM + response_model (before)", lambda: fastapi_response_model(adapter, orm()), repeat)
+    after = measure("column tuples + orjson (application/json)", lambda: encode_rows(rows(), JSON), repeat)
+    measure("column tuples + orjson (columnar JSON)", lambda: encode_rows(rows(), COLUMNAR_JSON), repeat)
+    if pyarrow is not None:
+        measure("column tuples + Arrow IPC", lambda: encode_rows(rows(), ARROW), repeat)
+    print(f"    identical JSON: {before == after}")
+
+def bench_convoy(db, plate_number, window_seconds, repeat):
+    adapter = TypeAdapter(List[schemas.ConvoyGroup])
+    window = timedelta(seconds=window_seconds)
+    dialect = db.get_bind().dialect.name
+
+    def statement(columns):
+        leader, follower = aliased(models.Sighting), aliased(models.Sighting)
+        page = (
+            select(leader.id)
+            .filter(leader.plate_number == plate_number)
+            .filter(select(follower.id).where(_convoy_join(leader, follower, plate_number, window, dialect)).exists())
+            .order_by(leader.timestamp.desc(), leader.id)
+            .limit(100)
+            .subquery()
+        )
+        page_leader, page_follower = aliased(models.Sighting), aliased(models.Sighting)
+        entities = (*sighting_columns(page_leader), *sighting_columns(page_follower)) if columns else (page_leader, page_follower)
+        return (
+            select(*entities)
+            .join(page, page.c.id == page_leader.id)
+            .join(page_follower, _convoy_join(page_leader, page_follower, plate_number, window, dialect))
+            .order_by(page_leader.timestamp.desc(), page_leader.id, page_follower.timestamp)
+        )
+
+    def orm():
+        db.expunge_all()
+        results = []
+        for sighting, follower_sighting in db.execute(statement(columns=False)).all():
+            if not results or results[-1]["leader_sighting"] is not sighting:
+                results.append({"leader_sighting": sighting, "followers": []})
+            results[-1]["followers"].append(follower_sighting)
+        return fastapi_response_model(adapter, results)
+
+    def rows():
+        width, id_index = len(SIGHTING_COLUMNS), SIGHTING_COLUMNS.index("id")
+        results = []
+        for row in db.execute(statement(columns=True)).all():
+            if not results or results[-1]["leader_sighting"]["id"] != row[id_index]:
+                results.append({"leader_sighting": dict(zip(SIGHTING_COLUMNS, row[:width])), "followers": []})
+            results[-1]["followers"].append(dict(zip(SIGHTING_COLUMNS, row[width:])))
+        return encode_json(results)
+
+    print(f"  /analytics/convoy for {plate_number} (window {window_seconds} s)")
+    before = measure("ORM + response_model (before)", orm, repeat)
+    after = measure("column tuples + orjson", rows, repeat)
+    print(f"    identical JSON: {before == after}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark response serialization paths on an existing sightings table")
+    parser.add_argument("--database-url", required=True, help="Database with sightings (e.g. a local copy)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--convoy-plate", help="Plate for the convoy benchmark (default: the most sighted plate)")
+    parser.add_argument("--convoy-window", type=int, default=3600, help="Convoy window in seconds")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    db = sessionmaker(bind=engine)()
+    for limit in (100, 1000):
+        bench_page(db, limit, args.repeat)
+
+    plate_number = args.convoy_plate or db.execute(
+        select(models.Sighting.plate_number).group_by(models.Sighting.plate_number)
+        .order_by(func.count().desc()).limit(1)
+    ).scalar()
+    bench_convoy(db, plate_number, args.convoy_window, args.repeat)
+    db.close()
+
+if __name__ == "__main__":
+    main()
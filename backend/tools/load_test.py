@@ -0,0 +1,89 @@
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+def sighting_payload():
+    return {
+        "plate_number": f"LT{random.randrange(100000):05d}",
+        "timestamp": (START + timedelta(seconds=random.randrange(30 * 86400))).isoformat(),
+        "location_id": f"LOC-{random.randrange(50):03d}",
+    }
+
+def make_request(client, target, skip_range):
+    """
+    One request of the given scenario. GETs use a random `skip`, so every request misses the
+    response cache and reaches the database.
+    """
+    if target == "read":
+        return client.get("/sightings/", params={"skip": random.randrange(skip_range), "limit": 50})
+    if target == "search":
+        return client.get("/sightings/", params={"plateNumber": f"{random.randrange(1000):03d}", "skip": random.randrange(50)})
+    if target == "ingest":
+        return client.post("/sightings/", json=sighting_payload())
+    raise ValueError(target)
+
+async def worker(client, scenario, deadline, skip_range, latencies, errors):
+    while time.perf_counter() < deadline:
+        target = random.choice(scenario)
+        start = time.perf_counter()
+        try:
+            response = await make_request(client, target, skip_range)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            ok = False
+        if ok:
+            latencies.append(time.perf_counter() - start)
+        else:
+            errors.append(target)
+
+async def run(args):
+    scenario = args.scenario.split(",")
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.api_url, headers={"x-api-key": args.api_key},
+                                 limits=limits, timeout=60) as client:
+        # Warm up connections and caches before measuring
+        await asyncio.gather(*(make_request(client, "read", args.skip_range) for _ in range(args.concurrency)))
+
+        latencies, errors = [], []
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            worker(client, scenario, deadline, args.skip_range, latencies, errors) for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    result = {
+        "scenario": args.scenario,
+        "concurrency": args.concurrency,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 1) if latencies else None,
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 1) if latencies else None,
+    }
+    print(json.dumps(result))
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load test of a running backend: requests/sec and latency percentiles")
+    parser.add_argument("--api-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--api-key", default="dev-api-key-123")
+    parser.add_argument("--scenario", default="read,read,read,search,ingest",
+                        help="Comma-separated mix of requests: read, search, ingest")
+    parser.add_argument("--concurrency", type=int, default=64, help="Simultaneous in-flight requests")
+    parser.add_argument("--duration", type=float, default=20.0, help="Measured seconds")
+    parser.add_argument("--skip-range", type=int, default=5000, help="Random OFFSET range for reads")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
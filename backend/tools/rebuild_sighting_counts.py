@@ -0,0 +1,30 @@
+import os
+import sys
+import time
+import argparse
+
+# Ensure we can import the app package regardless of where this script is run
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from app.db.session import SessionLocal
+from app.db.sighting_counts import rebuild_sighting_counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute the hourly sighting counters behind /sightings/stats")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Sightings counted per upsert")
+    args = parser.parse_args()
+
+    print("Rebuilding sighting counters...")
+    start = time.time()
+    db = SessionLocal()
+    try:
+        counted = rebuild_sighting_counts(db, chunk_size=args.chunk_size)
+        db.commit()
+    finally:
+        db.close()
+    print(f"Counted {counted:,} sightings in {time.time() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import os
+import sys
+import time
+import argparse
+
+# Ensure we can import the app package regardless of where this script is run
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.db.trips import rebuild_trips
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute trips and OD counters from the sightings table")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Sightings replayed per flush")
+    args = parser.parse_args()
+
+    print(f"Rebuilding trips (gap threshold {settings.TRIP_GAP_SECONDS}s)...")
+    start = time.time()
+    db = SessionLocal()
+    try:
+        replayed = rebuild_trips(db, chunk_size=args.chunk_size)
+        db.commit()
+    finally:
+        db.close()
+    print(f"Replayed {replayed:,} sightings in {time.time() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,15 @@ ENABLE_POSITIONAL_VOTING    = True # Check for consensus character-by-character
 ENABLE_CHAR_CORRECTION      = True # Fix common OCR errors (0->O, 1->I, etc.)
 ENABLE_OCR_LOGIC_LAYER      = True # Enable internal Logic Reader (Auto-correct G->6, etc. in Reader)
 ENABLE_STRICT_REGEX         = True # Discard plates that don't match UK format
+ENABLE_EARLY_FINALIZATION   = True # Finalize a vehicle (and stop OCRing it) once enough confident reads agree
+
+# --- Vote History ---
+MAX_READ_HISTORY = 20         # Raw reads kept per vehicle (top-K by score); votes are accumulated incrementally
+EVICTION_GRACE_FRAMES = 300   # Frames a finalized vehicle is remembered before its track ID can be reused
+
+# --- Early Finalization ---
+SETTLE_MIN_READS = 3          # Agreeing high-confidence reads needed to settle a track
+SETTLE_MIN_CONFIDENCE = 0.9   # Min OCR confidence for a read to count towards settling
 
 # Vehicle Colors (BGR)
 COLOR_CAR = (0, 255, 0)      # Green
@@ -1,4 +1,5 @@
 import re
+import heapq
 import cv2
 from collections import Counter
 import anpr_core.config as config
@@ -50,22 +51,11 @@ def validate_and_clean_plate(text):
             return True, formatted
         return True, text # Return as-is if no validation enforced
 
-def process_plate_detection(frame, vehicle_box, plate_detector, reader, annotated_frame):
+def _crop_plate(car_crop, plate_box):
     """
-    Detects plate on the vehicle crop, pads it, and performs OCR.
-    Returns valid text or None.
+    Apply 10% padding to a plate box and crop it from the vehicle crop.
+    Returns (plate_crop, padded_box) where padded_box is (x, y, w, h) relative to the car crop.
     """
-    x1, y1, x2, y2 = vehicle_box
-    car_crop = frame[y1:y2, x1:x2]
-    
-    if car_crop.size == 0:
-        return None, 0.0, 0
-
-    # Detect Plate
-    plate_box = plate_detector.detect_plate(car_crop)
-    if not plate_box:
-        return None, 0.0, 0
-    
     px, py, pw, ph = plate_box
     
     # Apply 10% Padding
@@ -78,19 +68,14 @@ def process_plate_detection(frame, vehicle_box, plate_detector, reader, annotate
     pad_pw = min(car_crop.shape[1] - pad_px, pw + 2 * pad_w)
     pad_ph = min(car_crop.shape[0] - pad_py, ph + 2 * pad_h)
 
-    # Visualization (Magenta Box for Plate)
-    if annotated_frame is not None:
-        cv2.rectangle(annotated_frame, (x1+pad_px, y1+pad_py), (x1+pad_px+pad_pw, y1+pad_py+pad_ph), (255, 0, 255), 2)
-    
-    # Crop Plate
     plate_crop = car_crop[pad_py:pad_py+pad_ph, pad_px:pad_px+pad_pw]
-    
-    if plate_crop.size == 0:
-        return None, 0.0, 0
+    return plate_crop, (pad_px, pad_py, pad_pw, pad_ph)
 
-    # OCR
-    results = reader.read_text(plate_crop, det=False, enable_logic=config.ENABLE_OCR_LOGIC_LAYER)
-    
+def _validate_ocr_results(results, area):
+    """
+    Validate raw OCR results for a single plate crop.
+    Returns (text, conf, area) or (None, 0.0, 0).
+    """
     if not results:
         return None, 0.0, 0
         
@@ -106,76 +91,322 @@ def process_plate_detection(frame, vehicle_box, plate_detector, reader, annotate
     if valid_texts:
         final_text = " ".join(valid_texts)
         avg_conf = sum(valid_confs) / len(valid_confs)
-        area = pw * ph 
         return final_text, avg_conf, area
         
     return None, 0.0, 0
 
+def process_plate_detection(frame, vehicle_box, plate_detector, reader, annotated_frame):
+    """
+    Detects plate on the vehicle crop, pads it, and performs OCR.
+    Returns valid text or None.
+    """
+    x1, y1, x2, y2 = vehicle_box
+    car_crop = frame[y1:y2, x1:x2]
+    
+    if car_crop.size == 0:
+        return None, 0.0, 0
+
+    # Detect Plate
+    plate_box = plate_detector.detect_plate(car_crop)
+    if not plate_box:
+        return None, 0.0, 0
+    
+    plate_crop, (pad_px, pad_py, pad_pw, pad_ph) = _crop_plate(car_crop, plate_box)
+
+    # Visualization (Magenta Box for Plate)
+    if annotated_frame is not None:
+        cv2.rectangle(annotated_frame, (x1+pad_px, y1+pad_py), (x1+pad_px+pad_pw, y1+pad_py+pad_ph), (255, 0, 255), 2)
+    
+    if plate_crop.size == 0:
+        return None, 0.0, 0
+
+    # OCR
+    results = reader.read_text(plate_crop, det=False, enable_logic=config.ENABLE_OCR_LOGIC_LAYER)
+    
+    _, _, pw, ph = plate_box
+    return _validate_ocr_results(results, pw * ph)
+
+def detect_plate_crops(frame, vehicle_boxes, plate_detector, annotated_frame):
+    """
+    Runs plate detection once over all vehicle crops (a single YOLO forward pass)
+    and returns the padded plate crops.
+    Returns (indices, plate_crops, areas) where indices point into vehicle_boxes.
+    """
+    plate_indices = []
+    plate_crops = []
+    plate_areas = []
+
+    # Collect non-empty vehicle crops
+    crops = []
+    crop_indices = []
+    for i, (x1, y1, x2, y2) in enumerate(vehicle_boxes):
+        car_crop = frame[y1:y2, x1:x2]
+        if car_crop.size > 0:
+            crops.append(car_crop)
+            crop_indices.append(i)
+
+    if not crops:
+        return plate_indices, plate_crops, plate_areas
+
+    # Detect Plates (one batch for the whole frame)
+    plate_boxes = plate_detector.detect_plates(crops)
+
+    for i, car_crop, plate_box in zip(crop_indices, crops, plate_boxes):
+        if not plate_box:
+            continue
+
+        x1, y1, _, _ = vehicle_boxes[i]
+        plate_crop, (pad_px, pad_py, pad_pw, pad_ph) = _crop_plate(car_crop, plate_box)
+
+        # Visualization (Magenta Box for Plate)
+        if annotated_frame is not None:
+            cv2.rectangle(annotated_frame, (x1+pad_px, y1+pad_py), (x1+pad_px+pad_pw, y1+pad_py+pad_ph), (255, 0, 255), 2)
+
+        if plate_crop.size == 0:
+            continue
+
+        _, _, pw, ph = plate_box
+        plate_indices.append(i)
+        plate_crops.append(plate_crop)
+        plate_areas.append(pw * ph)
+
+    return plate_indices, plate_crops, plate_areas
+
+def read_plate_crops(plate_crops, plate_areas, reader):
+    """
+    Recognizes all plate crops in a single batched OCR call and validates them.
+    Returns a list of (text, conf, area) tuples aligned with plate_crops.
+    """
+    if not plate_crops:
+        return []
+
+    batch_results = reader.read_text_batch(plate_crops, enable_logic=config.ENABLE_OCR_LOGIC_LAYER)
+    return [_validate_ocr_results(results, area) for results, area in zip(batch_results, plate_areas)]
+
+def process_plate_detections(frame, vehicle_boxes, plate_detector, reader, annotated_frame):
+    """
+    Batched version of process_plate_detection for every vehicle in a frame.
+    Plate detection runs once over all vehicle crops (a single YOLO forward pass),
+    then all padded plate crops are recognized in a single batched OCR call.
+    Returns a list of (text, conf, area) tuples aligned with vehicle_boxes.
+    """
+    outputs = [(None, 0.0, 0)] * len(vehicle_boxes)
+
+    plate_indices, plate_crops, plate_areas = detect_plate_crops(frame, vehicle_boxes, plate_detector, annotated_frame)
+
+    for i, plate_read in zip(plate_indices, read_plate_crops(plate_crops, plate_areas, reader)):
+        outputs[i] = plate_read
+
+    return outputs
+
+def _read_score(conf, area):
+    """
+    Vote score of a single read, using the same weighting for plates and characters.
+    """
+    # Resolution Weighting: Area / 5000.0
+    weight = 1.0
+    if config.ENABLE_RESOLUTION_WEIGHTING:
+        weight = area / 5000.0
+    
+    # Confidence Weighting
+    score = weight 
+    if config.ENABLE_CONFIDENCE_WEIGHTING:
+        score = conf * weight
+    return score
+
+class TrackRecord:
+    """
+    Per-track state. Uses __slots__ to keep records compact on long-running devices.
+    """
+    __slots__ = (
+        'reads', 'read_count', 'vote_scores', 'vote_counts', 'char_scores', 'cons_count',
+        'last_seen', 'finalized', 'settled', 'agreeing', 'best_plate', 'confidence'
+    )
+
+    def __init__(self, last_seen):
+        self.reads = []           # Capped raw history: min-heap of (score, seq, (text, conf, area))
+        self.read_count = 0
+        self.vote_scores = {}     # text -> accumulated score
+        self.vote_counts = {}     # text -> number of reads
+        self.char_scores = None   # 7 x {char -> accumulated score}, created on first 7-char read
+        self.cons_count = 0       # Number of 7-char reads in char_scores
+        self.last_seen = last_seen
+        self.finalized = False
+        self.settled = False
+        self.agreeing = {}        # text -> number of high-confidence reads
+        self.best_plate = None
+        self.confidence = 0.0
+
 class VehicleTracker:
-    def __init__(self):
-        # {track_id: {'reads': [], 'last_seen': 0, 'finalized': False}}
+    def __init__(self, exit_frames=15, eviction_grace_frames=None):
+        """
+        :param exit_frames: Frames a track must be unseen before it is finalized as exited.
+        :param eviction_grace_frames: Frames a finalized track is kept (so a briefly re-detected
+                                      vehicle is not reported twice) before it is evicted.
+        """
+        # {track_id: TrackRecord}
         self.vehicle_data = {}
+        self.exit_frames = exit_frames
+        self.eviction_grace_frames = config.EVICTION_GRACE_FRAMES if eviction_grace_frames is None else eviction_grace_frames
+        # Min-heap of (last_seen, track_id). Entries go stale when a track is seen again and are skipped lazily.
+        self._exit_heap = []
+        # Min-heap of (evict_at, track_id) for finalized tracks
+        self._eviction_heap = []
+        # Tracks that settled since the last check_settled_vehicles() call
+        self.newly_settled = []
+        # Number of tracks not yet finalized
+        self.active_tracks = 0
+        # Settled tracks not yet evicted. Replaced, never mutated, so other threads can read it
+        self.settled_ids = frozenset()
         
     def update(self, track_id, frame_count):
-        if track_id not in self.vehicle_data:
-            self.vehicle_data[track_id] = {'reads': [], 'last_seen': frame_count, 'finalized': False}
+        data = self.vehicle_data.get(track_id)
+        if data is None:
+            self.vehicle_data[track_id] = TrackRecord(frame_count)
+            self.active_tracks += 1
         else:
-            self.vehicle_data[track_id]['last_seen'] = frame_count
+            data.last_seen = frame_count
+        heapq.heappush(self._exit_heap, (frame_count, track_id))
             
     def add_read(self, track_id, text, conf, area):
-        if track_id in self.vehicle_data:
-            self.vehicle_data[track_id]['reads'].append((text, conf, area))
+        """
+        Folds a read into the track's running vote tables, so finalization never re-scans history.
+        Only the top MAX_READ_HISTORY reads (by score) are kept as raw history.
+        """
+        data = self.vehicle_data.get(track_id)
+        if data is None or data.settled:
+            return
+
+        score = _read_score(conf, area)
+
+        # 1. Weighted Vote tables
+        data.vote_scores[text] = data.vote_scores.get(text, 0) + score
+        data.vote_counts[text] = data.vote_counts.get(text, 0) + 1
+        data.read_count += 1
+
+        # 2. Per-position character tables (standard UK length, 7 chars without space)
+        compact = text.replace(" ", "")
+        if len(compact) == 7:
+            if data.char_scores is None:
+                data.char_scores = [{} for _ in range(7)]
+            for i, char in enumerate(compact):
+                pos_scores = data.char_scores[i]
+                pos_scores[char] = pos_scores.get(char, 0) + score
+            data.cons_count += 1
+
+        # 3. Capped raw history (min-heap on score, read_count breaks ties)
+        heapq.heappush(data.reads, (score, data.read_count, (text, conf, area)))
+        if len(data.reads) > config.MAX_READ_HISTORY:
+            heapq.heappop(data.reads)
+
+        # Running consensus: count agreeing high-confidence reads
+        if config.ENABLE_EARLY_FINALIZATION and conf >= config.SETTLE_MIN_CONFIDENCE:
+            data.agreeing[text] = data.agreeing.get(text, 0) + 1
+            if data.agreeing[text] >= config.SETTLE_MIN_READS:
+                data.settled = True
+                self.newly_settled.append(track_id)
+                self.settled_ids = self.settled_ids | {track_id}
+
+    def _history(self, data):
+        """
+        Kept reads, best first: [(text, conf, area), ...]
+        """
+        return [read for _, _, read in sorted(data.reads, reverse=True)]
+
+    def _mark_finalized(self, t_id, data):
+        data.finalized = True
+        self.active_tracks -= 1
+        heapq.heappush(self._eviction_heap, (data.last_seen + self.eviction_grace_frames, t_id))
+
+    def _finalized_entry(self, data):
+        return {
+            'best_plate': data.best_plate,
+            'confidence': data.confidence,
+            'history': self._history(data),
+            'read_count': data.read_count
+        }
+
+    def is_settled(self, track_id):
+        """
+        True once a track has a confident consensus; no further plate detection/OCR is needed.
+        """
+        data = self.vehicle_data.get(track_id)
+        return data is not None and data.settled
+
+    def check_settled_vehicles(self):
+        """
+        Finalizes vehicles that reached a confident consensus since the last call,
+        without waiting for them to leave the frame.
+        Returns a dict of finalized vehicle data (same format as check_exiting_vehicles).
+        """
+        finalized_this_frame = {}
+
+        for t_id in self.newly_settled:
+            data = self.vehicle_data.get(t_id)
+            if data is None or data.finalized:
+                continue
+
+            self._finalize_vote(t_id)
+            finalized_this_frame[t_id] = self._finalized_entry(data)
+            self._mark_finalized(t_id, data)
+
+        self.newly_settled = []
+        return finalized_this_frame
 
     def check_exiting_vehicles(self, current_frame_count):
         """
-        Checks for vehicles that haven't been seen for > 15 frames and finalizes them.
+        Checks for vehicles that haven't been seen for > exit_frames frames and finalizes them,
+        then evicts finalized vehicles past their grace window.
+        Only tracks whose last sighting is old enough are touched, via the last_seen heap.
         Returns a dict of finalized vehicle data.
         """
         finalized_this_frame = {}
+        exit_before = current_frame_count - self.exit_frames
         
-        for t_id in list(self.vehicle_data.keys()):
-            data = self.vehicle_data[t_id]
+        # Abandoned tracks (not seen for > exit_frames frames)
+        while self._exit_heap and self._exit_heap[0][0] < exit_before:
+            last_seen, t_id = heapq.heappop(self._exit_heap)
+            data = self.vehicle_data.get(t_id)
+
+            # Skip stale entries (track seen again since) and already finalized tracks
+            if data is None or data.last_seen != last_seen or data.finalized:
+                continue
+
+            if data.read_count:
+                self._finalize_vote(t_id)
+                finalized_this_frame[t_id] = self._finalized_entry(data)
+            else:
+                print(f"❌ Vehicle {t_id} Left Frame. No valid UK plates read.")
             
-            # If not finalized AND abandoned (not seen for > 15 frames)
-            if not data['finalized'] and (current_frame_count - data['last_seen'] > 15):
-                reads = data['reads']
-                if reads:
-                    # _finalize_vote usually prints result. We want to capture it.
-                    # Let's peek at _finalize_vote if possible, but assuming we can just calculate it here or let _finalize_vote populate 'best_plate'.
-                    self._finalize_vote(t_id, reads)
-                    
-                    # Assuming _finalize_vote or the process populates 'best_plate'
-                    if 'best_plate' in data and data['best_plate']:
-                         finalized_this_frame[t_id] = {
-                             'best_plate': data['best_plate'],
-                             'confidence': data.get('confidence', 0.0),
-                             'history': reads
-                         }
-                else:
-                    print(f"❌ Vehicle {t_id} Left Frame. No valid UK plates read.")
-                
-                data['finalized'] = True
+            self._mark_finalized(t_id, data)
+
+        self._evict_finalized(current_frame_count)
                 
         return finalized_this_frame
 
-    def _finalize_vote(self, t_id, reads):
-        # 1. Weighted Vote (Best Single Read)
-        vote_scores = {}
-        vote_counts = {}
-        
-        for text, conf, area in reads:
-            # Resolution Weighting: Area / 5000.0
-            weight = 1.0
-            if config.ENABLE_RESOLUTION_WEIGHTING:
-                weight = area / 5000.0
-            
-            # Confidence Weighting
-            score = weight 
-            if config.ENABLE_CONFIDENCE_WEIGHTING:
-                score = conf * weight
-            
-            vote_scores[text] = vote_scores.get(text, 0) + score
-            vote_counts[text] = vote_counts.get(text, 0) + 1
+    def _evict_finalized(self, current_frame_count):
+        while self._eviction_heap and self._eviction_heap[0][0] < current_frame_count:
+            _, t_id = heapq.heappop(self._eviction_heap)
+            data = self.vehicle_data.get(t_id)
+            if data is None:
+                continue
+
+            evict_at = data.last_seen + self.eviction_grace_frames
+            if evict_at < current_frame_count:
+                del self.vehicle_data[t_id]
+                if data.settled:
+                    self.settled_ids = self.settled_ids - {t_id}
+            else:
+                # Seen again during the grace window, check later
+                heapq.heappush(self._eviction_heap, (evict_at, t_id))
+
+    def _finalize_vote(self, t_id):
+        data = self.vehicle_data[t_id]
+
+        # 1. Weighted Vote (Best Single Read), from the running tables
+        vote_scores = data.vote_scores
+        vote_counts = data.vote_counts
+        read_count = data.read_count
         
         # Debug: Print all candidates
         print(f"\n🔍 Debugging Vehicle {t_id}:")
@@ -186,37 +417,22 @@ class VehicleTracker:
         final_text = max(vote_scores, key=vote_scores.get)
         vote_count = vote_counts[final_text]
         
-        print(f"✅ Vehicle {t_id} Left Frame. Best Read: {final_text} (Score: {vote_scores[final_text]:.2f}, Votes: {vote_count}/{len(reads)})")
+        status = "Settled" if data.settled else "Left Frame"
+        print(f"✅ Vehicle {t_id} {status}. Best Read: {final_text} (Score: {vote_scores[final_text]:.2f}, Votes: {vote_count}/{read_count})")
     
-        self.vehicle_data[t_id]['best_plate'] = final_text
-        self.vehicle_data[t_id]['confidence'] = vote_scores[final_text] / max(1.0, float(len(reads))) # Rough normalization
+        data.best_plate = final_text
+        data.confidence = vote_scores[final_text] / max(1.0, float(read_count)) # Rough normalization
 
         # 2. Character-Level Voting (Positional Consensus)
         if config.ENABLE_POSITIONAL_VOTING:
-            self._positional_consensus(final_text, reads)
+            self._positional_consensus(final_text, data.char_scores, data.cons_count)
 
-    def _positional_consensus(self, final_text, reads):
-        # Filter for reads that are standard UK length (7 chars without space)
-        valid_cons_reads = [ (r[0].replace(" ", ""), r[1], r[2]) for r in reads if len(r[0].replace(" ", "")) == 7 ]
-        
-        if len(valid_cons_reads) > 1:
+    def _positional_consensus(self, final_text, char_tables, cons_count):
+        # char_tables holds per-position scores accumulated from reads of standard UK length (7 chars without space)
+        if cons_count > 1:
             constructed_plate = []
             # For each of the 7 positions
-            for i in range(7):
-                char_scores = {}
-                for r_text, r_conf, r_area in valid_cons_reads:
-                    # Use same weighting logic for chars
-                    weight = 1.0
-                    if config.ENABLE_RESOLUTION_WEIGHTING:
-                        weight = r_area / 5000.0
-                    
-                    r_score = weight
-                    if config.ENABLE_CONFIDENCE_WEIGHTING:
-                        r_score = r_conf * weight
-                    
-                    char = r_text[i]
-                    char_scores[char] = char_scores.get(char, 0) + r_score
-                
+            for i, char_scores in enumerate(char_tables):
                 # Debug: Print char votes if ambiguous
                 if len(char_scores) > 1:
                      sorted_chars = sorted(char_scores.items(), key=lambda x: x[1], reverse=True)
@@ -232,4 +448,4 @@ class VehicleTracker:
             consensus_formatted = consensus_text[:4] + " " + consensus_text[4:]
             
             if consensus_formatted != final_text:
-                 print(f"   ✨ Consensus Reconstructed: {consensus_formatted} (Merged from {len(valid_cons_reads)} reads)")
+                 print(f"   ✨ Consensus Reconstructed: {consensus_formatted} (Merged from {cons_count} reads)")
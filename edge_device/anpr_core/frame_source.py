@@ -0,0 +1,148 @@
+import cv2
+import queue
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+LIVE_SCHEMES = ("rtsp", "rtmp", "http", "https")
+
+def is_live_source(source):
+    """
+    True for webcams (integer index) and network streams, False for video files.
+    """
+    if isinstance(source, int):
+        return True
+    return isinstance(source, str) and source.split("://")[0].lower() in LIVE_SCHEMES
+
+class FrameSource:
+    def __init__(self, source=0, skip_rate=1, should_process=None, live=None, buffer_size=4, loop=False,
+                 reconnect_delay=1.0, max_reconnect_delay=30.0):
+        """
+        Threaded frame source that only decodes the frames that will be processed.
+        Skipped frames are grab()bed (demuxed, not decoded); selected frames are retrieve()d.
+        :param source: Path to video file, stream URL or webcam index.
+        :param skip_rate: Process every Nth frame (ignored if should_process is given).
+        :param should_process: Optional callable () -> bool deciding whether the next frame is processed.
+        :param live: Live source; keeps only the latest frame so the consumer never processes backlog.
+                     Defaults to is_live_source(source).
+        :param buffer_size: Frames prefetched ahead of the consumer for non-live sources.
+        :param loop: Restart file sources from the beginning at end of stream.
+        :param reconnect_delay: Seconds before reopening a live source after a failed grab;
+                                doubles on each failed attempt up to max_reconnect_delay.
+                                Live sources never end, only files reach end of stream.
+        """
+        self.cap = cv2.VideoCapture(source)
+        if not self.cap.isOpened():
+            raise ValueError(f"Could not open video source: {source}")
+
+        # Get video properties
+        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS)
+
+        self.source = source
+        self.skip_rate = skip_rate
+        self.should_process = should_process or self._every_nth
+        self.live = is_live_source(source) if live is None else live
+        self.loop = loop
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self.frame_count = 0
+        self.frames_dropped = 0
+        self.reconnects = 0
+        self._buffer = queue.Queue(maxsize=1 if self.live else buffer_size)
+        self._running = True
+        self._stopped = threading.Event() # Interrupts reconnect back-off on release()
+        self._thread = threading.Thread(target=self._prefetch, name="frame-source", daemon=True)
+        self._thread.start()
+
+    def _every_nth(self):
+        return self.frame_count % self.skip_rate == 0
+
+    def _prefetch(self):
+        while self._running:
+            if not self.cap.grab():
+                if self.live:
+                    # Transient stream/webcam failure: keep trying, a camera must not stop for good
+                    self._reconnect()
+                    continue
+                if self.loop:
+                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    continue
+                self._push(None) # End of stream
+                return
+
+            self.frame_count += 1
+            if not self.should_process():
+                continue
+
+            ret, frame = self.cap.retrieve()
+            if ret:
+                self._push((self.frame_count, frame))
+
+    def _reconnect(self):
+        """
+        Reopen a live source, backing off exponentially until it opens or the source is released.
+        """
+        delay = self.reconnect_delay
+        while self._running:
+            logger.warning(f"Lost video source {self.source}, reconnecting in {delay:g}s")
+            self.cap.release()
+            if self._stopped.wait(delay):
+                return
+            self.cap = cv2.VideoCapture(self.source)
+            if self.cap.isOpened():
+                self.reconnects += 1
+                logger.info(f"Reconnected to video source {self.source}")
+                return
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _push(self, item):
+        if self.live:
+            # Drop-stale: replace any unconsumed frame with the newest one
+            while self._running:
+                try:
+                    self._buffer.put_nowait(item)
+                    return
+                except queue.Full:
+                    try:
+                        self._buffer.get_nowait()
+                        self.frames_dropped += 1
+                    except queue.Empty:
+                        pass
+        else:
+            while self._running:
+                try:
+                    self._buffer.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    pass
+
+    def read(self, timeout=None):
+        """
+        Get the next frame selected for processing.
+        :param timeout: Seconds to wait (None = wait until a frame or end of stream).
+        :return: (ret, frame_count, frame). ret is False at end of stream or on timeout
+                 (frame_count is None on timeout, so callers can tell the two apart).
+        """
+        try:
+            item = self._buffer.get(timeout=timeout)
+        except queue.Empty:
+            return False, None, None
+
+        if item is None:
+            self._running = False
+            return False, self.frame_count, None
+        frame_count, frame = item
+        return True, frame_count, frame
+
+    def release(self):
+        """
+        Stop prefetching and release the video source.
+        """
+        self._running = False
+        self._stopped.set()
+        self._thread.join(timeout=2)
+        self.cap.release()
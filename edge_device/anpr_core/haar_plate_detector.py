@@ -3,10 +3,11 @@ import cv2
 import os
 
 class PlateDetector:
-    def __init__(self, model_path="yolo11n-plate.pt"):
+    def __init__(self, model_path="yolo11n-plate.pt", imgsz=640):
         """
         Initialize the PlateDetector with a YOLO model.
         :param model_path: Path to the YOLO model file.
+        :param imgsz: Square letterbox size used when batching vehicle crops.
         """
         if not os.path.exists(model_path):
              # Try absolute path if relative fails (assuming it's in the project root)
@@ -17,8 +18,31 @@ class PlateDetector:
                  print(f"Warning: Model file not found at {model_path}")
         
         self.model = YOLO(model_path)
+        self.imgsz = imgsz
         print(f"Loaded Plate Detector from {model_path}")
 
+    def _best_plate(self, result):
+        """
+        Pick the highest confidence plate from a single YOLO result.
+        :return: (x, y, w, h) of the plate, or None if not found.
+        """
+        best_plate = None
+        max_conf = -1
+
+        for box in result.boxes:
+            # box.xyxy is [x1, y1, x2, y2]
+            x1, y1, x2, y2 = map(int, box.xyxy[0])
+            conf = float(box.conf[0])
+            
+            # We want the highest confidence plate
+            if conf > max_conf:
+                max_conf = conf
+                w = x2 - x1
+                h = y2 - y1
+                best_plate = (x1, y1, w, h)
+
+        return best_plate
+
     def detect_plate(self, vehicle_image):
         """
         Detect the license plate in a vehicle image.
@@ -26,21 +50,18 @@ class PlateDetector:
         :return: (x, y, w, h) of the plate, or None if not found.
         """
         results = self.model(vehicle_image, verbose=False)
-        
-        best_plate = None
-        max_conf = -1
+        return self._best_plate(results[0])
 
-        for r in results:
-            for box in r.boxes:
-                # box.xyxy is [x1, y1, x2, y2]
-                x1, y1, x2, y2 = map(int, box.xyxy[0])
-                conf = float(box.conf[0])
-                
-                # We want the highest confidence plate
-                if conf > max_conf:
-                    max_conf = conf
-                    w = x2 - x1
-                    h = y2 - y1
-                    best_plate = (x1, y1, w, h)
-        
-        return best_plate
+    def detect_plates(self, vehicle_images):
+        """
+        Detect license plates in a batch of vehicle images with a single inference.
+        Crops are letterboxed to a common imgsz x imgsz input; boxes are mapped back
+        to each crop's own coordinates.
+        :param vehicle_images: List of cropped vehicle images.
+        :return: List of (x, y, w, h) (or None), one per vehicle image.
+        """
+        if not vehicle_images:
+            return []
+
+        results = self.model(list(vehicle_images), imgsz=self.imgsz, verbose=False)
+        return [self._best_plate(r) for r in results]
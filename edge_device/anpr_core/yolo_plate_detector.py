@@ -1,26 +1,25 @@
 from ultralytics import YOLO
 
 class YoloPlateDetector:
-    def __init__(self, model_path="models/yolo11n-plate.pt"):
+    def __init__(self, model_path="models/yolo11n-plate.pt", imgsz=640):
         """
         Initialize the YoloPlateDetector.
         :param model_path: Path to the YOLO model file trained on plates.
+        :param imgsz: Square letterbox size used when batching vehicle crops.
         """
         print(f"Loading YOLO Plate model from {model_path}...")
         self.model = YOLO(model_path)
+        self.imgsz = imgsz
 
-    def detect_plate(self, image):
+    def _best_box(self, result):
         """
-        Detect license plate in the given image (usually a vehicle crop).
-        :param image: Input image.
-        :return: Bounding box [x, y, w, h] of the best plate, or None.
+        Pick the highest confidence box from a single YOLO result.
+        :return: Bounding box [x, y, w, h] or None.
         """
-        results = self.model(image, verbose=False)[0]
-        
         best_box = None
         max_conf = 0.0
 
-        for box in results.boxes:
+        for box in result.boxes:
             # We assume the model only has one class (license plate)
             # or we take the highest confidence one.
             conf = float(box.conf[0])
@@ -30,3 +29,26 @@ class YoloPlateDetector:
                 best_box = [x1, y1, x2 - x1, y2 - y1] # Return x, y, w, h
 
         return best_box
+
+    def detect_plate(self, image):
+        """
+        Detect license plate in the given image (usually a vehicle crop).
+        :param image: Input image.
+        :return: Bounding box [x, y, w, h] of the best plate, or None.
+        """
+        results = self.model(image, verbose=False)[0]
+        return self._best_box(results)
+
+    def detect_plates(self, images):
+        """
+        Detect license plates in a batch of images (usually every vehicle crop in a frame).
+        Crops of different sizes are letterboxed to a common imgsz x imgsz input and
+        run through a single forward pass; YOLO rescales the boxes back to each crop.
+        :param images: List of input images.
+        :return: List of bounding boxes [x, y, w, h] (or None), one per input image.
+        """
+        if not images:
+            return []
+
+        results = self.model(list(images), imgsz=self.imgsz, verbose=False)
+        return [self._best_box(r) for r in results]
@@ -0,0 +1,66 @@
+import cv2
+import logging
+
+logger = logging.getLogger(__name__)
+
+class MotionGate:
+    def __init__(self, roi=None, downscale_width=160, pixel_threshold=25, min_changed_fraction=0.002, learning_rate=0.05):
+        """
+        Cheap motion detector used to skip vehicle detection on static frames.
+        Compares a blurred, downscaled grayscale copy of the ROI against a running-average background.
+        :param roi: Region of interest as fractions of the frame [x1, y1, x2, y2] (default: whole frame).
+        :param downscale_width: Width the ROI is resized to before differencing.
+        :param pixel_threshold: Grayscale difference for a pixel to count as changed.
+        :param min_changed_fraction: Fraction of changed pixels that counts as motion.
+        :param learning_rate: How fast the background adapts to the scene (0-1).
+        """
+        self.roi = roi
+        self.downscale_width = downscale_width
+        self.pixel_threshold = pixel_threshold
+        self.min_changed_fraction = min_changed_fraction
+        self.learning_rate = learning_rate
+        self.background = None
+
+        # Metrics
+        self.frames_checked = 0
+        self.frames_static = 0
+
+    def _prepare(self, frame):
+        h, w = frame.shape[:2]
+        if self.roi:
+            x1, y1, x2, y2 = self.roi
+            frame = frame[int(y1 * h):int(y2 * h), int(x1 * w):int(x2 * w)]
+            h, w = frame.shape[:2]
+
+        scale = self.downscale_width / float(w)
+        small = cv2.resize(frame, (self.downscale_width, max(1, int(h * scale))), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return cv2.GaussianBlur(gray, (5, 5), 0)
+
+    def has_motion(self, frame):
+        """
+        :param frame: Full BGR frame.
+        :return: True if the ROI changed enough since the background model (always True on the first frame).
+        """
+        self.frames_checked += 1
+        gray = self._prepare(frame)
+
+        if self.background is None:
+            self.background = gray.astype("float32")
+            return True
+
+        diff = cv2.absdiff(gray, cv2.convertScaleAbs(self.background))
+        _, changed = cv2.threshold(diff, self.pixel_threshold, 255, cv2.THRESH_BINARY)
+        changed_fraction = cv2.countNonZero(changed) / float(changed.size)
+
+        cv2.accumulateWeighted(gray, self.background, self.learning_rate)
+
+        if changed_fraction >= self.min_changed_fraction:
+            return True
+
+        self.frames_static += 1
+        return False
+
+    def format_metrics(self):
+        static_pct = self.frames_static / float(self.frames_checked) if self.frames_checked else 0.0
+        return f"static {self.frames_static}/{self.frames_checked} frames ({static_pct:.0%})"
@@ -0,0 +1,104 @@
+import queue
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Overflow policies for BoundedQueue
+BLOCK = "block"              # Producer waits (backpressure to the upstream stage)
+DROP_OLDEST = "drop_oldest"  # Evict the oldest queued item to make room (keep freshest data)
+DROP_NEWEST = "drop_newest"  # Discard the incoming item
+
+POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST)
+
+class BoundedQueue:
+    def __init__(self, name, maxsize, policy=BLOCK):
+        """
+        Bounded FIFO connecting two pipeline stages.
+        :param name: Stage name used in metrics/logs.
+        :param maxsize: Maximum number of queued items.
+        :param policy: Overflow policy (block, drop_oldest, drop_newest).
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy}")
+
+        self.name = name
+        self.maxsize = maxsize
+        self.policy = policy
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.put_count = 0
+        self.dropped = 0
+        self.high_watermark = 0
+
+    def put(self, item, timeout=0.5):
+        """
+        Enqueue an item according to the overflow policy.
+        With BLOCK, waits up to `timeout` seconds so the caller can check for shutdown and retry.
+        :return: True if the item was enqueued, False otherwise.
+        """
+        if self.policy == BLOCK:
+            try:
+                self._queue.put(item, timeout=timeout)
+            except queue.Full:
+                return False
+        else:
+            while True:
+                try:
+                    self._queue.put_nowait(item)
+                    break
+                except queue.Full:
+                    if self.policy == DROP_NEWEST:
+                        self._record_drop()
+                        return False
+                    try:
+                        self._queue.get_nowait()
+                        self._record_drop()
+                    except queue.Empty:
+                        pass
+
+        with self._lock:
+            self.put_count += 1
+            depth = self._queue.qsize()
+            if depth > self.high_watermark:
+                self.high_watermark = depth
+        return True
+
+    def get(self, timeout=0.5):
+        """
+        Dequeue the next item.
+        :return: The item, or None if nothing arrived within `timeout` seconds.
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _record_drop(self):
+        with self._lock:
+            self.dropped += 1
+
+    def metrics(self):
+        """
+        Snapshot of the queue metrics.
+        """
+        with self._lock:
+            return {
+                "depth": self._queue.qsize(),
+                "maxsize": self.maxsize,
+                "high_watermark": self.high_watermark,
+                "enqueued": self.put_count,
+                "dropped": self.dropped,
+            }
+
+def format_metrics(queues):
+    """
+    Format per-stage queue metrics as a single log line.
+    """
+    parts = []
+    for q in queues:
+        m = q.metrics()
+        parts.append(f"{q.name}={m['depth']}/{m['maxsize']} (max {m['high_watermark']}, dropped {m['dropped']})")
+    return " | ".join(parts)
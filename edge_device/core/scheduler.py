@@ -0,0 +1,101 @@
+import math
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AdaptiveFrameScheduler:
+    def __init__(self, source_fps, target_utilization=0.7, initial_skip=5, min_skip=1, max_skip=30,
+                 max_lag_seconds=2.0, smoothing=0.2):
+        """
+        Adjusts the effective frame skip rate to hold a processing budget.
+        Utilization is the fraction of real time spent processing:
+            utilization = processing_time_per_frame * source_fps / skip_rate
+        The skip rate is the smallest one that keeps utilization under target_utilization,
+        and it backs off further while end-to-end lag exceeds max_lag_seconds.
+        :param source_fps: Frame rate of the video source.
+        :param target_utilization: Processing budget as a fraction of real time (e.g. 0.7).
+        :param initial_skip: Skip rate used until the first measurements arrive.
+        :param min_skip: Lowest skip rate (1 = process every frame).
+        :param max_skip: Highest skip rate.
+        :param max_lag_seconds: Capture-to-finalization lag that triggers extra back-off.
+        :param smoothing: EMA factor for the processing time and lag measurements.
+        """
+        self.source_fps = source_fps
+        self.target_utilization = target_utilization
+        self.min_skip = min_skip
+        self.max_skip = max_skip
+        self.max_lag_seconds = max_lag_seconds
+        self.smoothing = smoothing
+
+        self.skip_rate = max(min_skip, min(max_skip, initial_skip))
+        self.processing_time = None
+        self.lag = None
+        self._frames_since_processed = 0
+        self._lock = threading.Lock()
+
+    def should_process(self):
+        """
+        Called by the capture stage for every frame.
+        :return: True if this frame should be processed.
+        """
+        self._frames_since_processed += 1
+        if self._frames_since_processed >= self.skip_rate:
+            self._frames_since_processed = 0
+            return True
+        return False
+
+    def record(self, processing_time, lag):
+        """
+        Called once a frame has been fully processed.
+        :param processing_time: Seconds of compute spent on the frame across all stages.
+        :param lag: Seconds between capturing the frame and finalizing it.
+        """
+        with self._lock:
+            if self.processing_time is None:
+                self.processing_time = processing_time
+                self.lag = lag
+            else:
+                self.processing_time += self.smoothing * (processing_time - self.processing_time)
+                self.lag += self.smoothing * (lag - self.lag)
+
+            desired = math.ceil(self.processing_time * self.source_fps / self.target_utilization)
+            if self.lag > self.max_lag_seconds:
+                # Falling behind: back off beyond the budget estimate until the backlog clears
+                desired = max(desired, self.skip_rate + 1)
+            elif desired < self.skip_rate:
+                # Recover one step at a time to avoid oscillating
+                desired = self.skip_rate - 1
+
+            self.skip_rate = max(self.min_skip, min(self.max_skip, desired))
+
+    def utilization(self):
+        """
+        Estimated fraction of real time spent processing at the current skip rate.
+        """
+        if self.processing_time is None:
+            return 0.0
+        return self.processing_time * self.source_fps / self.skip_rate
+
+    def is_under_provisioned(self):
+        """
+        True when even the maximum skip rate cannot hold the budget.
+        """
+        return self.skip_rate >= self.max_skip and self.utilization() > self.target_utilization
+
+    def metrics(self):
+        """
+        Snapshot of the scheduler metrics.
+        """
+        with self._lock:
+            return {
+                "skip_rate": self.skip_rate,
+                "processing_ms": (self.processing_time or 0.0) * 1000,
+                "lag_ms": (self.lag or 0.0) * 1000,
+                "utilization": self.utilization(),
+            }
+
+    def format_metrics(self):
+        m = self.metrics()
+        return (f"skip={m['skip_rate']} processing={m['processing_ms']:.0f}ms "
+                f"lag={m['lag_ms']:.0f}ms utilization={m['utilization']:.0%}")
@@ -86,9 +86,9 @@ class MockVideoProcessor:
         numbers = "".join(random.choices("0123456789", k=3))
         return f"{letters}-{numbers}"
 
-import cv2
 import sys
 import os
+import threading
 
 # Ensure we can import from anpr_core
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -98,89 +98,299 @@ if project_root not in sys.path:
 from anpr_core.vehicle_detector import VehicleDetector
 from anpr_core.paddle_reader import PaddleLicenseReader
 from anpr_core.yolo_plate_detector import YoloPlateDetector
-from anpr_core.core_logic import process_plate_detection, VehicleTracker
+from anpr_core.frame_source import FrameSource, is_live_source
+from anpr_core.core_logic import detect_plate_crops, read_plate_crops, VehicleTracker
 import anpr_core.config as anpr_config
+from core.pipeline import BoundedQueue, BLOCK, DROP_OLDEST, format_metrics
+from core.scheduler import AdaptiveFrameScheduler
+from core.motion_gate import MotionGate
 
 class RealVideoProcessor(MockVideoProcessor):
+    """
+    Staged ANPR runtime. Each stage runs on its own thread(s), connected by bounded queues:
+
+        capture -> [capture] -> detection -> [ocr] -> OCR workers -> [finalize] -> finalization -> spool
+
+    - capture:      drops the oldest frame for live sources (never processes backlog), blocks for files.
+    - ocr:          blocks (backpressure), so every detected frame reaches the tracker in order.
+    - finalize:     blocks; finalization is cheap and owns the VehicleTracker (single thread, no locks).
+                    Detection only sees the tracker through the snapshot finalize publishes per frame.
+
+    Finalization writes every sighting straight to the CloudClient spool (a local SQLite insert);
+    uploading happens on the client's own thread, so a dead uplink never stalls finalization.
+
+    A stage that fails on one item logs it and carries on; OCR and finalization still pass every
+    frame on (without reads) so the re-sequencing in finalize never waits for a lost frame.
+    If a stage thread dies anyway, the processor stops instead of looking alive.
+    """
     def __init__(self, config, cloud_client):
         super().__init__(config, cloud_client)
         self.camera_source = config.get('cameraSource')
+        pipeline_config = config.get('pipeline') or {}
+        self.ocr_workers = pipeline_config.get('ocrWorkers', 2)
+        self.metrics_interval = pipeline_config.get('metricsIntervalSeconds', 30)
         
         logger.info("Initializing ANPR Core Models...")
         self.vehicle_detector = VehicleDetector(model_path="models/yolov8n.pt") # Using standard model for vehicles
-        self.reader = PaddleLicenseReader(lang='en')
+        # One reader per OCR worker: Paddle predictors are not thread-safe
+        self.readers = [PaddleLicenseReader(lang='en') for _ in range(self.ocr_workers)]
+        self.reader = self.readers[0]
         self.plate_detector = YoloPlateDetector(model_path="models/license_plate_detector.pt") # Custom plate model
         self.tracker = VehicleTracker()
+        # (settled track ids, active track count), replaced (never mutated) by the finalize stage
+        self.tracker_view = (frozenset(), 0)
         
         # Override ANPR Config with Device Config if needed
-        anpr_config.FRAME_SKIP_RATE = 5 
+        self.frame_skip_config = config.get('frameSkip') or {}
+        anpr_config.FRAME_SKIP_RATE = self.frame_skip_config.get('initial', 5)
+        self.scheduler = None # Created in start() once the source FPS is known
+
+        motion_config = config.get('motionGate') or {}
+        self.motion_gate = None
+        if motion_config.get('enabled', False):
+            self.motion_gate = MotionGate(
+                roi=motion_config.get('roi'),
+                downscale_width=motion_config.get('downscaleWidth', 160),
+                pixel_threshold=motion_config.get('pixelThreshold', 25),
+                min_changed_fraction=motion_config.get('minChangedFraction', 0.002),
+                learning_rate=motion_config.get('learningRate', 0.05),
+            )
+
+        capture_policy = pipeline_config.get('capturePolicy', DROP_OLDEST if is_live_source(self.camera_source) else BLOCK)
+        self.frame_queue = BoundedQueue("capture", pipeline_config.get('captureQueueSize', 2), capture_policy)
+        self.plate_queue = BoundedQueue("ocr", pipeline_config.get('ocrQueueSize', 4), BLOCK)
+        self.read_queue = BoundedQueue("finalize", pipeline_config.get('finalizeQueueSize', 8), BLOCK)
+        self.queues = [self.frame_queue, self.plate_queue, self.read_queue]
+        self.threads = []
 
     def start(self):
         self.running = True
         logger.info(f"Starting Real Video Processor using source: {self.camera_source}")
         
-        cap = cv2.VideoCapture(self.camera_source)
-        if not cap.isOpened():
+        # Skipped frames are grabbed but never decoded; live sources keep only the latest frame.
+        # Frames that arrive before the scheduler exists are skipped.
+        try:
+            frame_source = FrameSource(
+                self.camera_source,
+                should_process=lambda: self.scheduler is not None and self.scheduler.should_process(),
+                loop=True,
+            )
+        except ValueError:
             logger.error(f"Failed to open video source: {self.camera_source}")
             return
 
-        frame_count = 0
-        while self.running and cap.isOpened():
-            ret, frame = cap.read()
+        source_fps = self.frame_skip_config.get('sourceFps') or frame_source.fps or 25
+        self.scheduler = self._create_scheduler(source_fps)
+
+        stages = [("capture", self._capture_stage, (frame_source,)), ("detection", self._detection_stage, ())]
+        stages += [(f"ocr-{i}", self._ocr_stage, (reader,)) for i, reader in enumerate(self.readers)]
+        stages += [("finalize", self._finalize_stage, ())]
+
+        self.threads = [threading.Thread(target=target, args=args, name=name, daemon=True) for name, target, args in stages]
+        for thread in self.threads:
+            thread.start()
+
+        try:
+            last_report = time.time()
+            while self.running:
+                time.sleep(0.5)
+                dead = [thread.name for thread in self.threads if not thread.is_alive()]
+                if dead and self.running:
+                    logger.error(f"Pipeline stage(s) stopped unexpectedly: {', '.join(dead)}")
+                    break
+                if time.time() - last_report >= self.metrics_interval:
+                    logger.info(f"Pipeline queues: {format_metrics(self.queues)}")
+                    logger.info(f"Frame scheduler: {self.scheduler.format_metrics()}")
+                    if self.motion_gate:
+                        logger.info(f"Motion gate: {self.motion_gate.format_metrics()}")
+                    if self.scheduler.is_under_provisioned():
+                        logger.warning("Device is under-provisioned: processing budget exceeded at maximum frame skip")
+                    last_report = time.time()
+        finally:
+            self.running = False
+            for thread in self.threads:
+                thread.join(timeout=5)
+            frame_source.release()
+
+    def _create_scheduler(self, source_fps):
+        initial_skip = anpr_config.FRAME_SKIP_RATE
+        if not self.frame_skip_config.get('adaptive', True):
+            # Fixed skip rate
+            return AdaptiveFrameScheduler(source_fps, initial_skip=initial_skip, min_skip=initial_skip, max_skip=initial_skip)
+
+        # A vehicle must be missed on at least two processed frames before it counts as exited
+        max_skip = min(self.frame_skip_config.get('max', 7), self.tracker.exit_frames // 2)
+        logger.info(f"Adaptive frame skipping: source {source_fps:.1f} fps, skip 1..{max_skip}")
+        return AdaptiveFrameScheduler(
+            source_fps,
+            target_utilization=self.frame_skip_config.get('targetUtilization', 0.7),
+            initial_skip=initial_skip,
+            min_skip=self.frame_skip_config.get('min', 1),
+            max_skip=max_skip,
+            max_lag_seconds=self.frame_skip_config.get('maxLagSeconds', 2.0),
+        )
+
+    def _put(self, q, item):
+        # Retry blocking puts until they succeed or we are shutting down
+        while self.running and not q.put(item):
+            pass
+
+    def _capture_stage(self, frame_source):
+        while self.running:
+            try:
+                ret, frame_count, frame = frame_source.read(timeout=0.5)
+            except Exception:
+                logger.exception("Capture failed")
+                continue
             if not ret:
-                logger.info("End of video stream. Looping...")
-                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                if frame_count is not None:
+                    logger.info("End of video stream.")
+                    self.running = False
                 continue
 
-            frame_count += 1
-            if frame_count % anpr_config.FRAME_SKIP_RATE == 0:
-                self.process_frame(frame, frame_count)
-            
-            # Allow clean exit
-            time.sleep(0.001)
+            self._put(self.frame_queue, (frame_count, frame, time.time()))
 
-        cap.release()
+    def _detection_stage(self):
+        seq = 0
+        while self.running:
+            item = self.frame_queue.get()
+            if item is None:
+                continue
+            frame_count, frame, captured_at = item
+            try:
+                work = self._detect(frame)
+            except Exception:
+                logger.exception(f"Detection failed on frame {frame_count}")
+                continue
 
-    def process_frame(self, frame, frame_count):
-        # 1. Detect Vehicles
-        detections = self.vehicle_detector.detect_vehicles(frame)
-        
-        if detections:
-            for (x1, y1, x2, y2, conf, class_id, track_id) in detections:
-                if track_id != -1:
-                    self.tracker.update(track_id, frame_count)
-                    
-                    # 2. Detect & Read Plate on Tracked Vehicle
-                    # Pass frame and vehicle bbox to core logic
-                    plate_text, plate_conf, plate_area = process_plate_detection(
-                        frame, (x1, y1, x2, y2), self.plate_detector, self.reader, None
-                    )
-                    
-                    if plate_text:
-                        self.tracker.add_read(track_id, plate_text, plate_conf, plate_area)
-
-        # 3. Check for Exiting Vehicles & Finalize
+            # Sequence numbers are only taken by frames that are passed on, so there are no gaps
+            work.update({'seq': seq, 'frame_count': frame_count, 'captured_at': captured_at})
+            self._put(self.plate_queue, work)
+            seq += 1
+
+    def _detect(self, frame):
+        started = time.time()
+        settled_ids, active_tracks = self.tracker_view
+
+        # 1. Detect Vehicles, unless the scene is static and empty. The (empty) work item
+        # still flows through so the tracker's clock ticks and exits get finalized.
+        if self._scene_is_static(frame, active_tracks):
+            detections = []
+        else:
+            detections = self.vehicle_detector.detect_vehicles(frame)
+        tracked = [d for d in detections if d[6] != -1]
+
+        # 2. Detect Plates on Tracked Vehicles (single batched plate detection).
+        # Settled tracks already have a confident consensus, so skip them.
+        unsettled = [d for d in tracked if d[6] not in settled_ids]
+        plate_indices, plate_crops, plate_areas = detect_plate_crops(
+            frame, [d[:4] for d in unsettled], self.plate_detector, None
+        )
+
+        return {
+            'track_ids': [d[6] for d in tracked],
+            'plate_track_ids': [unsettled[i][6] for i in plate_indices],
+            'plate_crops': plate_crops,
+            'plate_areas': plate_areas,
+            'processing_time': time.time() - started,
+        }
+
+    def _scene_is_static(self, frame, active_tracks):
+        if self.motion_gate is None:
+            return False
+        # Always check the gate so its background model keeps up with the scene
+        moving = self.motion_gate.has_motion(frame)
+        # Keep detecting while vehicles are still being tracked (slow or stopped traffic)
+        return not moving and active_tracks == 0
+
+    def _ocr_stage(self, reader):
+        while self.running:
+            work = self.plate_queue.get()
+            if work is None:
+                continue
+
+            # 3. Read Plates (single batched OCR call per frame)
+            started = time.time()
+            try:
+                plate_reads = read_plate_crops(work['plate_crops'], work['plate_areas'], reader)
+                work['reads'] = [(track_id,) + plate_read for track_id, plate_read in zip(work['plate_track_ids'], plate_reads)]
+            except Exception:
+                # Still pass the frame on: finalize waits for every seq, and tracks must be updated
+                logger.exception(f"OCR failed on frame {work['frame_count']}")
+                work['reads'] = []
+            work['plate_crops'] = None # Release image memory before the next stage
+            work['processing_time'] += time.time() - started
+
+            self._put(self.read_queue, work)
+
+    def _finalize_stage(self):
+        # OCR workers may complete frames out of order; re-sequence them so the
+        # tracker sees frames in capture order, exactly as in a serial loop.
+        pending = {}
+        next_seq = 0
+        while self.running:
+            work = self.read_queue.get()
+            if work is None:
+                continue
+
+            pending[work['seq']] = work
+            while next_seq in pending:
+                work = pending.pop(next_seq)
+                next_seq += 1
+                try:
+                    self._apply_frame(work)
+                except Exception:
+                    logger.exception(f"Finalization failed on frame {work['frame_count']}")
+                self._publish_tracker_view()
+
+    def _publish_tracker_view(self):
+        self.tracker_view = (self.tracker.settled_ids, self.tracker.active_tracks)
+
+    def _apply_frame(self, work):
+        self.scheduler.record(work['processing_time'], time.time() - work['captured_at'])
+
+        frame_count = work['frame_count']
+        for track_id in work['track_ids']:
+            self.tracker.update(track_id, frame_count)
+
+        for track_id, plate_text, plate_conf, plate_area in work['reads']:
+            if plate_text:
+                self.tracker.add_read(track_id, plate_text, plate_conf, plate_area)
+
+        # 4. Finalize Settled Vehicles early (no need to wait for them to leave)
+        for vehicle_id, plate_data in self.tracker.check_settled_vehicles().items():
+            self._emit_sighting(plate_data, direction=None)
+
+        # 5. Check for Exiting Vehicles & Finalize
         exiting_vehicles = self.tracker.check_exiting_vehicles(frame_count)
         
         for vehicle_id, plate_data in exiting_vehicles.items():
-            final_plate = plate_data['best_plate']
-            confidence = plate_data['confidence']
-            history = plate_data['history']
-            
-            logger.info(f"FINALIZED PLATE: {final_plate} (Conf: {confidence:.2f}, Reads: {len(history)})")
-            
-            # Randomize Location if mock locations are provided
-            location = self.location_id
-            if self.mock_locations:
-                location = random.choice(self.mock_locations)
-
-            sighting = {
-                "plateNumber": final_plate,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "locationId": location,
-                "vehicleMake": None, # Could infer from class_id if we tracked it
-                "vehicleModel": None,
-                "vehicleColor": None,
-                "direction": "Exiting" # Inferred from "check_exiting_vehicles"
-            }
-            self.cloud_client.send_sighting(sighting)
+            self._emit_sighting(plate_data, direction="Exiting") # Inferred from "check_exiting_vehicles"
+
+    def _emit_sighting(self, plate_data, direction):
+        final_plate = plate_data['best_plate']
+        confidence = plate_data['confidence']
+        read_count = plate_data['read_count']
+        
+        logger.info(f"FINALIZED PLATE: {final_plate} (Conf: {confidence:.2f}, Reads: {read_count})")
+
+        # Randomize Location if mock locations are provided
+        location = self.location_id
+        if self.mock_locations:
+            location = random.choice(self.mock_locations)
+
+        sighting = {
+            "plateNumber": final_plate,
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "locationId": location,
+            "vehicleMake": None, # Could infer from class_id if we tracked it
+            "vehicleModel": None,
+            "vehicleColor": None,
+            "direction": direction
+        }
+
+        is_hot, category = self.cloud_client.hotlist.match(final_plate)
+        if is_hot:
+            # Alert locally right away; spooled ahead of the regular upload backlog
+            logger.warning(f"HOTLIST MATCH: {final_plate} (Category: {category}) at {location}")
+        self.cloud_client.send_sighting(sighting, priority=is_hot)
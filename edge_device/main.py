@@ -46,6 +46,7 @@ def main():
         logger.info(f"Loaded configuration for device: {config['locationId']}")
         
         client = CloudClient(config)
+        client.start()
         
         # Determine Input Mode (CLI > Config > Default)
         if args.mode:
@@ -79,6 +80,9 @@ def main():
             processor.start()
         except KeyboardInterrupt:
             processor.stop()
+        finally:
+            # Anything not yet uploaded stays in the spool for the next run
+            client.stop()
             
     except Exception as e:
         logger.error(f"Fatal error: {str(e)}")
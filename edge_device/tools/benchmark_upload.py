@@ -0,0 +1,140 @@
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import tempfile
+import threading
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Ensure we can import from the edge device package regardless of where this script is run
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from transmission.cloud_client import CloudClient
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Minimal stand-in for the backend ingestion endpoints. Always answers 201.
+    Also answers the hotlist delta sync the CloudClient starts, with an empty, unchanged hotlist.
+    """
+    protocol_version = "HTTP/1.1" # Allow keep-alive
+    latency = 0.0
+
+    def setup(self):
+        super().setup()
+        # Like production servers, don't let Nagle delay small keep-alive responses
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.latency:
+            time.sleep(self.latency)
+
+        payload = json.loads(body)
+        if isinstance(payload, list):
+            response = json.dumps({"created": len(payload), "items": []}).encode()
+        else:
+            response = b"{}"
+
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def do_GET(self):
+        if self.path.split("?")[0].endswith("/hotlists/changes"):
+            response = json.dumps({"version": 0, "full": False, "changes": []}).encode()
+            self.send_response(200)
+        else:
+            response = b"{}"
+            self.send_response(404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        pass
+
+def make_sighting(i):
+    return {
+        "plateNumber": f"AB{i % 100:02d} CDE",
+        "timestamp": "2025-01-01T00:00:00Z",
+        "locationId": "LOC-BENCH",
+        "direction": "Exiting"
+    }
+
+def bench_per_request(api_url, count):
+    # Previous behaviour: module-level requests.post, new connection every time
+    start = time.time()
+    for i in range(count):
+        requests.post(f"{api_url}/sightings/", json=make_sighting(i), timeout=5)
+    return count / (time.time() - start)
+
+def bench_session(api_url, count):
+    session = requests.Session()
+    start = time.time()
+    for i in range(count):
+        session.post(f"{api_url}/sightings/", json=make_sighting(i), timeout=5)
+    session.close()
+    return count / (time.time() - start)
+
+def bench_client(api_url, count, transport, batch_size):
+    with tempfile.TemporaryDirectory() as tmp:
+        client = CloudClient({
+            'apiEndpoint': api_url,
+            'apiKey': 'bench',
+            'upload': {
+                'spoolPath': os.path.join(tmp, 'spool.db'),
+                'transport': transport,
+                'batchSize': batch_size,
+                'pollIntervalSeconds': 0.05
+            },
+            'hotlist': {'cachePath': os.path.join(tmp, 'hotlist.json')}
+        })
+        for i in range(count):
+            client.send_sighting(make_sighting(i))
+
+        start = time.time()
+        client.start()
+        while client.spool.count():
+            time.sleep(0.01)
+        elapsed = time.time() - start
+        client.stop()
+    return count / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sighting upload throughput against a local stub server")
+    parser.add_argument("--count", type=int, default=500, help="Sightings per run")
+    parser.add_argument("--batch-size", type=int, default=50, help="CloudClient upload batch size")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Simulated server/network latency per request")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    StubHandler.latency = args.latency_ms / 1000.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_address[1]}/api/v1"
+
+    print(f"Uploading {args.count} sightings per run, batch size {args.batch_size}, {args.latency_ms:.0f}ms simulated latency")
+    runs = [
+        ("requests.post per sighting (before)", lambda: bench_per_request(api_url, args.count)),
+        ("Session per sighting", lambda: bench_session(api_url, args.count)),
+        ("CloudClient sync (session + batch)", lambda: bench_client(api_url, args.count, 'sync', args.batch_size)),
+        ("CloudClient async (httpx + batch)", lambda: bench_client(api_url, args.count, 'async', args.batch_size)),
+    ]
+    for name, run in runs:
+        print(f"  {name:<40} {run():10.1f} sightings/sec")
+
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,29 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
+import random
+import asyncio
+import threading
 import logging
 
+from transmission.spool import SightingSpool
+from transmission.hotlist_sync import HotlistSync
+
+# Optional: asyncio transport
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
+# Client errors that will never succeed on retry (the payload itself is rejected;
+# 403: the sighting's location is not this device's). 401 is not: the key may be fixed.
+PERMANENT_FAILURE_CODES = (400, 403, 422)
+# Bulk request rejected: bad item in the batch, batch too large, or backend without the bulk endpoint
+BATCH_REJECTED_CODES = PERMANENT_FAILURE_CODES + (404, 413)
+
 class CloudClient:
     def __init__(self, config):
         self.api_url = config['apiEndpoint']
@@ -14,16 +33,234 @@ class CloudClient:
             "Content-Type": "application/json"
         }
 
-    def send_sighting(self, payload):
-        url = f"{self.api_url}/sightings/"
+        # Store-and-forward: every sighting is spooled to disk first and uploaded in the background
+        upload_config = config.get('upload') or {}
+        self.spool = SightingSpool(upload_config.get('spoolPath', './data/spool.db'))
+        self.batch_size = upload_config.get('batchSize', 50)
+        self.poll_interval = upload_config.get('pollIntervalSeconds', 1.0)
+        self.min_backoff = upload_config.get('minBackoffSeconds', 1.0)
+        self.max_backoff = upload_config.get('maxBackoffSeconds', 300.0)
+        self.concurrency = upload_config.get('concurrency', 4)
+
+        self.transport = upload_config.get('transport', 'sync')
+        if self.transport == 'async' and httpx is None:
+            logger.warning("httpx is not installed, falling back to the sync transport")
+            self.transport = 'sync'
+
+        # Keep-alive connection pool, reused across uploads
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Local hotlist for on-device matching, kept in sync over the same session
+        hotlist_config = config.get('hotlist') or {}
+        self.hotlist = HotlistSync(
+            self.session,
+            self.api_url,
+            hotlist_config.get('cachePath', './data/hotlist.json'),
+            hotlist_config.get('syncIntervalSeconds', 30.0),
+        )
+
+        # Created on the uploader thread (asyncio objects are bound to their event loop)
+        self._loop = None
+        self._async_client = None
+
+        self._failures = 0
+        self._stop_event = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Start the background uploader. Sightings spooled by a previous run are sent first.
+        """
+        pending = self.spool.count()
+        if pending:
+            logger.info(f"Resuming upload of {pending} spooled sightings")
+        self._thread = threading.Thread(target=self._upload_loop, name="uploader", daemon=True)
+        self._thread.start()
+        self.hotlist.start()
+
+    def stop(self):
+        self._stop_event.set()
+        self._wakeup.set()
+        self.hotlist.stop()
+        if self._thread:
+            self._thread.join(timeout=10)
+            if self._thread.is_alive():
+                # Still inside a request (batch posts may take up to 30s): it will exit on its own,
+                # and must not find the spool or session closed under it
+                logger.warning("Uploader still busy at shutdown; leaving the spool for it to finish")
+                return
+        self.session.close()
+        self.spool.close()
+
+    def send_sighting(self, payload, priority=False):
+        """
+        Queue a sighting for upload. Never blocks on the network.
+        :param priority: Upload ahead of any backlog (hotlist hits).
+        """
+        self.spool.put(payload, priority)
+        self._wakeup.set()
+        return True
+
+    def _upload_loop(self):
+        if self.transport == 'async':
+            self._loop = asyncio.new_event_loop()
+            self._async_client = httpx.AsyncClient(
+                headers=self.headers,
+                limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            )
+
         try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=5)
-            if response.status_code == 201:
-                logger.info(f"Successfully sent sighting: {payload['plateNumber']}")
-                return True
-            else:
-                logger.error(f"Failed to send sighting. Status: {response.status_code}, Response: {response.text}")
-                return False
+            while not self._stop_event.is_set():
+                try:
+                    failed = self._upload_pending()
+                except Exception:
+                    # Never let the thread die: sightings would keep spooling with nothing uploading them
+                    logger.exception("Upload failed unexpectedly")
+                    failed = True
+
+                if failed:
+                    # Back off exponentially (with jitter) while the uplink is down
+                    self._failures += 1
+                    delay = min(self.max_backoff, self.min_backoff * (2 ** (self._failures - 1)))
+                    delay *= random.uniform(0.5, 1.0)
+                    logger.warning(f"Retrying upload in {delay:.1f}s")
+                    self._stop_event.wait(delay)
+                elif failed is not None:
+                    self._failures = 0
+        finally:
+            if self._async_client is not None:
+                self._loop.run_until_complete(self._async_client.aclose())
+                self._loop.close()
+
+    def _upload_pending(self):
+        """
+        Upload the next spooled sightings, or wait for new ones if the spool is empty.
+        :return: True if a transient failure occurred, False if uploaded, None if there was nothing to send.
+        """
+        # Sync transport sends one batch at a time; async sends up to `concurrency` batches in parallel
+        chunk_count = self.concurrency if self.transport == 'async' else 1
+        pending = self.spool.peek(self.batch_size * chunk_count)
+        if not pending:
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            return None
+
+        chunks = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        if self.transport == 'async':
+            results = self._loop.run_until_complete(self._upload_batches_async(chunks))
+        else:
+            results = [self._upload_batch(chunk) for chunk in chunks]
+
+        self.spool.delete([row_id for done, _ in results for row_id in done])
+        failed = any(failed for _, failed in results)
+        if failed:
+            logger.warning(f"Upload failed, {self.spool.count()} sightings spooled")
+        return failed
+
+    def _upload_batch(self, batch):
+        """
+        Upload spooled sightings with a single bulk request.
+        Falls back to one request per sighting (in order, stopping at the first transient failure)
+        when the bulk request is rejected, so one bad payload cannot block the rest of the spool.
+        :return: (ids to remove from the spool, True if a transient failure occurred)
+        """
+        result = self._post_batch([payload for _, payload in batch])
+        if result is True:
+            return [row_id for row_id, _ in batch], False
+        if result is None:
+            return [], True
+
+        done = []
+        for row_id, payload in batch:
+            result = self._post_sighting(payload)
+            if result is None:
+                return done, True
+            # Delivered, or permanently rejected (retrying would never succeed)
+            done.append(row_id)
+        return done, False
+
+    async def _upload_batches_async(self, chunks):
+        return await asyncio.gather(*[self._upload_batch_async(chunk) for chunk in chunks])
+
+    async def _upload_batch_async(self, batch):
+        """
+        Same as _upload_batch, over the asyncio transport.
+        """
+        result = await self._post_batch_async([payload for _, payload in batch])
+        if result is True:
+            return [row_id for row_id, _ in batch], False
+        if result is None:
+            return [], True
+
+        done = []
+        for row_id, payload in batch:
+            result = await self._post_sighting_async(payload)
+            if result is None:
+                return done, True
+            done.append(row_id)
+        return done, False
+
+    def _post_batch(self, payloads):
+        """
+        :return: True if accepted, False if the batch was rejected, None on a transient failure.
+        """
+        try:
+            response = self.session.post(f"{self.api_url}/sightings/batch", json=payloads, timeout=30)
+        except Exception as e:
+            logger.error(f"Error sending batch: {str(e)}")
+            return None
+        return self._batch_result(response, payloads)
+
+    async def _post_batch_async(self, payloads):
+        try:
+            response = await self._async_client.post(f"{self.api_url}/sightings/batch", json=payloads, timeout=30)
+        except Exception as e:
+            logger.error(f"Error sending batch: {str(e)}")
+            return None
+        return self._batch_result(response, payloads)
+
+    def _batch_result(self, response, payloads):
+        if response.status_code == 201:
+            logger.info(f"Successfully sent {len(payloads)} sightings")
+            return True
+        elif response.status_code in BATCH_REJECTED_CODES:
+            logger.warning(f"Batch upload rejected (Status: {response.status_code}), sending individually")
+            return False
+        else:
+            logger.error(f"Failed to send batch. Status: {response.status_code}, Response: {response.text}")
+            return None
+
+    def _post_sighting(self, payload):
+        """
+        :return: True if accepted, False if permanently rejected, None on a transient failure.
+        """
+        try:
+            response = self.session.post(f"{self.api_url}/sightings/", json=payload, timeout=5)
         except Exception as e:
             logger.error(f"Error sending sighting: {str(e)}")
+            return None
+        return self._sighting_result(response, payload)
+
+    async def _post_sighting_async(self, payload):
+        try:
+            response = await self._async_client.post(f"{self.api_url}/sightings/", json=payload, timeout=5)
+        except Exception as e:
+            logger.error(f"Error sending sighting: {str(e)}")
+            return None
+        return self._sighting_result(response, payload)
+
+    def _sighting_result(self, response, payload):
+        if response.status_code == 201:
+            logger.info(f"Successfully sent sighting: {payload['plateNumber']}")
+            return True
+        elif response.status_code in PERMANENT_FAILURE_CODES:
+            logger.error(f"Sighting rejected, dropping it. Status: {response.status_code}, Response: {response.text}")
             return False
+        else:
+            logger.error(f"Failed to send sighting. Status: {response.status_code}, Response: {response.text}")
+            return None
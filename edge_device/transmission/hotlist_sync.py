@@ -0,0 +1,125 @@
+import os
+import re
+import json
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+def normalize_plate(plate_number):
+    """
+    Canonical form used for hotlist matching (same rule as the backend): no spaces/dashes, upper case.
+    """
+    return re.sub(r"[\s\-]+", "", plate_number or "").upper()
+
+class HotlistSync:
+    def __init__(self, session, api_url, cache_path, sync_interval=30.0):
+        """
+        Local copy of the backend hotlist, kept current by polling for deltas.
+        Lets the device flag hotlisted plates the moment they are finalized, even while offline.
+        :param session: requests.Session to reuse (carries the API key header).
+        :param api_url: Backend API base URL.
+        :param cache_path: JSON file the hotlist is persisted to, so a restart while offline still matches.
+        :param sync_interval: Seconds between delta syncs.
+        """
+        self.session = session
+        self.api_url = api_url
+        self.cache_path = cache_path
+        self.sync_interval = sync_interval
+
+        self.version = 0
+        self._entries = {}
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+            self._entries = data.get('entries', {})
+            self.version = data.get('version', 0)
+            logger.info(f"Loaded {len(self._entries)} hotlist entries (version {self.version}) from {self.cache_path}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable hotlist cache {self.cache_path}: {str(e)}")
+
+    def _save(self):
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': self.version, 'entries': self._entries}, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._sync_loop, name="hotlist-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _sync_loop(self):
+        while not self._stop_event.is_set():
+            try:
+                self.sync()
+            except Exception:
+                # Never let the thread die: the device would silently keep a stale hotlist
+                logger.exception("Hotlist sync failed")
+            self._stop_event.wait(self.sync_interval)
+
+    def sync(self):
+        """
+        Fetch and apply changes since the local version.
+        :return: True if the local copy is up to date.
+        """
+        try:
+            response = self.session.get(f"{self.api_url}/hotlists/changes", params={"since": self.version}, timeout=10)
+        except Exception as e:
+            logger.warning(f"Hotlist sync failed: {str(e)}")
+            return False
+        if response.status_code != 200:
+            logger.warning(f"Hotlist sync failed. Status: {response.status_code}, Response: {response.text}")
+            return False
+
+        # Readers only ever see a complete dict: build the new one, then swap it in.
+        # A malformed response leaves the current copy untouched.
+        try:
+            data = response.json()
+            if data['version'] == self.version and not data['changes']:
+                return True
+
+            entries = {} if data['full'] else dict(self._entries)
+            for change in data['changes']:
+                key = normalize_plate(change['plate_number'])
+                if change.get('deleted'):
+                    entries.pop(key, None)
+                else:
+                    entries[key] = change.get('category')
+            version = int(data['version'])
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Hotlist sync failed: malformed response ({type(e).__name__}: {str(e)})")
+            return False
+        self._entries = entries
+        self.version = version
+
+        logger.info(f"Hotlist synced to version {self.version} ({len(entries)} entries, {'full' if data['full'] else 'delta'})")
+        try:
+            self._save()
+        except OSError as e:
+            logger.warning(f"Could not persist hotlist cache: {str(e)}")
+        return True
+
+    def match(self, plate_number):
+        """
+        :return: (is_hot, category) for a plate.
+        """
+        entries = self._entries
+        key = normalize_plate(plate_number)
+        if key in entries:
+            return True, entries[key]
+        return False, None
@@ -0,0 +1,78 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+class SightingSpool:
+    def __init__(self, path):
+        """
+        Durable FIFO of sightings waiting to be uploaded, backed by SQLite.
+        Priority entries (hotlist hits) are served ahead of regular ones.
+        Entries survive process restarts and are only removed once acknowledged.
+        :param path: SQLite database file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS spool ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " payload TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " priority INTEGER NOT NULL DEFAULT 0)"
+        )
+        # Spools created before priorities existed
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(spool)")]
+        if "priority" not in columns:
+            self._conn.execute("ALTER TABLE spool ADD COLUMN priority INTEGER NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_spool_priority ON spool (priority DESC, id)")
+
+    def put(self, payload, priority=False):
+        """
+        Append a sighting payload (dict).
+        :param priority: Upload ahead of all non-priority entries.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO spool (payload, created_at, priority) VALUES (?, ?, ?)",
+                (json.dumps(payload), time.time(), int(priority))
+            )
+
+    def peek(self, limit):
+        """
+        Next entries to upload (priority first, then oldest) without removing them.
+        :return: List of (id, payload) tuples.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, payload FROM spool ORDER BY priority DESC, id LIMIT ?", (limit,)
+            ).fetchall()
+        return [(row_id, json.loads(payload)) for row_id, payload in rows]
+
+    def delete(self, ids):
+        """
+        Remove acknowledged entries.
+        """
+        if not ids:
+            return
+        with self._lock:
+            placeholders = ",".join("?" * len(ids))
+            self._conn.execute(f"DELETE FROM spool WHERE id IN ({placeholders})", list(ids))
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM spool").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,6 +1,7 @@
 import React from 'react';
-import { useQuery } from '@tanstack/react-query';
+import { useQuery, useQueryClient } from '@tanstack/react-query';
 import { getSightings } from '../../services/api';
+import { useSightingStream, insertSighting, STREAM_FALLBACK_REFETCH_MS } from '../../hooks/useSightingStream';
 import type { Sighting } from '../../types/sighting';
 
 export interface Alert {
@@ -27,15 +28,30 @@ const AlertFeed: React.FC = () => {
     const [endDate, setEndDate] = React.useState('');
     const [locationId, setLocationId] = React.useState('');
 
-    // Fetch sightings every 2 seconds
+    const queryClient = useQueryClient();
+    const queryKey = ['sightings', 'feed', startDate, endDate, locationId];
+
+    // Fetch once, then keep current from the live stream
     const { data: sightings } = useQuery({
-        queryKey: ['sightings', 'feed', startDate, endDate, locationId],
+        queryKey,
         queryFn: () => getSightings({
             startDate: startDate || undefined,
             endDate: endDate || undefined,
             locationId: locationId || undefined
         }),
-        refetchInterval: 2000,
+        refetchInterval: STREAM_FALLBACK_REFETCH_MS,
+    });
+
+    useSightingStream({ locationId: locationId || undefined }, {
+        onSighting: (sighting) => {
+            if (startDate || endDate) {
+                // Date-bounded view: let the backend decide whether the sighting belongs
+                queryClient.invalidateQueries({ queryKey });
+            } else {
+                queryClient.setQueryData<Sighting[]>(queryKey, (old) => old && insertSighting(old, sighting));
+            }
+        },
+        onReset: () => queryClient.invalidateQueries({ queryKey }),
     });
 
     console.log('AlertFeed Debug:', { sightings });
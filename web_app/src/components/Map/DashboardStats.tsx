@@ -1,9 +1,10 @@
 import React from 'react';
-import { useQuery } from '@tanstack/react-query';
+import { useQuery, useQueryClient } from '@tanstack/react-query';
 import { Paper, Typography, Box, Skeleton } from '@mui/material';
 import DirectionsCarIcon from '@mui/icons-material/DirectionsCar';
 import WarningIcon from '@mui/icons-material/Warning';
-import { getSightingStats } from '../../services/api';
+import { getSightingStats, type SightingStats } from '../../services/api';
+import { useSightingStream, STREAM_FALLBACK_REFETCH_MS } from '../../hooks/useSightingStream';
 import { getCategoryStyle, HOTLIST_CATEGORIES } from '../../utils/hotlistColors';
 
 interface StatCardProps {
@@ -36,10 +37,30 @@ const StatCard: React.FC<StatCardProps> = ({ title, value, icon, color }) => (
 );
 
 const DashboardStats: React.FC = () => {
+    const queryClient = useQueryClient();
     const { data: stats, isLoading } = useQuery({
         queryKey: ['sightingStats'],
         queryFn: getSightingStats,
-        refetchInterval: 10000, // Refresh every 10s
+        refetchInterval: STREAM_FALLBACK_REFETCH_MS,
+    });
+
+    // All-time totals: each streamed sighting is simply counted in
+    useSightingStream({}, {
+        onSighting: (sighting) => {
+            queryClient.setQueryData<SightingStats>(['sightingStats'], (old) => {
+                if (!old) return old;
+                const category = sighting.hotlist_category;
+                return {
+                    ...old,
+                    total_sightings: old.total_sightings + 1,
+                    total_alerts: old.total_alerts + (sighting.is_hot ? 1 : 0),
+                    alerts_by_category: sighting.is_hot && category
+                        ? { ...old.alerts_by_category, [category]: (old.alerts_by_category[category] || 0) + 1 }
+                        : old.alerts_by_category,
+                };
+            });
+        },
+        onReset: () => queryClient.invalidateQueries({ queryKey: ['sightingStats'] }),
     });
 
     if (isLoading || !stats) {
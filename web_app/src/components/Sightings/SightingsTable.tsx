@@ -1,7 +1,7 @@
 import React from 'react';
 import {
     Table, TableBody, TableCell, TableContainer, TableHead, TableRow, Paper,
-    Typography, Chip
+    Typography, Chip, Box, Button
 } from '@mui/material';
 import { format } from 'date-fns';
 import { getCategoryStyle } from '../../utils/hotlistColors';
@@ -9,9 +9,13 @@ import type { Sighting } from '../../types/sighting';
 
 interface SightingsTableProps {
     sightings: Sighting[];
+    // Zero-based page number, shown when paging handlers are given
+    page?: number;
+    onPreviousPage?: () => void;
+    onNextPage?: () => void;
 }
 
-export const SightingsTable: React.FC<SightingsTableProps> = ({ sightings }) => {
+export const SightingsTable: React.FC<SightingsTableProps> = ({ sightings, page = 0, onPreviousPage, onNextPage }) => {
     return (
         <TableContainer component={Paper}>
             <Table>
@@ -87,6 +91,19 @@ export const SightingsTable: React.FC<SightingsTableProps> = ({ sightings }) =>
                     )}
                 </TableBody>
             </Table>
+            {(onPreviousPage || onNextPage) && (
+                <Box sx={{ display: 'flex', justifyContent: 'flex-end', alignItems: 'center', gap: 2, p: 1 }}>
+                    <Typography variant="body2" color="textSecondary">
+                        Page {page + 1}
+                    </Typography>
+                    <Button size="small" onClick={onPreviousPage} disabled={!onPreviousPage}>
+                        Previous
+                    </Button>
+                    <Button size="small" onClick={onNextPage} disabled={!onNextPage}>
+                        Next
+                    </Button>
+                </Box>
+            )}
         </TableContainer>
     );
 };
@@ -1,6 +1,6 @@
 import { useState } from 'react';
-import { useQuery } from '@tanstack/react-query';
-import { getSightings } from '../services/api';
+import { useQuery, keepPreviousData } from '@tanstack/react-query';
+import { getSightingsPage } from '../services/api';
 import { Typography, Box } from '@mui/material';
 import DashboardStats from './Map/DashboardStats';
 import { SightingsFilter } from './Sightings/SightingsFilter';
@@ -8,6 +8,8 @@ import { SightingsTable } from './Sightings/SightingsTable';
 import { SightingsTableSkeleton } from './Sightings/SightingsTableSkeleton';
 import { useDebounce } from '../hooks/useDebounce';
 
+const PAGE_SIZE = 100;
+
 export const SightingsList: React.FC = () => {
     const [plateSearch, setPlateSearch] = useState('');
     const [locationId, setLocationId] = useState('');
@@ -17,17 +19,34 @@ export const SightingsList: React.FC = () => {
 
     const debouncedPlateSearch = useDebounce(plateSearch, 500);
 
-    const { data: sightings, isLoading, error } = useQuery({
-        queryKey: ['sightings', debouncedPlateSearch, locationId, startDate, endDate, alertType],
-        queryFn: () => getSightings({
+    // Cursors of the pages visited so far (the first page has none), for the current filters only.
+    // Each page is fetched by cursor, so deep pages cost the same as the first.
+    const filtersKey = [debouncedPlateSearch, locationId, startDate, endDate, alertType].join('|');
+    const [paging, setPaging] = useState<{ filtersKey: string; cursors: (string | undefined)[] }>({
+        filtersKey,
+        cursors: [undefined],
+    });
+    const cursors = paging.filtersKey === filtersKey ? paging.cursors : [undefined];
+    const setCursors = (next: (string | undefined)[]) => setPaging({ filtersKey, cursors: next });
+    const page = cursors.length - 1;
+
+    const { data, isLoading, error } = useQuery({
+        queryKey: ['sightings', debouncedPlateSearch, locationId, startDate, endDate, alertType, cursors[page]],
+        queryFn: () => getSightingsPage({
             plateNumber: debouncedPlateSearch || undefined,
             locationId: locationId || undefined,
             startDate: startDate || undefined,
             endDate: endDate || undefined,
-            hotlistCategory: alertType !== 'All' ? alertType : undefined
+            hotlistCategory: alertType !== 'All' ? alertType : undefined,
+            cursor: cursors[page],
+            limit: PAGE_SIZE,
         }),
-        refetchInterval: 5000,
+        // Only the live first page needs refreshing
+        refetchInterval: page === 0 ? 5000 : false,
+        placeholderData: keepPreviousData,
     });
+    const sightings = data?.sightings;
+    const nextCursor = data?.nextCursor;
 
     if (error) {
         return (
@@ -57,7 +76,12 @@ export const SightingsList: React.FC = () => {
             {isLoading && !sightings ? (
                 <SightingsTableSkeleton />
             ) : (
-                <SightingsTable sightings={sightings || []} />
+                <SightingsTable
+                    sightings={sightings || []}
+                    page={page}
+                    onPreviousPage={page > 0 ? () => setCursors(cursors.slice(0, -1)) : undefined}
+                    onNextPage={nextCursor ? () => setCursors([...cursors, nextCursor]) : undefined}
+                />
             )}
         </Box>
     );
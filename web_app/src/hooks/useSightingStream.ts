@@ -0,0 +1,93 @@
+import { useEffect, useRef } from 'react';
+import type { Sighting } from '../types/sighting';
+import { getSightingStreamUrl, type SightingStreamParams } from '../services/api';
+
+interface SightingStreamHandlers {
+    // A sighting was ingested
+    onSighting: (sighting: Sighting) => void;
+    // Events may have been missed (reconnect, or the server dropped them): refetch
+    onReset?: () => void;
+}
+
+/**
+ * The stream only carries sightings ingested by the API worker the browser is connected to.
+ * Views fed by it still refetch this often, to pick up sightings ingested by other workers.
+ */
+export const STREAM_FALLBACK_REFETCH_MS = 60_000;
+
+// One EventSource per tab, shared by every subscribed component (browsers allow only a few
+// concurrent HTTP/1.1 connections per host, and each stream holds one open indefinitely).
+// Filters are applied here rather than by the server so all subscribers can share it.
+interface Subscriber {
+    hotOnly?: boolean;
+    locationId?: string;
+    handlers: { current: SightingStreamHandlers };
+}
+
+const subscribers = new Set<Subscriber>();
+let sharedSource: EventSource | null = null;
+
+function openSharedSource(): EventSource {
+    const source = new EventSource(getSightingStreamUrl());
+    let disconnected = false;
+
+    source.addEventListener('sighting', (event) => {
+        const sighting: Sighting = JSON.parse((event as MessageEvent).data);
+        subscribers.forEach(({ hotOnly, locationId, handlers }) => {
+            if (hotOnly && !sighting.is_hot) return;
+            if (locationId && sighting.location_id !== locationId) return;
+            handlers.current.onSighting(sighting);
+        });
+    });
+    const reset = () => subscribers.forEach(({ handlers }) => handlers.current.onReset?.());
+    source.addEventListener('reset', reset);
+    source.onerror = () => {
+        // EventSource reconnects by itself; whatever happened meanwhile is lost
+        disconnected = true;
+    };
+    source.onopen = () => {
+        if (disconnected) {
+            disconnected = false;
+            reset();
+        }
+    };
+    return source;
+}
+
+/**
+ * Subscribe to the backend's live sightings feed for as long as the component is mounted.
+ * Replaces polling: data only moves when a sighting is actually ingested.
+ */
+export function useSightingStream({ hotOnly, locationId }: SightingStreamParams, handlers: SightingStreamHandlers): void {
+    // Latest handlers without resubscribing on every render
+    const handlersRef = useRef(handlers);
+    useEffect(() => {
+        handlersRef.current = handlers;
+    });
+
+    useEffect(() => {
+        const subscriber: Subscriber = { hotOnly, locationId, handlers: handlersRef };
+        subscribers.add(subscriber);
+        if (!sharedSource) sharedSource = openSharedSource();
+
+        return () => {
+            subscribers.delete(subscriber);
+            if (subscribers.size === 0 && sharedSource) {
+                sharedSource.close();
+                sharedSource = null;
+            }
+        };
+    }, [hotOnly, locationId]);
+}
+
+/**
+ * Insert a streamed sighting into a newest-first list (late arrivals land in timestamp order),
+ * keeping at most `limit` entries, like the first page of GET /sightings/.
+ */
+export function insertSighting(sightings: Sighting[], sighting: Sighting, limit: number = 100): Sighting[] {
+    if (sightings.some(s => s.id === sighting.id)) return sightings;
+    const time = new Date(sighting.timestamp).getTime();
+    const index = sightings.findIndex(s => new Date(s.timestamp).getTime() <= time);
+    const next = index === -1 ? [...sightings, sighting] : [...sightings.slice(0, index), sighting, ...sightings.slice(index)];
+    return next.slice(0, limit);
+}
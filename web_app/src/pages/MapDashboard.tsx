@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { useQuery } from '@tanstack/react-query';
+import { useQuery, useQueryClient } from '@tanstack/react-query';
 import { Typography, Box, Paper, Grid, TextField, FormControlLabel, Switch, FormGroup } from '@mui/material';
 import CityMap from '../components/Map/CityMap';
 import { ENTRANCES } from '../components/Map/constants';
@@ -7,6 +7,11 @@ import RecentAlerts from '../components/Map/RecentAlerts';
 import DashboardStats from '../components/Map/DashboardStats';
 import type { Sighting } from '../types/sighting';
 import { getSightings } from '../services/api';
+import { useSightingStream, insertSighting, STREAM_FALLBACK_REFETCH_MS } from '../hooks/useSightingStream';
+
+// Same rule as the backend's plate search: no spaces/dashes, case-insensitive
+const normalizePlate = (plate: string) => plate.replace(/[\s-]+/g, '').toUpperCase();
+
 const MapDashboard: React.FC = () => {
     const [selectedSighting, setSelectedSighting] = useState<Sighting | null>(null);
     const [plateFilter, setPlateFilter] = useState('');
@@ -25,7 +30,22 @@ const MapDashboard: React.FC = () => {
             // Filter for sightings that have a known location ID (for the map at least)
             return data.filter(s => ENTRANCES[s.location_id]);
         },
-        refetchInterval: 5000,
+        refetchInterval: STREAM_FALLBACK_REFETCH_MS,
+    });
+
+    // Apply live sightings locally when they match the current filters (no refetch)
+    const queryClient = useQueryClient();
+    useSightingStream({ hotOnly: categoryFilter !== 'All' }, {
+        onSighting: (sighting) => {
+            if (!ENTRANCES[sighting.location_id]) return;
+            if (plateFilter && !normalizePlate(sighting.plate_number).includes(normalizePlate(plateFilter))) return;
+            if (categoryFilter !== 'All' && categoryFilter !== 'All Alerts' && sighting.hotlist_category !== categoryFilter) return;
+            queryClient.setQueryData<Sighting[]>(
+                ['mapSightings', plateFilter, categoryFilter],
+                (old) => old && insertSighting(old, sighting),
+            );
+        },
+        onReset: () => queryClient.invalidateQueries({ queryKey: ['mapSightings'] }),
     });
 
     const handleSelectSighting = (sighting: Sighting) => {
@@ -35,6 +35,30 @@ export const getSightings = async (params?: {
     return response.data;
 };
 
+export interface SightingsPage {
+    sightings: Sighting[];
+    // Cursor of the following page, undefined on the last page
+    nextCursor?: string;
+}
+
+export const getSightingsPage = async (params: {
+    plateNumber?: string;
+    locationId?: string;
+    startDate?: string;
+    endDate?: string;
+    hotlistCategory?: string;
+    cursor?: string;
+    limit?: number;
+}): Promise<SightingsPage> => {
+    const response = await api.get<Sighting[]>('/sightings/', {
+        params,
+    });
+    return {
+        sightings: response.data,
+        nextCursor: response.headers['x-next-cursor'] || undefined,
+    };
+};
+
 export interface SightingStats {
     total_sightings: number;
     total_alerts: number;
@@ -92,3 +116,17 @@ export const getODMatrix = async (startDate?: string, endDate?: string): Promise
     });
     return response.data;
 };
+
+export interface SightingStreamParams {
+    hotOnly?: boolean;
+    locationId?: string;
+}
+
+// Server-Sent Events URL of the live sightings feed (EventSource cannot send headers; the feed is read-only)
+export const getSightingStreamUrl = (params: SightingStreamParams = {}): string => {
+    const query = new URLSearchParams();
+    if (params.hotOnly) query.set('hotOnly', 'true');
+    if (params.locationId) query.set('locationId', params.locationId);
+    const suffix = query.toString();
+    return `${API_URL}/stream/sightings${suffix ? `?${suffix}` : ''}`;
+};